@@ -3,7 +3,11 @@ from __future__ import annotations
 from pathlib import Path
 
 from netloom.core.config import Settings, load_settings
-from netloom.core.pagination import fetch_all_list_results
+from netloom.core.pagination import (
+    fetch_all_list_results,
+    iter_list_pages,
+    resolve_page_workers,
+)
 from netloom.core.resolver import (
     normalize_file_payload_for_action,
     output_settings,
@@ -14,6 +18,8 @@ from netloom.core.resolver import (
 from netloom.core.resolver import resolve_out_path as _resolve_out_path
 from netloom.io.output import log_to_file, should_mask_secrets
 
+STREAMED_LIST_FORMATS = {"ndjson", "csv"}
+
 
 def _settings_or_default(settings: Settings | None) -> Settings:
     return settings or load_settings()
@@ -113,13 +119,49 @@ def delete_handler(cp, token, api_catalog, args, settings: Settings | None = Non
     )
 
 
+def _stream_list_results(cp, token, api_catalog, args, settings: Settings) -> bool:
+    action_def = cp.get_action_definition(
+        api_catalog, args["module"], args["service"], "list"
+    )
+    console, data_format, out_path, csv_fieldnames = output_settings(
+        args, settings, action_def=action_def
+    )
+    # JSON keeps the merged list envelope; line and row formats stream per page.
+    if data_format not in STREAMED_LIST_FORMATS:
+        return False
+    log_to_file(
+        iter_list_pages(
+            cp,
+            token,
+            api_catalog,
+            args,
+            max_workers=resolve_page_workers(args, settings),
+        ),
+        filename=out_path,
+        data_format=data_format,
+        csv_fieldnames=csv_fieldnames,
+        also_console=console,
+        mask_secrets=should_mask_secrets(args, settings),
+        stream=True,
+    )
+    return True
+
+
 def get_handler(cp, token, api_catalog, args, settings: Settings | None = None):
     active_settings = settings or load_settings()
     mask_secrets = should_mask_secrets(args, active_settings)
 
     if args.get("all"):
         action_name = "list"
-        result = fetch_all_list_results(cp, token, api_catalog, args)
+        if _stream_list_results(cp, token, api_catalog, args, active_settings):
+            return None
+        result = fetch_all_list_results(
+            cp,
+            token,
+            api_catalog,
+            args,
+            max_workers=resolve_page_workers(args, active_settings),
+        )
     else:
         action_name = "get"
         params = query_params_for_action(cp, api_catalog, args, "get")
@@ -16,7 +16,7 @@ def completion_candidates(words: list[str], catalog: dict | None) -> list[str]:
     positionals = [word for word in words if not word.startswith("-")]
 
     if len(positionals) == 0:
-        return ["cache", "copy", "load", "server", *sorted(modules.keys())]
+        return ["cache", "copy", "daemon", "load", "server", *sorted(modules.keys())]
 
     module = positionals[0]
     if module == "cache":
@@ -34,6 +34,11 @@ def completion_candidates(words: list[str], catalog: dict | None) -> list[str]:
             return sorted(((modules.get(copy_module) or {}).keys()))
         return []
 
+    if module == "daemon":
+        if len(positionals) == 1:
+            return ["start", "status", "stop"]
+        return []
+
     if module == "load":
         if len(positionals) == 1:
             return ["list", "show", *list_plugins()]
@@ -50,7 +55,7 @@ def completion_candidates(words: list[str], catalog: dict | None) -> list[str]:
         return ["list", "show", "use"]
 
     if module not in modules:
-        return ["cache", "copy", "load", "server", *sorted(modules.keys())]
+        return ["cache", "copy", "daemon", "load", "server", *sorted(modules.keys())]
 
     services = modules[module]
     if len(positionals) == 1 or (len(positionals) == 2 and current != ""):
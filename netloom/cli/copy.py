@@ -1,18 +1,36 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 import requests
 
-from netloom.core.config import Settings, list_profiles, load_settings_for_profile
-from netloom.core.pagination import fetch_all_list_results
+from netloom.core.config import (
+    DEFAULT_POOL_SIZE,
+    SECRET_FIELDS,
+    Settings,
+    list_profiles,
+    load_settings_for_profile,
+)
+from netloom.core.pagination import (
+    fetch_list_items_async,
+    iter_list_items,
+    resolve_page_workers,
+)
 from netloom.core.resolver import _timestamp_token, query_params_for_action
 from netloom.io.output import sanitize_secrets, should_mask_secrets, write_value_to_file
 
+log = logging.getLogger(__name__)
+
 VALID_CONFLICT_MODES = {"fail", "skip", "update", "replace"}
 VALID_MATCH_MODES = {"auto", "name", "id"}
+DEFAULT_SERVICE_WORKERS = 4
 
 
 def _copy_item_label(item: dict[str, Any]) -> str:
@@ -40,10 +58,13 @@ def _default_artifact_path(
     artifact: str,
     *,
     timestamp: str | None = None,
+    extension: str = "json",
 ) -> str:
     stem = _artifact_stem(module, service, source_profile, target_profile)
     token = timestamp or _timestamp_token()
-    return str(Path(settings.paths.response_dir) / f"{stem}_{token}_{artifact}.json")
+    return str(
+        Path(settings.paths.response_dir) / f"{stem}_{token}_{artifact}.{extension}"
+    )
 
 
 def _extract_items(value: Any) -> list[dict[str, Any]]:
@@ -102,7 +123,15 @@ def _load_catalog(
 
 
 def _fetch_source_items(
-    cp, token: str, api_catalog: dict, module: str, service: str, args: dict[str, Any]
+    cp,
+    token: str,
+    api_catalog: dict,
+    module: str,
+    service: str,
+    args: dict[str, Any],
+    *,
+    page_workers: int = 1,
+    async_client=None,
 ) -> list[dict[str, Any]]:
     if args.get("id") not in (None, "") or args.get("name") not in (None, ""):
         get_args = _service_args(
@@ -126,8 +155,22 @@ def _fetch_source_items(
         sort=args.get("sort"),
         calculate_count=args.get("calculate_count"),
     )
-    result = fetch_all_list_results(cp, token, api_catalog, list_args)
-    return _extract_items(result)
+    if async_client is not None:
+        listed = asyncio.run(
+            _list_items_async(async_client, token, api_catalog, list_args)
+        )
+    else:
+        listed = iter_list_items(
+            cp, token, api_catalog, list_args, max_workers=page_workers
+        )
+    return [item for item in listed if isinstance(item, dict)]
+
+
+async def _list_items_async(
+    open_client, token: str, api_catalog: dict, list_args: dict[str, Any]
+) -> list[Any]:
+    async with open_client() as cp:
+        return await fetch_list_items_async(cp, token, api_catalog, list_args)
 
 
 def _fetch_target_by_name(
@@ -206,6 +249,67 @@ def _resolve_match(
     return None, None
 
 
+def _build_target_index(
+    cp,
+    token: str,
+    api_catalog: dict,
+    module: str,
+    service: str,
+    *,
+    page_workers: int = 1,
+) -> dict[str, dict[str, dict[str, Any]]] | None:
+    if not _has_action(api_catalog, module, service, "list"):
+        return None
+
+    by_name: dict[str, dict[str, Any]] = {}
+    by_id: dict[str, dict[str, Any]] = {}
+    list_args = _service_args(module, service, "list")
+    for item in iter_list_items(
+        cp, token, api_catalog, list_args, max_workers=page_workers
+    ):
+        if not isinstance(item, dict):
+            continue
+        if item.get("name") not in (None, ""):
+            by_name.setdefault(str(item["name"]), item)
+        if item.get("id") not in (None, ""):
+            by_id.setdefault(str(item["id"]), item)
+    return {"name": by_name, "id": by_id}
+
+
+def _resolve_indexed_match(
+    target_index: dict[str, dict[str, dict[str, Any]]],
+    item: dict[str, Any],
+    match_mode: str,
+) -> tuple[dict[str, Any] | None, str | None]:
+    if match_mode in {"auto", "name"} and item.get("name") not in (None, ""):
+        match = target_index["name"].get(str(item["name"]))
+        if match is not None or match_mode == "name":
+            return match, "name"
+
+    if match_mode in {"auto", "id"} and item.get("id") not in (None, ""):
+        match = target_index["id"].get(str(item["id"]))
+        if match is not None or match_mode == "id":
+            return match, "id"
+
+    return None, None
+
+
+def _transport_stats(**clients) -> dict[str, dict[str, float]]:
+    stats: dict[str, dict[str, float]] = {}
+    for side, cp in clients.items():
+        read_stats = getattr(cp, "transport_stats", None)
+        if read_stats is not None:
+            stats[side] = read_stats()
+    return stats
+
+
+def _require_known_profiles(*names: str) -> None:
+    profiles = set(list_profiles())
+    missing = [name for name in names if name not in profiles]
+    if missing:
+        raise ValueError(f"Unknown profile(s): {', '.join(sorted(missing))}")
+
+
 def _validate_compare_args(
     args: dict[str, Any],
     *,
@@ -229,14 +333,7 @@ def _validate_compare_args(
     if source_profile == target_profile:
         raise ValueError("--from and --to must be different profiles")
 
-    profiles = set(list_profiles())
-    missing = [
-        profile
-        for profile in (str(source_profile), str(target_profile))
-        if profile not in profiles
-    ]
-    if missing:
-        raise ValueError(f"Unknown profile(s): {', '.join(sorted(missing))}")
+    _require_known_profiles(str(source_profile), str(target_profile))
 
     selectors = [
         args.get("id") not in (None, ""),
@@ -277,11 +374,342 @@ def _validate_copy_args(args: dict[str, Any]) -> None:
         raise ValueError("--on-conflict must be one of: fail, skip, update, replace")
 
 
+def _positive_int_arg(args: dict[str, Any], name: str, default: int) -> int:
+    raw = args.get(name)
+    if raw in (None, ""):
+        return default
+    flag = "--" + name.replace("_", "-")
+    try:
+        value = int(raw)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"{flag} must be a positive integer") from exc
+    if value < 1:
+        raise ValueError(f"{flag} must be a positive integer")
+    return value
+
+
+def _resolve_parallel(args: dict[str, Any]) -> int:
+    return _positive_int_arg(args, "parallel", 1)
+
+
+_WRITE_ACTIONS = {"create": "add", "update": "update", "replace": "replace"}
+
+
+def _write_request(
+    module: str, service: str, item: dict[str, Any]
+) -> tuple[str, dict[str, Any]]:
+    action_name = item["action"]
+    request_action = _WRITE_ACTIONS[action_name]
+    return request_action, _service_args(
+        module,
+        service,
+        request_action,
+        id=None if action_name == "create" else item["target_match"]["id"],
+    )
+
+
+def _execute_plan_item(
+    plugin,
+    target_cp,
+    target_token: str,
+    target_catalog: dict,
+    module: str,
+    service: str,
+    item: dict[str, Any],
+    *,
+    mask_secrets: bool,
+) -> dict[str, Any]:
+    action_name = item["action"]
+    try:
+        if item.get("reason"):
+            return {**item, "status": "failed"}
+        if action_name in _WRITE_ACTIONS:
+            request_action, request_args = _write_request(module, service, item)
+            response = getattr(target_cp, request_action)(
+                target_catalog, target_token, request_args, item["payload"]
+            )
+            response = plugin.restore_secret_fields(
+                response, item["payload"], mask_secrets=mask_secrets
+            )
+            return {**item, "status": "success", "response": response}
+        if action_name == "skip":
+            return {**item, "status": "skipped"}
+        return {**item, "status": "failed", "reason": "target object already exists"}
+    except Exception as exc:  # pragma: no cover
+        return {**item, "status": "failed", "reason": str(exc)}
+
+
+def _execute_plan(
+    plan_items: list[dict[str, Any]],
+    execute,
+    *,
+    parallel: int,
+    continue_on_error: bool,
+    on_result=None,
+) -> list[dict[str, Any]]:
+    if parallel <= 1:
+        result_items: list[dict[str, Any]] = []
+        for item in plan_items:
+            result = execute(item)
+            if on_result is not None:
+                on_result(result)
+            result_items.append(result)
+            if result["status"] == "failed" and not continue_on_error:
+                break
+        return result_items
+
+    results: dict[int, dict[str, Any]] = {}
+    pending: dict[Future, int] = {}
+    queued = iter(enumerate(plan_items))
+    stopped = False
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        while True:
+            # Items already in flight finish and are reported; a failure only
+            # stops new submissions.
+            while not stopped and len(pending) < parallel:
+                entry = next(queued, None)
+                if entry is None:
+                    break
+                index, item = entry
+                pending[executor.submit(execute, item)] = index
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                results[index] = future.result()
+                if on_result is not None:
+                    on_result(results[index])
+                if results[index]["status"] == "failed" and not continue_on_error:
+                    stopped = True
+    return [results[index] for index in sorted(results)]
+
+
+async def _execute_plan_item_async(
+    plugin,
+    target_cp,
+    target_token: str,
+    target_catalog: dict,
+    module: str,
+    service: str,
+    item: dict[str, Any],
+    *,
+    mask_secrets: bool,
+) -> dict[str, Any]:
+    if item.get("reason") or item["action"] not in _WRITE_ACTIONS:
+        # Nothing to send; the synchronous path settles these without I/O.
+        return _execute_plan_item(
+            plugin,
+            target_cp,
+            target_token,
+            target_catalog,
+            module,
+            service,
+            item,
+            mask_secrets=mask_secrets,
+        )
+    try:
+        request_action, request_args = _write_request(module, service, item)
+        response = await getattr(target_cp, request_action)(
+            target_catalog, target_token, request_args, item["payload"]
+        )
+        response = plugin.restore_secret_fields(
+            response, item["payload"], mask_secrets=mask_secrets
+        )
+        return {**item, "status": "success", "response": response}
+    except Exception as exc:  # pragma: no cover
+        return {**item, "status": "failed", "reason": str(exc)}
+
+
+async def _execute_plan_async(
+    plan_items: list[dict[str, Any]],
+    execute,
+    open_client,
+    *,
+    parallel: int,
+    continue_on_error: bool,
+    on_result=None,
+) -> list[dict[str, Any]]:
+    results: dict[int, dict[str, Any]] = {}
+    slots = asyncio.Semaphore(parallel)
+    stopped = False
+
+    async with open_client() as cp:
+
+        async def run(index: int, item: dict[str, Any]) -> None:
+            nonlocal stopped
+            async with slots:
+                # As with threads, a failure only stops items not yet started.
+                if stopped:
+                    return
+                result = await execute(cp, item)
+            results[index] = result
+            if on_result is not None:
+                on_result(result)
+            if result["status"] == "failed" and not continue_on_error:
+                stopped = True
+
+        await asyncio.gather(
+            *(run(index, item) for index, item in enumerate(plan_items))
+        )
+    return [results[index] for index in sorted(results)]
+
+
+def _planned_results(plan_items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [
+        {
+            **item,
+            "status": "failed" if item.get("reason") else "planned",
+            "reason": (
+                item.get("reason")
+                or (
+                    None
+                    if item["action"] != "conflict"
+                    else "target object already exists"
+                )
+            ),
+        }
+        for item in plan_items
+    ]
+
+
+def _summarize_results(
+    result_items: list[dict[str, Any]], *, selected: int
+) -> dict[str, int]:
+    return {
+        "selected": selected,
+        "created": sum(
+            1
+            for item in result_items
+            if item["action"] == "create" and item["status"] in {"success", "planned"}
+        ),
+        "updated": sum(
+            1
+            for item in result_items
+            if item["action"] == "update" and item["status"] in {"success", "planned"}
+        ),
+        "replaced": sum(
+            1
+            for item in result_items
+            if item["action"] == "replace" and item["status"] in {"success", "planned"}
+        ),
+        "skipped": sum(
+            1
+            for item in result_items
+            if item["status"] == "skipped"
+            or item["action"] == "skip"
+            and item["status"] == "planned"
+        ),
+        "failed": sum(1 for item in result_items if item["status"] == "failed"),
+    }
+
+
+_JOURNAL_DONE_STATUSES = {"success", "skipped"}
+_JOURNAL_RESUMED_REASON = "already completed in journal"
+
+
+def _journal_key(item: dict[str, Any]) -> str:
+    # Items are keyed by source identity: after a partial run, created objects
+    # match on the target and the rebuilt plan changes their action.
+    return json.dumps(
+        [item.get("source_id"), item.get("source_name")], ensure_ascii=False
+    )
+
+
+def _load_journal_keys(path: str) -> set[str]:
+    try:
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError as exc:
+        raise ValueError(f"Journal file not found: {path}") from exc
+
+    completed: set[str] = set()
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            # A run killed mid-write can leave a truncated last line.
+            continue
+        if isinstance(entry, dict) and entry.get("status") in _JOURNAL_DONE_STATUSES:
+            completed.add(_journal_key(entry))
+    return completed
+
+
+def _journal_entry(result: dict[str, Any]) -> dict[str, Any]:
+    response = result.get("response")
+    target_match = result.get("target_match")
+    target_id = response.get("id") if isinstance(response, dict) else None
+    if target_id is None and isinstance(target_match, dict):
+        target_id = target_match.get("id")
+    return {
+        "source_id": result.get("source_id"),
+        "source_name": result.get("source_name"),
+        "label": result.get("label"),
+        "action": result.get("action"),
+        "status": result.get("status"),
+        "reason": result.get("reason"),
+        "target_id": target_id,
+        "completed_at": _timestamp_token(),
+    }
+
+
+def _run_journaled_plan(
+    plan_items: list[dict[str, Any]],
+    execute,
+    *,
+    journal_path: str,
+    completed_keys: set[str],
+    parallel: int,
+    continue_on_error: bool,
+    async_client=None,
+) -> list[dict[str, Any]]:
+    def run(item: dict[str, Any]) -> dict[str, Any]:
+        if _journal_key(item) in completed_keys:
+            return {**item, "status": "skipped", "reason": _JOURNAL_RESUMED_REASON}
+        return execute(item)
+
+    async def run_async(cp, item: dict[str, Any]) -> dict[str, Any]:
+        if _journal_key(item) in completed_keys:
+            return {**item, "status": "skipped", "reason": _JOURNAL_RESUMED_REASON}
+        return await execute(cp, item)
+
+    Path(journal_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(journal_path, "a", encoding="utf-8") as journal:
+
+        def record(result: dict[str, Any]) -> None:
+            if result.get("reason") == _JOURNAL_RESUMED_REASON:
+                return
+            journal.write(json.dumps(_journal_entry(result), ensure_ascii=False))
+            journal.write("\n")
+            journal.flush()
+
+        if async_client is not None:
+            return asyncio.run(
+                _execute_plan_async(
+                    plan_items,
+                    run_async,
+                    async_client,
+                    parallel=parallel,
+                    continue_on_error=continue_on_error,
+                    on_result=record,
+                )
+            )
+        return _execute_plan(
+            plan_items,
+            run,
+            parallel=parallel,
+            continue_on_error=continue_on_error,
+            on_result=record,
+        )
+
+
 def _emit_summary(report: dict[str, Any]) -> None:
     mode = "Dry run" if report.get("dry_run") else "Copy completed"
     summary = report["summary"]
     print(mode)
-    print(f"Source profile: {report['source_profile']}")
+    if report.get("plan_file"):
+        print(f"Plan: {report['plan_file']}")
+    if report.get("source_profile"):
+        print(f"Source profile: {report['source_profile']}")
     print(f"Target profile: {report['target_profile']}")
     print(f"Service: {report['module']} {report['service']}")
     print(f"Selected: {summary['selected']}")
@@ -309,29 +737,110 @@ def _emit_summary(report: dict[str, Any]) -> None:
             print(f"- payload: {artifacts['payload']}")
         if artifacts.get("plan"):
             print(f"- plan: {artifacts['plan']}")
+        if artifacts.get("journal"):
+            print(f"- journal: {artifacts['journal']}")
         if artifacts.get("report"):
             print(f"- report: {artifacts['report']}")
 
 
-def handle_copy_command(
+def _validate_plan_apply_args(args: dict[str, Any]) -> None:
+    if not args.get("copy_module") or not args.get("copy_service"):
+        raise ValueError(
+            "Usage: netloom <module> <service> copy --from-plan=FILE --to=..."
+        )
+    target_profile = args.get("to")
+    if not target_profile:
+        raise ValueError("--to is required for copy")
+    _require_known_profiles(str(target_profile))
+    if any(
+        args.get(name) not in (None, "", False)
+        for name in ("id", "name", "filter", "all", "limit", "offset", "sort")
+    ):
+        raise ValueError("--from-plan cannot be combined with source selectors")
+
+    match_by = str(args.get("match_by", "auto"))
+    if match_by not in VALID_MATCH_MODES:
+        raise ValueError("--match-by must be one of: auto, name, id")
+
+
+def _load_plan_items(path: str) -> list[dict[str, Any]]:
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError as exc:
+        raise ValueError(f"Plan file not found: {path}") from exc
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Plan file is not valid JSON: {path}") from exc
+    if not isinstance(data, list) or not all(
+        isinstance(item, dict) and isinstance(item.get("action"), str) for item in data
+    ):
+        raise ValueError(f"Plan file does not contain copy plan items: {path}")
+    return data
+
+
+def _masked_secret_fields(value: Any) -> set[str]:
+    if isinstance(value, dict):
+        fields = {
+            key for key, item in value.items() if key in SECRET_FIELDS and item == ""
+        }
+        for item in value.values():
+            fields |= _masked_secret_fields(item)
+        return fields
+    if isinstance(value, list):
+        return set().union(*(_masked_secret_fields(item) for item in value))
+    return set()
+
+
+def _strip_masked_secrets(value: Any) -> Any:
+    # Plans saved without --decrypt carry secrets as empty strings; sending
+    # those would blank the target's secrets.
+    if isinstance(value, dict):
+        return {
+            key: _strip_masked_secrets(item)
+            for key, item in value.items()
+            if not (key in SECRET_FIELDS and item == "")
+        }
+    if isinstance(value, list):
+        return [_strip_masked_secrets(item) for item in value]
+    return value
+
+
+def _revalidate_plan_item(
+    item: dict[str, Any],
+    target_match: dict[str, Any] | None,
+) -> dict[str, Any]:
+    planned = item.get("target_match") or None
+    planned_id = planned.get("id") if isinstance(planned, dict) else None
+    current_id = target_match.get("id") if isinstance(target_match, dict) else None
+    if (planned is None) == (target_match is None) and str(planned_id) == str(
+        current_id
+    ):
+        return item
+    return {
+        **item,
+        "reason": item.get("reason") or "target changed since the plan was saved",
+    }
+
+
+def _apply_saved_plan(
     args: dict[str, Any],
     *,
     settings: Settings | None,
     plugin,
 ) -> dict[str, Any]:
-    _validate_copy_args(args)
+    _validate_plan_apply_args(args)
 
     module = str(args["copy_module"])
     service = str(args["copy_service"])
-    source_profile = str(args["from"])
+    plan_path = str(args["from_plan"])
     target_profile = str(args["to"])
-    on_conflict = str(args.get("on_conflict", "fail"))
     match_by = str(args.get("match_by", "auto"))
     dry_run = bool(args.get("dry_run"))
     continue_on_error = bool(args.get("continue_on_error"))
-    artifact_timestamp = _timestamp_token()
+    parallel = _resolve_parallel(args)
+    plan_items = _load_plan_items(plan_path)
+    resume_path = str(args.get("resume") or "").strip()
+    completed_keys = _load_journal_keys(resume_path) if resume_path else set()
 
-    source_settings = load_settings_for_profile(source_profile)
     target_settings = load_settings_for_profile(target_profile)
     active_settings = settings or target_settings
     mask_secrets = should_mask_secrets(args, active_settings)
@@ -339,16 +848,6 @@ def handle_copy_command(
     if catalog_view not in {"visible", "full"}:
         catalog_view = "visible"
 
-    source_cp = plugin.build_client(source_settings, mask_secrets=mask_secrets)
-    source_token = plugin.resolve_auth_token(source_cp, source_settings)
-    source_catalog = _load_catalog(
-        plugin,
-        source_cp,
-        source_token,
-        source_settings,
-        catalog_view=catalog_view,
-    )
-
     target_cp = plugin.build_client(target_settings, mask_secrets=mask_secrets)
     target_token = plugin.resolve_auth_token(target_cp, target_settings)
     target_catalog = _load_catalog(
@@ -359,18 +858,293 @@ def handle_copy_command(
         catalog_view=catalog_view,
     )
 
+    allow_masked_secrets = bool(args.get("allow_masked_secrets"))
+    prepared: list[dict[str, Any]] = []
+    for item in plan_items:
+        payload = _strip_masked_secrets(item.get("payload"))
+        reason = item.get("reason") or plugin.preflight_error_for_payload(
+            module, service, item["action"], payload
+        )
+        masked = (
+            sorted(_masked_secret_fields(item.get("payload")))
+            if item["action"] in _WRITE_ACTIONS
+            else []
+        )
+        if masked and not reason:
+            # Without the secret a create lacks it and an update leaves the
+            # target's old value in place, so this needs an explicit choice.
+            if not allow_masked_secrets:
+                reason = (
+                    f"plan has masked secrets ({', '.join(masked)}); save it with "
+                    "--decrypt or pass --allow-masked-secrets"
+                )
+            else:
+                log.warning(
+                    "%s: applying without masked secrets (%s)",
+                    item.get("label") or "<unknown>",
+                    ", ".join(masked),
+                )
+        prepared.append({**item, "payload": payload, "reason": reason})
+    plan_items = prepared
+
+    if args.get("revalidate"):
+        target_index = _build_target_index(
+            target_cp,
+            target_token,
+            target_catalog,
+            module,
+            service,
+            page_workers=resolve_page_workers(args, target_settings),
+        )
+        revalidated: list[dict[str, Any]] = []
+        for item in plan_items:
+            source_item = {"name": item.get("source_name"), "id": item.get("source_id")}
+            if target_index is not None:
+                target_match, _ = _resolve_indexed_match(
+                    target_index, source_item, match_by
+                )
+            else:
+                target_match, _ = _resolve_match(
+                    target_cp,
+                    target_token,
+                    target_catalog,
+                    module,
+                    service,
+                    source_item,
+                    match_by,
+                )
+            revalidated.append(_revalidate_plan_item(item, target_match))
+        plan_items = revalidated
+
+    journal_path = None
+    if dry_run:
+        result_items = _planned_results(plan_items)
+    else:
+        journal_path = resume_path or _default_artifact_path(
+            active_settings,
+            module,
+            service,
+            str(args.get("from") or "plan"),
+            target_profile,
+            "journal",
+            extension="ndjson",
+        )
+        result_items = _run_journaled_plan(
+            plan_items,
+            lambda item: _execute_plan_item(
+                plugin,
+                target_cp,
+                target_token,
+                target_catalog,
+                module,
+                service,
+                item,
+                mask_secrets=mask_secrets,
+            ),
+            journal_path=journal_path,
+            completed_keys=completed_keys,
+            parallel=parallel,
+            continue_on_error=continue_on_error,
+        )
+
+    report = {
+        "mode": "copy",
+        "module": module,
+        "service": service,
+        "source_profile": args.get("from"),
+        "target_profile": target_profile,
+        "plan_file": plan_path,
+        "dry_run": dry_run,
+        "match_by": match_by,
+        "summary": _summarize_results(result_items, selected=len(plan_items)),
+        "items": result_items,
+        "transport": _transport_stats(target=target_cp),
+    }
+
+    out_path = args.get("out")
+    if out_path:
+        write_value_to_file(
+            report,
+            out_path,
+            data_format="json",
+            mask_secrets=mask_secrets,
+        )
+    report["artifacts"] = {
+        "plan": plan_path,
+        "journal": journal_path,
+        "report": out_path,
+    }
+
+    _emit_summary(report)
+    if args.get("console"):
+        print(
+            json.dumps(
+                sanitize_secrets(report, mask_secrets=mask_secrets),
+                indent=2,
+                ensure_ascii=False,
+            )
+        )
+
+    return report
+
+
+@dataclass(frozen=True)
+class _CompareSession:
+    # Diff can replace either side with a snapshot file; that side is None.
+    plugin: Any
+    source_profile: str | None
+    target_profile: str | None
+    source_settings: Settings | None
+    target_settings: Settings | None
+    active_settings: Settings
+    mask_secrets: bool
+    source_cp: Any
+    source_token: str | None
+    source_catalog: dict | None
+    target_cp: Any
+    target_token: str | None
+    target_catalog: dict | None
+
+
+def _connect_profile(
+    plugin,
+    profile_settings: Settings,
+    *,
+    mask_secrets: bool,
+    catalog_view: str,
+) -> tuple[Any, str, dict]:
+    cp = plugin.build_client(profile_settings, mask_secrets=mask_secrets)
+    token = plugin.resolve_auth_token(cp, profile_settings)
+    api_catalog = _load_catalog(
+        plugin,
+        cp,
+        token,
+        profile_settings,
+        catalog_view=catalog_view,
+    )
+    return cp, token, api_catalog
+
+
+def _open_compare_session(
+    args: dict[str, Any],
+    *,
+    source_settings: Settings | None,
+    target_settings: Settings | None,
+    settings: Settings | None,
+    plugin,
+) -> _CompareSession:
+    active_settings = settings or target_settings or source_settings
+    mask_secrets = should_mask_secrets(args, active_settings)
+    catalog_view = str(args.get("catalog_view") or "visible").strip().lower()
+    if catalog_view not in {"visible", "full"}:
+        catalog_view = "visible"
+
+    # The two appliances are independent, so log in and load both catalogs
+    # at the same time.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+
+        def connect(profile_settings: Settings | None) -> Future | None:
+            if profile_settings is None:
+                return None
+            return executor.submit(
+                _connect_profile,
+                plugin,
+                profile_settings,
+                mask_secrets=mask_secrets,
+                catalog_view=catalog_view,
+            )
+
+        source_future = connect(source_settings)
+        target_future = connect(target_settings)
+        source_cp, source_token, source_catalog = (
+            source_future.result() if source_future else (None, None, None)
+        )
+        target_cp, target_token, target_catalog = (
+            target_future.result() if target_future else (None, None, None)
+        )
+
+    return _CompareSession(
+        plugin=plugin,
+        source_profile=str(args["from"]) if source_settings else None,
+        target_profile=str(args["to"]) if target_settings else None,
+        source_settings=source_settings,
+        target_settings=target_settings,
+        active_settings=active_settings,
+        mask_secrets=mask_secrets,
+        source_cp=source_cp,
+        source_token=source_token,
+        source_catalog=source_catalog,
+        target_cp=target_cp,
+        target_token=target_token,
+        target_catalog=target_catalog,
+    )
+
+
+def _async_client_opener(session: _CompareSession, args: dict[str, Any], side: str):
+    if not args.get("async"):
+        return None
+    build_async_client = getattr(session.plugin, "build_async_client", None)
+    if build_async_client is None:
+        raise ValueError("--async is not supported by the active plugin")
+    if side == "source":
+        return partial(build_async_client, session.source_cp, session.source_settings)
+    return partial(build_async_client, session.target_cp, session.target_settings)
+
+
+def _copy_service(
+    session: _CompareSession,
+    args: dict[str, Any],
+    module: str,
+    service: str,
+    *,
+    artifact_timestamp: str,
+    completed_keys: set[str],
+    allow_empty: bool = False,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    plugin = session.plugin
+    target_cp = session.target_cp
+    target_token = session.target_token
+    target_catalog = session.target_catalog
+    on_conflict = str(args.get("on_conflict", "fail"))
+    match_by = str(args.get("match_by", "auto"))
+    dry_run = bool(args.get("dry_run"))
+
     source_items = _fetch_source_items(
-        source_cp, source_token, source_catalog, module, service, args
+        session.source_cp,
+        session.source_token,
+        session.source_catalog,
+        module,
+        service,
+        args,
+        page_workers=resolve_page_workers(args, session.source_settings),
+        async_client=_async_client_opener(session, args, "source"),
     )
-    if not source_items:
+    if not source_items and not allow_empty:
         raise ValueError("No source objects matched the requested selector")
 
+    target_index = None
+    if len(source_items) > 1:
+        # One paged read of the target replaces a name/id lookup per item.
+        target_index = _build_target_index(
+            target_cp,
+            target_token,
+            target_catalog,
+            module,
+            service,
+            page_workers=resolve_page_workers(args, session.target_settings),
+        )
+
     plan_items: list[dict[str, Any]] = []
     for item in source_items:
         label = _copy_item_label(item)
-        target_match, resolved_match = _resolve_match(
-            target_cp, target_token, target_catalog, module, service, item, match_by
-        )
+        if target_index is not None:
+            target_match, resolved_match = _resolve_indexed_match(
+                target_index, item, match_by
+            )
+        else:
+            target_match, resolved_match = _resolve_match(
+                target_cp, target_token, target_catalog, module, service, item, match_by
+            )
 
         if target_match is None:
             action_name = "create"
@@ -422,201 +1196,471 @@ def handle_copy_command(
             }
         )
 
-    result_items: list[dict[str, Any]] = []
+    def artifact_path(option: str, artifact: str, extension: str = "json") -> str:
+        return str(args.get(option) or "").strip() or _default_artifact_path(
+            session.active_settings,
+            module,
+            service,
+            session.source_profile,
+            session.target_profile,
+            artifact,
+            timestamp=artifact_timestamp,
+            extension=extension,
+        )
+
+    journal_path = None
     if dry_run:
-        for item in plan_items:
-            result_items.append(
-                {
-                    **item,
-                    "status": "failed" if item.get("reason") else "planned",
-                    "reason": (
-                        item.get("reason")
-                        or (
-                            None
-                            if item["action"] != "conflict"
-                            else "target object already exists"
-                        )
-                    ),
-                }
-            )
+        result_items = _planned_results(plan_items)
     else:
-        for item in plan_items:
-            action_name = item["action"]
-            try:
-                if item.get("reason"):
-                    result_items.append({**item, "status": "failed"})
-                    if not continue_on_error:
-                        break
-                elif action_name == "create":
-                    request_args = _service_args(module, service, "add")
-                    response = target_cp.add(
-                        target_catalog, target_token, request_args, item["payload"]
-                    )
-                    response = plugin.restore_secret_fields(
-                        response, item["payload"], mask_secrets=mask_secrets
-                    )
-                    result_items.append(
-                        {**item, "status": "success", "response": response}
-                    )
-                elif action_name == "update":
-                    request_args = _service_args(
-                        module,
-                        service,
-                        "update",
-                        id=item["target_match"]["id"],
-                    )
-                    response = target_cp.update(
-                        target_catalog, target_token, request_args, item["payload"]
-                    )
-                    response = plugin.restore_secret_fields(
-                        response, item["payload"], mask_secrets=mask_secrets
-                    )
-                    result_items.append(
-                        {**item, "status": "success", "response": response}
-                    )
-                elif action_name == "replace":
-                    request_args = _service_args(
-                        module,
-                        service,
-                        "replace",
-                        id=item["target_match"]["id"],
-                    )
-                    response = target_cp.replace(
-                        target_catalog, target_token, request_args, item["payload"]
-                    )
-                    response = plugin.restore_secret_fields(
-                        response, item["payload"], mask_secrets=mask_secrets
-                    )
-                    result_items.append(
-                        {**item, "status": "success", "response": response}
-                    )
-                elif action_name == "skip":
-                    result_items.append({**item, "status": "skipped"})
-                else:
-                    result_items.append(
-                        {
-                            **item,
-                            "status": "failed",
-                            "reason": "target object already exists",
-                        }
-                    )
-                    if not continue_on_error:
-                        break
-            except Exception as exc:  # pragma: no cover
-                result_items.append({**item, "status": "failed", "reason": str(exc)})
-                if not continue_on_error:
-                    break
+        # --resume keeps appending to the journal it was given.
+        journal_path = artifact_path("resume", "journal", "ndjson")
+        open_async_target = _async_client_opener(session, args, "target")
+        if open_async_target is not None:
+
+            async def execute(cp, item: dict[str, Any]) -> dict[str, Any]:
+                return await _execute_plan_item_async(
+                    plugin,
+                    cp,
+                    target_token,
+                    target_catalog,
+                    module,
+                    service,
+                    item,
+                    mask_secrets=session.mask_secrets,
+                )
+
+            # Without --parallel, keep as many writes in flight as the
+            # async client has connections.
+            parallel = _positive_int_arg(
+                args,
+                "parallel",
+                getattr(session.target_settings, "pool_size", DEFAULT_POOL_SIZE),
+            )
+        else:
 
-    summary = {
-        "selected": len(source_items),
-        "created": sum(
-            1
-            for item in result_items
-            if item["action"] == "create" and item["status"] in {"success", "planned"}
-        ),
-        "updated": sum(
-            1
-            for item in result_items
-            if item["action"] == "update" and item["status"] in {"success", "planned"}
-        ),
-        "replaced": sum(
-            1
-            for item in result_items
-            if item["action"] == "replace" and item["status"] in {"success", "planned"}
-        ),
-        "skipped": sum(
-            1
-            for item in result_items
-            if item["status"] == "skipped"
-            or item["action"] == "skip"
-            and item["status"] == "planned"
-        ),
-        "failed": sum(1 for item in result_items if item["status"] == "failed"),
-    }
+            def execute(item: dict[str, Any]) -> dict[str, Any]:
+                return _execute_plan_item(
+                    plugin,
+                    target_cp,
+                    target_token,
+                    target_catalog,
+                    module,
+                    service,
+                    item,
+                    mask_secrets=session.mask_secrets,
+                )
+
+            parallel = _resolve_parallel(args)
+        result_items = _run_journaled_plan(
+            plan_items,
+            execute,
+            journal_path=journal_path,
+            completed_keys=completed_keys,
+            parallel=parallel,
+            continue_on_error=bool(args.get("continue_on_error")),
+            async_client=open_async_target,
+        )
 
     report = {
         "mode": "copy",
         "module": module,
         "service": service,
-        "source_profile": source_profile,
-        "target_profile": target_profile,
+        "source_profile": session.source_profile,
+        "target_profile": session.target_profile,
         "dry_run": dry_run,
         "match_by": match_by,
         "on_conflict": on_conflict,
-        "summary": summary,
+        "summary": _summarize_results(result_items, selected=len(source_items)),
         "items": result_items,
     }
 
-    save_source = str(args.get("save_source") or "").strip() or _default_artifact_path(
-        active_settings,
-        module,
-        service,
-        source_profile,
-        target_profile,
-        "source",
-        timestamp=artifact_timestamp,
-    )
+    save_source = artifact_path("save_source", "source")
     write_value_to_file(
         source_items,
         save_source,
         data_format="json",
-        mask_secrets=mask_secrets,
-    )
-
-    save_payload = str(args.get("save_payload") or "").strip() or (
-        _default_artifact_path(
-            active_settings,
-            module,
-            service,
-            source_profile,
-            target_profile,
-            "payload",
-            timestamp=artifact_timestamp,
-        )
+        mask_secrets=session.mask_secrets,
     )
+    save_payload = artifact_path("save_payload", "payload")
     write_value_to_file(
         [item["payload"] for item in plan_items if item.get("payload") is not None],
         save_payload,
         data_format="json",
-        mask_secrets=mask_secrets,
-    )
-
-    save_plan = str(args.get("save_plan") or "").strip() or _default_artifact_path(
-        active_settings,
-        module,
-        service,
-        source_profile,
-        target_profile,
-        "plan",
-        timestamp=artifact_timestamp,
+        mask_secrets=session.mask_secrets,
     )
+    save_plan = artifact_path("save_plan", "plan")
     write_value_to_file(
         plan_items,
         save_plan,
         data_format="json",
-        mask_secrets=mask_secrets,
+        mask_secrets=session.mask_secrets,
     )
 
+    artifacts = {
+        "source": save_source,
+        "payload": save_payload,
+        "plan": save_plan,
+        "journal": journal_path,
+    }
+    return report, artifacts
+
+
+def _validate_module_copy_args(args: dict[str, Any]) -> None:
+    source_profile = args.get("from")
+    target_profile = args.get("to")
+    if not source_profile or not target_profile:
+        raise ValueError("--from and --to are required for copy")
+    if source_profile == target_profile:
+        raise ValueError("--from and --to must be different profiles")
+    _require_known_profiles(str(source_profile), str(target_profile))
+
+    single_service_options = (
+        "id",
+        "name",
+        "filter",
+        "limit",
+        "offset",
+        "sort",
+        "from_plan",
+        "resume",
+        "save_source",
+        "save_payload",
+        "save_plan",
+    )
+    used = [
+        "--" + name.replace("_", "-")
+        for name in single_service_options
+        if args.get(name) not in (None, "", False)
+    ]
+    if used:
+        raise ValueError(
+            "Module copy copies every object of every service; "
+            f"{', '.join(used)} only apply to single-service copies"
+        )
+
+    match_by = str(args.get("match_by", "auto"))
+    if match_by not in VALID_MATCH_MODES:
+        raise ValueError("--match-by must be one of: auto, name, id")
+    on_conflict = str(args.get("on_conflict", "fail"))
+    if on_conflict not in VALID_CONFLICT_MODES:
+        raise ValueError("--on-conflict must be one of: fail, skip, update, replace")
+    _resolve_parallel(args)
+    _positive_int_arg(args, "service_workers", DEFAULT_SERVICE_WORKERS)
+
+
+def _module_copy_services(
+    source_catalog: dict, target_catalog: dict, module: str
+) -> list[str]:
+    services = (source_catalog.get("modules") or {}).get(module)
+    if services is None:
+        raise ValueError(f"Unknown module '{module}'")
+    return [
+        service
+        for service in sorted(services)
+        if _has_action(source_catalog, module, service, "list")
+        and _has_action(target_catalog, module, service, "add")
+    ]
+
+
+def _dependency_order(services: list[str], requires: dict[str, set[str]]) -> list[str]:
+    ordered: list[str] = []
+    placed: set[str] = set()
+    remaining = list(services)
+    while remaining:
+        ready = [service for service in remaining if requires[service] <= placed]
+        # A dependency cycle keeps the rest in catalog order.
+        for service in ready or remaining[:1]:
+            ordered.append(service)
+            placed.add(service)
+            remaining.remove(service)
+    return ordered
+
+
+def _run_service_schedule(
+    services: list[str],
+    dependencies: dict[str, set[str]],
+    run_service,
+    *,
+    workers: int,
+    continue_on_error: bool,
+    block_dependents: bool,
+) -> list[dict[str, Any]]:
+    requires = {
+        service: {
+            dependency
+            for dependency in dependencies.get(service, ())
+            if dependency in services and dependency != service
+        }
+        for service in services
+    }
+    ordered = _dependency_order(services, requires)
+    remaining = list(ordered)
+    results: dict[str, dict[str, Any]] = {}
+    unusable: set[str] = set()
+    pending: dict[Future, str] = {}
+    stopped = False
+
+    def skip(service: str, reason: str) -> None:
+        remaining.remove(service)
+        unusable.add(service)
+        results[service] = {"service": service, "status": "skipped", "reason": reason}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while True:
+            for service in list(remaining):
+                failed = requires[service] & unusable
+                if stopped:
+                    skip(service, "not started after an earlier failure")
+                elif block_dependents and failed:
+                    skip(service, f"dependency failed: {', '.join(sorted(failed))}")
+            ready = [
+                service for service in remaining if requires[service] <= results.keys()
+            ]
+            if remaining and not ready and not pending:
+                ready = remaining[:1]
+            for service in ready[: max(workers - len(pending), 0)]:
+                remaining.remove(service)
+                pending[executor.submit(run_service, service)] = service
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                service = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    # Like a failed object, a failed service must not take the
+                    # results of the others down with it.
+                    result = {
+                        "service": service,
+                        "status": "failed",
+                        "reason": str(exc),
+                    }
+                results[service] = result
+                if result["status"] == "failed":
+                    unusable.add(service)
+                    if not continue_on_error:
+                        stopped = True
+    return [results[service] for service in ordered]
+
+
+def _summarize_services(service_results: list[dict[str, Any]]) -> dict[str, int]:
+    summary = {
+        "services": len(service_results),
+        "services_completed": 0,
+        "services_failed": 0,
+        "services_skipped": 0,
+        "selected": 0,
+        "created": 0,
+        "updated": 0,
+        "replaced": 0,
+        "skipped": 0,
+        "failed": 0,
+    }
+    for result in service_results:
+        summary[f"services_{result['status']}"] += 1
+        for key, value in (result.get("summary") or {}).items():
+            summary[key] += value
+    return summary
+
+
+def _emit_module_summary(report: dict[str, Any]) -> None:
+    summary = report["summary"]
+    print("Dry run" if report.get("dry_run") else "Copy completed")
+    print(f"Source profile: {report['source_profile']}")
+    print(f"Target profile: {report['target_profile']}")
+    print(f"Module: {report['module']}")
+    print(
+        f"Services: {summary['services']} "
+        f"(completed {summary['services_completed']}, "
+        f"failed {summary['services_failed']}, "
+        f"skipped {summary['services_skipped']})"
+    )
+    for result in report["services"]:
+        counts = result.get("summary")
+        if counts is None:
+            print(f"- {result['service']}: {result['status']} ({result['reason']})")
+            continue
+        print(
+            f"- {result['service']}: selected {counts['selected']}, "
+            f"created {counts['created']}, updated {counts['updated']}, "
+            f"replaced {counts['replaced']}, skipped {counts['skipped']}, "
+            f"failed {counts['failed']}"
+        )
+    print(f"Selected: {summary['selected']}")
+    print(f"Created: {summary['created']}")
+    print(f"Updated: {summary['updated']}")
+    print(f"Replaced: {summary['replaced']}")
+    print(f"Skipped: {summary['skipped']}")
+    print(f"Failed: {summary['failed']}")
+    failed_items = [
+        (result["service"], item)
+        for result in report["services"]
+        for item in result.get("items", [])
+        if item.get("status") == "failed"
+    ]
+    if failed_items:
+        print("Failure reasons:")
+        for service, item in failed_items[:10]:
+            print(
+                f"- {service} {item.get('label', '<unknown>')}: "
+                f"{item.get('reason', 'unknown error')}"
+            )
+    artifacts = report.get("artifacts") or {}
+    if artifacts.get("report"):
+        print("Artifacts:")
+        print(f"- report: {artifacts['report']}")
+
+
+def _handle_module_copy(
+    args: dict[str, Any],
+    *,
+    settings: Settings | None,
+    plugin,
+) -> dict[str, Any]:
+    _validate_module_copy_args(args)
+
+    module = str(args["copy_module"])
+    dry_run = bool(args.get("dry_run"))
+    artifact_timestamp = _timestamp_token()
+    session = _open_compare_session(
+        args,
+        source_settings=load_settings_for_profile(str(args["from"])),
+        target_settings=load_settings_for_profile(str(args["to"])),
+        settings=settings,
+        plugin=plugin,
+    )
+    services = _module_copy_services(
+        session.source_catalog, session.target_catalog, module
+    )
+    if not services:
+        raise ValueError(f"No copyable services found in module '{module}'")
+
+    dependency_hook = getattr(plugin, "copy_service_dependencies", None)
+    dependencies = dependency_hook(module) if dependency_hook is not None else {}
+    service_args = {**args, "all": True}
+
+    def run_service(service: str) -> dict[str, Any]:
+        report, artifacts = _copy_service(
+            session,
+            service_args,
+            module,
+            service,
+            artifact_timestamp=artifact_timestamp,
+            completed_keys=set(),
+            allow_empty=True,
+        )
+        return {
+            "service": service,
+            "status": "failed" if report["summary"]["failed"] else "completed",
+            "reason": None,
+            "summary": report["summary"],
+            "items": report["items"],
+            "artifacts": artifacts,
+        }
+
+    service_results = _run_service_schedule(
+        services,
+        dependencies,
+        run_service,
+        workers=_positive_int_arg(args, "service_workers", DEFAULT_SERVICE_WORKERS),
+        continue_on_error=bool(args.get("continue_on_error")),
+        # A dry run writes nothing, so later services are still worth planning.
+        block_dependents=not dry_run,
+    )
+
+    report = {
+        "mode": "copy",
+        "module": module,
+        "service": None,
+        "source_profile": session.source_profile,
+        "target_profile": session.target_profile,
+        "dry_run": dry_run,
+        "match_by": str(args.get("match_by", "auto")),
+        "on_conflict": str(args.get("on_conflict", "fail")),
+        "summary": _summarize_services(service_results),
+        "services": service_results,
+        "transport": _transport_stats(
+            source=session.source_cp, target=session.target_cp
+        ),
+    }
+
     out_path = args.get("out")
     if out_path:
         write_value_to_file(
             report,
             out_path,
             data_format="json",
-            mask_secrets=mask_secrets,
+            mask_secrets=session.mask_secrets,
         )
-    report["artifacts"] = {
-        "source": save_source,
-        "payload": save_payload,
-        "plan": save_plan,
-        "report": out_path,
-    }
+    report["artifacts"] = {"report": out_path}
+
+    _emit_module_summary(report)
+    if args.get("console"):
+        print(
+            json.dumps(
+                sanitize_secrets(report, mask_secrets=session.mask_secrets),
+                indent=2,
+                ensure_ascii=False,
+            )
+        )
+
+    return report
+
+
+def handle_copy_command(
+    args: dict[str, Any],
+    *,
+    settings: Settings | None,
+    plugin,
+) -> dict[str, Any]:
+    if args.get("copy_module") and not args.get("copy_service"):
+        return _handle_module_copy(args, settings=settings, plugin=plugin)
+    if args.get("from_plan"):
+        return _apply_saved_plan(args, settings=settings, plugin=plugin)
+
+    _validate_copy_args(args)
+
+    module = str(args["copy_module"])
+    service = str(args["copy_service"])
+    _resolve_parallel(args)
+    resume_path = str(args.get("resume") or "").strip()
+    completed_keys = _load_journal_keys(resume_path) if resume_path else set()
+
+    session = _open_compare_session(
+        args,
+        source_settings=load_settings_for_profile(str(args["from"])),
+        target_settings=load_settings_for_profile(str(args["to"])),
+        settings=settings,
+        plugin=plugin,
+    )
+    report, artifacts = _copy_service(
+        session,
+        args,
+        module,
+        service,
+        artifact_timestamp=_timestamp_token(),
+        completed_keys=completed_keys,
+    )
+    report["transport"] = _transport_stats(
+        source=session.source_cp, target=session.target_cp
+    )
+
+    out_path = args.get("out")
+    if out_path:
+        write_value_to_file(
+            report,
+            out_path,
+            data_format="json",
+            mask_secrets=session.mask_secrets,
+        )
+    report["artifacts"] = {**artifacts, "report": out_path}
 
     _emit_summary(report)
     if args.get("console"):
         print(
             json.dumps(
-                sanitize_secrets(report, mask_secrets=mask_secrets),
+                sanitize_secrets(report, mask_secrets=session.mask_secrets),
                 indent=2,
                 ensure_ascii=False,
             )
@@ -0,0 +1,484 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import struct
+import sys
+import time
+import traceback
+from collections.abc import Callable
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, BinaryIO, TextIO
+
+from netloom import get_version
+from netloom.cli.commands import ACTIONS
+from netloom.core.config import Settings, config_dir, daemon_socket_path, load_settings
+
+log = logging.getLogger(__name__)
+
+_PROTOCOL_VERSION = 1
+_FORWARDED_ENV_PREFIXES = ("NETLOOM_", "XDG_")
+_LOCAL_MODULES = {"cache", "copy", "daemon", "load", "server"}
+_MAX_WARM_ENTRIES = 16
+_CATALOG_MAX_AGE_SECONDS = 3600
+# Python on Windows has no Unix domain sockets; there the daemon refuses to
+# start and every command runs in-process.
+_UnixStreamServer = getattr(socketserver, "UnixStreamServer", socketserver.TCPServer)
+
+
+def is_forwardable(args: dict[str, Any]) -> bool:
+    if args.get("help") or args.get("version") or args.get("_complete"):
+        return False
+    module = args.get("module")
+    service = args.get("service")
+    action = args.get("action")
+    if not (module and service and action) or module in _LOCAL_MODULES:
+        return False
+    return service not in {"copy", "diff"} and action in ACTIONS
+
+
+def _forwarded_env() -> dict[str, str]:
+    return {
+        key: value
+        for key, value in os.environ.items()
+        if key.startswith(_FORWARDED_ENV_PREFIXES)
+    }
+
+
+def _apply_env(env: dict[str, str]) -> None:
+    for key in [key for key in os.environ if key.startswith(_FORWARDED_ENV_PREFIXES)]:
+        if key not in env:
+            del os.environ[key]
+    os.environ.update(env)
+
+
+def _send(stream: BinaryIO, frame: dict[str, Any]) -> None:
+    stream.write(json.dumps(frame).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def _connect(path: Path) -> socket.socket | None:
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def forward_to_daemon(
+    args: dict[str, Any],
+    *,
+    socket_path: Path | None = None,
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
+) -> int | None:
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    sock = _connect(socket_path or daemon_socket_path())
+    if sock is None:
+        return None
+    request = {
+        "version": _PROTOCOL_VERSION,
+        "netloom": get_version(),
+        "args": args,
+        "cwd": os.getcwd(),
+        "env": _forwarded_env(),
+    }
+    with sock, sock.makefile("rwb") as stream:
+        _send(stream, request)
+        for line in stream:
+            frame = json.loads(line)
+            if "stdout" in frame:
+                stdout.write(frame["stdout"])
+                stdout.flush()
+            elif "stderr" in frame:
+                stderr.write(frame["stderr"])
+                stderr.flush()
+            elif "exit" in frame:
+                return int(frame["exit"])
+            elif "fallback" in frame:
+                return None
+    print(
+        "netloom daemon closed the connection before the command finished.",
+        file=stderr,
+    )
+    return 1
+
+
+def _request_control(path: Path, control: str) -> dict[str, Any] | None:
+    sock = _connect(path)
+    if sock is None:
+        return None
+    with sock, sock.makefile("rwb") as stream:
+        _send(stream, {"control": control})
+        line = stream.readline()
+    return json.loads(line) if line else None
+
+
+def _config_stamp() -> tuple[tuple[str, int], ...]:
+    try:
+        files = sorted(config_dir().rglob("*.env"))
+        return tuple((str(path), path.stat().st_mtime_ns) for path in files)
+    except OSError:
+        return ()
+
+
+def _cache_stamp(settings: Settings) -> int | None:
+    # Catalog writes land by rename, so the directory mtime moves whenever any
+    # process refreshes, clears, or evicts a cached catalog.
+    try:
+        return settings.paths.cache_dir.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _remember(entries: dict, key, value, *, drop: Callable | None = None):
+    if key not in entries and len(entries) >= _MAX_WARM_ENTRIES:
+        evicted = entries.pop(next(iter(entries)))
+        if drop is not None:
+            drop(evicted)
+    entries[key] = value
+    return value
+
+
+def _close_catalog(entry: tuple[dict, int | None, float]) -> None:
+    # Packed catalogs map their cache file; close it rather than keep the
+    # replaced file's inode alive until garbage collection.
+    for value in entry[0].values():
+        close = getattr(value, "close", None)
+        if callable(close):
+            close()
+
+
+class _WarmTokens:
+    # Memory only, so the daemon keeps logins warm without the on-disk cache.
+    def __init__(self):
+        self._tokens: dict[str, tuple[str, float]] = {}
+
+    def load_cached_token(self, settings: Settings) -> str | None:
+        cached = self._tokens.get(repr(settings))
+        if cached is None:
+            return None
+        token, expires_at = cached
+        if time.time() >= expires_at - max(0, settings.token_refresh_margin):
+            return None
+        return token
+
+    def store_token(self, settings: Settings, response: dict[str, Any]) -> bool:
+        token = response.get("access_token")
+        try:
+            expires_in = int(response.get("expires_in"))
+        except (TypeError, ValueError):
+            return False
+        if not isinstance(token, str) or not token or expires_in <= 0:
+            return False
+        _remember(self._tokens, repr(settings), (token, time.time() + expires_in))
+        return True
+
+    def invalidate_cached_token(
+        self, settings: Settings, token: str | None = None
+    ) -> bool:
+        cached = self._tokens.get(repr(settings))
+        if cached is None or (token is not None and cached[0] != token):
+            return False
+        del self._tokens[repr(settings)]
+        return True
+
+
+class WarmSessions:
+    def __init__(self):
+        self.started = time.monotonic()
+        self.commands = 0
+        self._settings: dict[tuple, Settings] = {}
+        self._clients: dict[tuple, Any] = {}
+        self._catalogs: dict[tuple, tuple[dict, int | None, float]] = {}
+        self._tokens = _WarmTokens()
+
+    def settings(self) -> Settings:
+        key = (tuple(sorted(_forwarded_env().items())), _config_stamp())
+        settings = self._settings.get(key)
+        if settings is None:
+            settings = _remember(self._settings, key, load_settings())
+        return settings
+
+    def client(self, plugin, settings: Settings, *, mask_secrets: bool):
+        key = (plugin.name, repr(settings), mask_secrets)
+        cp = self._clients.get(key)
+        if cp is None:
+            cp = _remember(
+                self._clients,
+                key,
+                plugin.build_client(settings, mask_secrets=mask_secrets),
+            )
+        return cp
+
+    def token(self, plugin, cp, settings: Settings) -> str:
+        try:
+            return plugin.resolve_auth_token(cp, settings, token_store=self._tokens)
+        except TypeError as exc:
+            if "token_store" not in str(exc):
+                raise
+            return plugin.resolve_auth_token(cp, settings)
+
+    def catalog(
+        self,
+        plugin,
+        settings: Settings,
+        catalog_view: str,
+        load: Callable[[], dict],
+    ) -> dict:
+        key = (plugin.name, repr(settings), catalog_view)
+        cached = self._catalogs.get(key)
+        if cached is not None:
+            catalog, stamp, loaded_at = cached
+            fresh = time.monotonic() - loaded_at < _CATALOG_MAX_AGE_SECONDS
+            if fresh and stamp is not None and stamp == _cache_stamp(settings):
+                return catalog
+        catalog = load()
+        _remember(
+            self._catalogs,
+            key,
+            (catalog, _cache_stamp(settings), time.monotonic()),
+            drop=_close_catalog,
+        )
+        if cached is not None and cached[0] is not catalog:
+            _close_catalog(cached)
+        return catalog
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "uptime_seconds": round(time.monotonic() - self.started, 1),
+            "commands": self.commands,
+            "servers": sorted(
+                {getattr(cp, "server", None) or "?" for cp in self._clients.values()}
+            ),
+            "catalogs": len(self._catalogs),
+        }
+
+
+class _FrameWriter(io.TextIOBase):
+    def __init__(self, stream: BinaryIO, name: str):
+        self.stream = stream
+        self.name = name
+        self.disconnected = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text and not self.disconnected:
+            try:
+                _send(self.stream, {self.name: text})
+            except OSError:
+                # The client went away; let the command finish quietly.
+                self.disconnected = True
+        return len(text)
+
+
+def _peer_is_same_user(connection: socket.socket) -> bool:
+    option = getattr(socket, "SO_PEERCRED", None)
+    if option is None:
+        return True
+    credentials = connection.getsockopt(
+        socket.SOL_SOCKET, option, struct.calcsize("3i")
+    )
+    _pid, uid, _gid = struct.unpack("3i", credentials)
+    return uid == os.getuid()
+
+
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    server: NetloomDaemon
+
+    def handle(self) -> None:
+        if not _peer_is_same_user(self.connection):
+            log.warning("Rejected a daemon connection from another user")
+            return
+        try:
+            request = json.loads(self.rfile.readline() or b"null")
+        except ValueError:
+            return
+        if not isinstance(request, dict):
+            return
+        control = request.get("control")
+        if control == "status":
+            _send(self.wfile, {"status": self.server.status()})
+            return
+        if control == "stop":
+            self.server.stopping = True
+            _send(self.wfile, {"stopped": os.getpid()})
+            return
+        if request.get("version") != _PROTOCOL_VERSION or (
+            request.get("netloom") != get_version()
+        ):
+            _send(self.wfile, {"fallback": "version mismatch"})
+            return
+        exit_code = self.server.execute(request, self.wfile)
+        try:
+            _send(self.wfile, {"exit": exit_code})
+        except OSError:
+            pass
+
+
+class NetloomDaemon(_UnixStreamServer):
+    def __init__(
+        self,
+        socket_path: Path,
+        run: Callable[[dict, Settings, WarmSessions], None],
+        *,
+        idle_timeout: float = 0.0,
+    ):
+        self.socket_path = socket_path
+        self.run = run
+        self.sessions = WarmSessions()
+        self.idle_timeout = idle_timeout
+        self.last_active = time.monotonic()
+        self.stopping = False
+        self.timeout = 1.0
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # Only the owner may connect: commands run with the owner's
+        # credentials and can print decrypted secrets.
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(str(socket_path), _DaemonHandler)
+        finally:
+            os.umask(previous_umask)
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "version": get_version(),
+            "socket": str(self.socket_path),
+            **self.sessions.describe(),
+        }
+
+    def execute(self, request: dict[str, Any], stream: BinaryIO) -> int:
+        self.last_active = time.monotonic()
+        root_logger = logging.getLogger("netloom")
+        handlers, level = list(root_logger.handlers), root_logger.level
+        stdout = _FrameWriter(stream, "stdout")
+        stderr = _FrameWriter(stream, "stderr")
+        exit_code = 0
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                _apply_env(request.get("env") or {})
+                os.chdir(request.get("cwd") or "/")
+                self.run(request["args"], self.sessions.settings(), self.sessions)
+            except SystemExit as exc:
+                if isinstance(exc.code, int):
+                    exit_code = exc.code
+                elif exc.code is not None:
+                    print(exc.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+        # The command reconfigured logging onto this request's stream; close
+        # what it opened, such as the log file, before restoring ours.
+        for handler in root_logger.handlers:
+            if handler not in handlers:
+                handler.close()
+        root_logger.handlers[:] = handlers
+        root_logger.setLevel(level)
+        self.sessions.commands += 1
+        self.last_active = time.monotonic()
+        return exit_code
+
+    def handle_error(self, request, client_address) -> None:
+        log.debug("Daemon request failed", exc_info=True)
+
+    def serve(self) -> None:
+        try:
+            while not self.stopping:
+                self.handle_request()
+                idle = time.monotonic() - self.last_active
+                if self.idle_timeout and idle >= self.idle_timeout:
+                    log.info("Stopping after %.0fs without commands", idle)
+                    break
+        finally:
+            self.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+
+def _idle_timeout_arg(args: dict[str, Any]) -> float:
+    raw = args.get("idle_timeout")
+    if raw in (None, ""):
+        return 0.0
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        value = -1.0
+    if value < 0:
+        raise ValueError("--idle-timeout must be a non-negative number of seconds")
+    return value
+
+
+def _start_daemon(args: dict[str, Any], run) -> None:
+    if not hasattr(socket, "AF_UNIX"):
+        raise ValueError("netloom daemon needs Unix domain sockets")
+    path = daemon_socket_path()
+    reply = _request_control(path, "status")
+    if reply is not None:
+        pid = reply.get("status", {}).get("pid")
+        print(f"netloom daemon is already running (pid {pid}) on {path}.")
+        return
+    # Nothing answered, so whatever is left at the path is stale.
+    path.unlink(missing_ok=True)
+    daemon = NetloomDaemon(path, run, idle_timeout=_idle_timeout_arg(args))
+    print(f"netloom daemon listening on {path} (pid {os.getpid()})", flush=True)
+    try:
+        daemon.serve()
+    except KeyboardInterrupt:
+        pass
+    print("netloom daemon stopped.")
+
+
+def _format_status(status: dict[str, Any]) -> str:
+    servers = ", ".join(status.get("servers") or []) or "<none>"
+    return "\n".join(
+        [
+            f"netloom daemon running (pid {status.get('pid')})",
+            f"Socket: {status.get('socket')}",
+            f"Version: {status.get('version')}",
+            f"Uptime: {status.get('uptime_seconds')}s",
+            f"Commands served: {status.get('commands')}",
+            f"Warm servers: {servers}",
+            f"Warm catalogs: {status.get('catalogs')}",
+        ]
+    )
+
+
+def handle_daemon_command(args: dict[str, Any], run) -> bool:
+    service = args.get("service")
+    if args.get("action"):
+        return False
+
+    if service == "start":
+        _start_daemon(args, run)
+        return True
+
+    if service == "stop":
+        reply = _request_control(daemon_socket_path(), "stop")
+        if reply is None:
+            print("No netloom daemon is running.")
+        else:
+            print(f"Stopped netloom daemon (pid {reply.get('stopped')}).")
+        return True
+
+    if service == "status":
+        reply = _request_control(daemon_socket_path(), "status")
+        if reply is None:
+            print("No netloom daemon is running.")
+        else:
+            print(_format_status(reply.get("status") or {}))
+        return True
+
+    return False
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-import copy
+import hashlib
 import json
-from collections import defaultdict
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
+import requests
+
 from netloom.cli.copy import (
+    DEFAULT_SERVICE_WORKERS,
     VALID_MATCH_MODES,
+    _CompareSession,
     _copy_item_label,
     _default_artifact_path,
     _extract_items,
@@ -14,15 +20,20 @@ from netloom.cli.copy import (
     _fetch_target_by_id,
     _fetch_target_by_name,
     _has_action,
-    _load_catalog,
+    _open_compare_session,
+    _positive_int_arg,
+    _require_known_profiles,
+    _run_service_schedule,
     _service_args,
+    _transport_stats,
     _validate_compare_args,
 )
 from netloom.core.config import Settings, load_settings_for_profile
-from netloom.core.pagination import fetch_all_list_results
-from netloom.io.output import should_mask_secrets, write_value_to_file
+from netloom.core.pagination import iter_list_items, resolve_page_workers
+from netloom.io.output import write_value_to_file
 
 _MISSING = object()
+_REMOVED = object()
 _SCALAR_TYPES = (str, int, float, bool, type(None))
 _DEFAULT_DETAIL_LIMIT = 10
 _DEFAULT_VALUE_LIMIT = 5
@@ -109,98 +120,104 @@ def _canonical_list_signature(items: list[Any]) -> list[str] | None:
         return None
 
 
-def _select_paths(value: Any, paths: list[tuple[str | int, ...]]) -> Any:
-    if any(not path for path in paths):
-        return copy.deepcopy(value)
+def _canonical_digest(value: Any) -> bytes | None:
+    try:
+        text = json.dumps(
+            value, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
 
-    if isinstance(value, dict):
-        grouped: dict[str, list[tuple[str | int, ...]]] = defaultdict(list)
-        for path in paths:
-            head = path[0]
-            if isinstance(head, str):
-                grouped[head].append(path[1:])
-        if not grouped:
-            return _MISSING
-        selected: dict[str, Any] = {}
-        for key, child_paths in grouped.items():
-            if key not in value:
-                continue
-            child_value = _select_paths(value[key], child_paths)
-            if child_value is not _MISSING:
-                selected[key] = child_value
-        return selected if selected else _MISSING
-
-    if isinstance(value, list):
-        grouped: dict[int, list[tuple[str | int, ...]]] = defaultdict(list)
-        for path in paths:
-            head = path[0]
-            if isinstance(head, int):
-                grouped[head].append(path[1:])
-        if not grouped:
-            return _MISSING
-        selected_list: list[Any] = []
-        for index in sorted(grouped):
-            if 0 <= index < len(value):
-                child_value = _select_paths(value[index], grouped[index])
-                if child_value is not _MISSING:
-                    selected_list.append(child_value)
-        return selected_list if selected_list else _MISSING
 
-    return _MISSING
+def _changed_values(source: Any, target: Any) -> list[tuple[str, Any, Any]]:
+    # Most matched pairs are identical; one digest each settles those without
+    # walking both objects.
+    source_digest = _canonical_digest(source)
+    if source_digest is not None and source_digest == _canonical_digest(target):
+        return []
+    return _collect_changed_values(source, target)
 
 
-def _remove_path(value: Any, path: tuple[str | int, ...]) -> Any:
-    if value is _MISSING:
-        return _MISSING
-    if not path:
-        return _MISSING
+class _FieldTrie:
+    __slots__ = ("terminal", "children")
 
-    head, *tail = path
-    if isinstance(value, dict) and isinstance(head, str):
-        updated = copy.deepcopy(value)
-        if head not in updated:
-            return updated
-        if not tail:
-            updated.pop(head, None)
-            return updated
-        child = _remove_path(updated[head], tuple(tail))
-        if child is _MISSING:
-            updated.pop(head, None)
+    def __init__(self) -> None:
+        self.terminal = False
+        self.children: dict[str | int, _FieldTrie] = {}
+
+
+def _compile_field_trie(paths: list[tuple[str | int, ...]]) -> _FieldTrie | None:
+    if not paths:
+        return None
+    root = _FieldTrie()
+    for path in paths:
+        node = root
+        for token in path:
+            node = node.children.setdefault(token, _FieldTrie())
+        node.terminal = True
+    return root
+
+
+def _project(value: Any, include: _FieldTrie | None, ignore: _FieldTrie | None) -> Any:
+    if include is not None and include.terminal:
+        include = None
+    if ignore is not None and ignore.terminal:
+        if include is not None and _project(value, include, None) is _MISSING:
+            return _MISSING
+        return _REMOVED
+    if include is None and ignore is None:
+        # Untouched subtrees are shared with the input rather than copied.
+        return value
+
+    if isinstance(value, dict):
+        if include is not None:
+            entries = [
+                (key, value[key], node)
+                for key, node in include.children.items()
+                if isinstance(key, str) and key in value
+            ]
         else:
-            updated[head] = child
-        return updated
-
-    if isinstance(value, list) and isinstance(head, int):
-        updated = copy.deepcopy(value)
-        if not (0 <= head < len(updated)):
-            return updated
-        if not tail:
-            updated.pop(head)
-            return updated
-        child = _remove_path(updated[head], tuple(tail))
-        if child is _MISSING:
-            updated.pop(head)
+            entries = [(key, item, None) for key, item in value.items()]
+    elif isinstance(value, list):
+        if include is not None:
+            entries = [
+                (index, value[index], include.children[index])
+                for index in sorted(
+                    key for key in include.children if isinstance(key, int)
+                )
+                if 0 <= index < len(value)
+            ]
         else:
-            updated[head] = child
-        return updated
+            entries = [(index, item, None) for index, item in enumerate(value)]
+    else:
+        return _MISSING if include is not None else value
 
-    return copy.deepcopy(value)
+    ignored = ignore.children if ignore is not None else {}
+    kept: list[tuple[Any, Any]] = []
+    selected = 0
+    for key, item, child_include in entries:
+        child = _project(item, child_include, ignored.get(key))
+        if child is _MISSING:
+            continue
+        selected += 1
+        if child is not _REMOVED:
+            kept.append((key, child))
+    if include is not None and not selected:
+        return _MISSING
+    if isinstance(value, dict):
+        return dict(kept)
+    return [child for _, child in kept]
 
 
 def _apply_field_filters(
     value: Any,
-    include_paths: list[tuple[str | int, ...]],
-    ignore_paths: list[tuple[str | int, ...]],
+    include_trie: _FieldTrie | None,
+    ignore_trie: _FieldTrie | None,
 ) -> Any:
-    filtered = copy.deepcopy(value)
-    if include_paths:
-        filtered = _select_paths(filtered, include_paths)
-        if filtered is _MISSING:
-            return None
-    for path in ignore_paths:
-        filtered = _remove_path(filtered, path)
-        if filtered is _MISSING:
-            return None
+    filtered = _project(value, include_trie, ignore_trie)
+    if filtered is _MISSING or filtered is _REMOVED:
+        return None
     return filtered
 
 
@@ -319,8 +336,11 @@ def _target_name_candidates(
             "list",
             filter=json.dumps({"name": name}),
         )
-        result = fetch_all_list_results(cp, token, api_catalog, list_args)
-        return [item for item in _extract_items(result) if item.get("name") == name]
+        return [
+            item
+            for item in iter_list_items(cp, token, api_catalog, list_args)
+            if isinstance(item, dict) and item.get("name") == name
+        ]
     match = _fetch_target_by_name(cp, token, api_catalog, module, service, name)
     return [match] if isinstance(match, dict) else []
 
@@ -507,8 +527,11 @@ def _print_ambiguous(items: list[dict[str, Any]]) -> None:
 def _emit_diff_summary(report: dict[str, Any]) -> None:
     summary = report["summary"]
     print("Diff completed")
-    print(f"Source profile: {report['source_profile']}")
-    print(f"Target profile: {report['target_profile']}")
+    for side in ("source", "target"):
+        if report.get(f"{side}_snapshot"):
+            print(f"{side.title()} snapshot: {report[f'{side}_snapshot']}")
+        else:
+            print(f"{side.title()} profile: {report[f'{side}_profile']}")
     print(f"Service: {report['module']} {report['service']}")
     print(f"Match by: {report['match_by']}")
     print(f"Compared: {summary['compared']}")
@@ -535,70 +558,132 @@ def _emit_diff_summary(report: dict[str, Any]) -> None:
     print(f"Report: {report['artifacts']['report']}")
 
 
-def handle_diff_command(
-    args: dict[str, Any],
-    *,
-    settings: Settings | None,
-    plugin,
-) -> dict[str, Any]:
-    _validate_compare_args(
-        args,
-        module_key="module",
-        service_key="service",
-        operation_name="diff",
-    )
+def _load_snapshot_items(path: str) -> list[dict[str, Any]]:
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+    except FileNotFoundError as exc:
+        raise ValueError(f"Snapshot file not found: {path}") from exc
+    try:
+        return _extract_items(json.loads(text))
+    except json.JSONDecodeError:
+        pass
+
+    items: list[dict[str, Any]] = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            items.extend(_extract_items(json.loads(line)))
+        except json.JSONDecodeError as exc:
+            raise ValueError(
+                f"Snapshot file is neither JSON nor NDJSON: {path} (line {line_number})"
+            ) from exc
+    return items
+
+
+def _validate_snapshot_diff_args(args: dict[str, Any]) -> None:
+    if not args.get("module") or not args.get("service"):
+        raise ValueError(
+            "Usage: netloom <module> <service> diff "
+            "--from=...|--from-snapshot=FILE --to=...|--to-snapshot=FILE"
+        )
+
+    live_profiles: list[str] = []
+    for side in ("from", "to"):
+        has_snapshot = args.get(f"{side}_snapshot") not in (None, "")
+        has_profile = args.get(side) not in (None, "")
+        if has_snapshot and has_profile:
+            raise ValueError(f"Use either --{side} or --{side}-snapshot, not both")
+        if not has_snapshot and not has_profile:
+            raise ValueError(f"--{side} or --{side}-snapshot is required for diff")
+        if has_profile:
+            live_profiles.append(str(args[side]))
+    _require_known_profiles(*live_profiles)
+
+    if any(
+        args.get(name) not in (None, "", False)
+        for name in ("id", "name", "filter", "limit", "offset", "sort")
+    ):
+        raise ValueError(
+            "Snapshot diffs compare whole collections; only --all is supported"
+        )
 
-    module = str(args["module"])
-    service = str(args["service"])
-    source_profile = str(args["from"])
-    target_profile = str(args["to"])
     match_by = str(args.get("match_by", "auto"))
-    include_paths = _parse_field_paths(args.get("fields"), flag_name="--fields")
-    ignore_paths = _parse_field_paths(
-        args.get("ignore_fields"), flag_name="--ignore-fields"
-    )
+    if match_by not in VALID_MATCH_MODES:
+        raise ValueError("--match-by must be one of: auto, name, id")
 
-    source_settings = load_settings_for_profile(source_profile)
-    target_settings = load_settings_for_profile(target_profile)
-    active_settings = settings or target_settings
-    mask_secrets = should_mask_secrets(args, active_settings)
-    catalog_view = str(args.get("catalog_view") or "visible").strip().lower()
-    if catalog_view not in {"visible", "full"}:
-        catalog_view = "visible"
-
-    source_cp = plugin.build_client(source_settings, mask_secrets=mask_secrets)
-    source_token = plugin.resolve_auth_token(source_cp, source_settings)
-    source_catalog = _load_catalog(
-        plugin,
-        source_cp,
-        source_token,
-        source_settings,
-        catalog_view=catalog_view,
-    )
 
-    target_cp = plugin.build_client(target_settings, mask_secrets=mask_secrets)
-    target_token = plugin.resolve_auth_token(target_cp, target_settings)
-    target_catalog = _load_catalog(
-        plugin,
-        target_cp,
-        target_token,
-        target_settings,
-        catalog_view=catalog_view,
+def _diff_service(
+    session: _CompareSession,
+    args: dict[str, Any],
+    module: str,
+    service: str,
+    *,
+    include_trie: _FieldTrie | None,
+    ignore_trie: _FieldTrie | None,
+    source_snapshot: str | None = None,
+    target_snapshot: str | None = None,
+    allow_empty: bool = False,
+) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    plugin = session.plugin
+    match_by = str(args.get("match_by", "auto"))
+    target_cp = session.target_cp
+    target_token = session.target_token
+    target_catalog = session.target_catalog
+    symmetric_scope = (
+        bool(source_snapshot or target_snapshot)
+        or bool(args.get("all"))
+        or bool(args.get("filter"))
     )
 
-    source_items = _fetch_source_items(
-        source_cp, source_token, source_catalog, module, service, args
-    )
-    if not source_items:
+    with ThreadPoolExecutor(max_workers=2) as executor:
+
+        def side_items(
+            snapshot_path: str | None,
+            cp,
+            token: str | None,
+            api_catalog: dict | None,
+            profile_settings: Settings | None,
+        ) -> Future:
+            if snapshot_path:
+                return executor.submit(_load_snapshot_items, snapshot_path)
+            return executor.submit(
+                _fetch_source_items,
+                cp,
+                token,
+                api_catalog,
+                module,
+                service,
+                args,
+                page_workers=resolve_page_workers(args, profile_settings),
+            )
+
+        source_future = side_items(
+            source_snapshot,
+            session.source_cp,
+            session.source_token,
+            session.source_catalog,
+            session.source_settings,
+        )
+        target_future = None
+        if symmetric_scope:
+            # The same selector runs against the target, so both listings can
+            # page at once.
+            target_future = side_items(
+                target_snapshot,
+                target_cp,
+                target_token,
+                target_catalog,
+                session.target_settings,
+            )
+        source_items = source_future.result()
+        target_items = target_future.result() if target_future is not None else []
+    if not source_items and not allow_empty:
         raise ValueError("No source objects matched the requested selector")
 
     diff_items: list[dict[str, Any]] = []
-    symmetric_scope = bool(args.get("all")) or bool(args.get("filter"))
 
     if symmetric_scope:
-        target_items = _fetch_source_items(
-            target_cp, target_token, target_catalog, module, service, args
-        )
         source_groups, source_no_key = _build_match_groups(source_items, match_by)
         target_groups, target_no_key = _build_match_groups(target_items, match_by)
 
@@ -635,8 +720,8 @@ def handle_diff_command(
                                 _normalize_diff_item(
                                     plugin, module, service, source_bucket[0]
                                 ),
-                                include_paths,
-                                ignore_paths,
+                                include_trie,
+                                ignore_trie,
                             )
                             if source_bucket
                             else None
@@ -646,8 +731,8 @@ def handle_diff_command(
                                 _normalize_diff_item(
                                     plugin, module, service, target_bucket[0]
                                 ),
-                                include_paths,
-                                ignore_paths,
+                                include_trie,
+                                ignore_trie,
                             )
                             if target_bucket
                             else None
@@ -664,15 +749,15 @@ def handle_diff_command(
                 target_item = target_bucket[0]
                 source_normalized = _apply_field_filters(
                     _normalize_diff_item(plugin, module, service, source_item),
-                    include_paths,
-                    ignore_paths,
+                    include_trie,
+                    ignore_trie,
                 )
                 target_normalized = _apply_field_filters(
                     _normalize_diff_item(plugin, module, service, target_item),
-                    include_paths,
-                    ignore_paths,
+                    include_trie,
+                    ignore_trie,
                 )
-                changed = _collect_changed_values(source_normalized, target_normalized)
+                changed = _changed_values(source_normalized, target_normalized)
                 status = "same" if not changed else "different"
                 diff_items.append(
                     _diff_entry(
@@ -704,8 +789,8 @@ def handle_diff_command(
                         target_item=None,
                         source_normalized=_apply_field_filters(
                             _normalize_diff_item(plugin, module, service, source_item),
-                            include_paths,
-                            ignore_paths,
+                            include_trie,
+                            ignore_trie,
                         ),
                         match_reason=(
                             f"no target object matched by {resolved_match}"
@@ -727,8 +812,8 @@ def handle_diff_command(
                     target_item=target_item,
                     target_normalized=_apply_field_filters(
                         _normalize_diff_item(plugin, module, service, target_item),
-                        include_paths,
-                        ignore_paths,
+                        include_trie,
+                        ignore_trie,
                     ),
                     match_reason=(
                         f"no source object matched by {resolved_match}"
@@ -750,8 +835,8 @@ def handle_diff_command(
                     target_item=None,
                     source_normalized=_apply_field_filters(
                         _normalize_diff_item(plugin, module, service, source_item),
-                        include_paths,
-                        ignore_paths,
+                        include_trie,
+                        ignore_trie,
                     ),
                     match_reason="no usable source match key",
                 )
@@ -769,8 +854,8 @@ def handle_diff_command(
                     target_item=target_item,
                     target_normalized=_apply_field_filters(
                         _normalize_diff_item(plugin, module, service, target_item),
-                        include_paths,
-                        ignore_paths,
+                        include_trie,
+                        ignore_trie,
                     ),
                     match_reason="no usable target match key",
                 )
@@ -780,8 +865,8 @@ def handle_diff_command(
             label = _copy_item_label(source_item)
             source_normalized = _apply_field_filters(
                 _normalize_diff_item(plugin, module, service, source_item),
-                include_paths,
-                ignore_paths,
+                include_trie,
+                ignore_trie,
             )
             match_detail = _resolve_match_detail(
                 target_cp,
@@ -827,10 +912,10 @@ def handle_diff_command(
 
             target_normalized = _apply_field_filters(
                 _normalize_diff_item(plugin, module, service, target_match),
-                include_paths,
-                ignore_paths,
+                include_trie,
+                ignore_trie,
             )
-            changed = _collect_changed_values(source_normalized, target_normalized)
+            changed = _changed_values(source_normalized, target_normalized)
             status = "same" if not changed else "different"
             diff_items.append(
                 _diff_entry(
@@ -864,13 +949,336 @@ def handle_diff_command(
             1 for item in diff_items if item["status"] == "ambiguous_match"
         ),
     }
+    return diff_items, summary
+
+
+def _validate_module_diff_args(args: dict[str, Any]) -> None:
+    source_profile = args.get("from")
+    target_profile = args.get("to")
+    if not source_profile or not target_profile:
+        raise ValueError("--from and --to are required for diff")
+    if source_profile == target_profile:
+        raise ValueError("--from and --to must be different profiles")
+    _require_known_profiles(str(source_profile), str(target_profile))
+
+    single_service_options = (
+        "id",
+        "name",
+        "filter",
+        "limit",
+        "offset",
+        "sort",
+        "from_snapshot",
+        "to_snapshot",
+    )
+    used = [
+        "--" + name.replace("_", "-")
+        for name in single_service_options
+        if args.get(name) not in (None, "", False)
+    ]
+    if used:
+        raise ValueError(
+            "Module diffs compare every object of every service; "
+            f"{', '.join(used)} only apply to single-service diffs"
+        )
+
+    match_by = str(args.get("match_by", "auto"))
+    if match_by not in VALID_MATCH_MODES:
+        raise ValueError("--match-by must be one of: auto, name, id")
+    _positive_int_arg(args, "service_workers", DEFAULT_SERVICE_WORKERS)
+
+
+def _parse_service_names(raw: Any) -> list[str]:
+    if raw in (None, "", True):
+        return []
+    names: list[str] = []
+    for part in str(raw).split(","):
+        name = part.strip()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def _module_diff_services(
+    source_catalog: dict,
+    target_catalog: dict,
+    module: str,
+    requested: list[str],
+) -> list[str]:
+    services = (source_catalog.get("modules") or {}).get(module)
+    if services is None:
+        raise ValueError(f"Unknown module '{module}'")
+    if not requested:
+        return [
+            service
+            for service in sorted(services)
+            if _has_action(source_catalog, module, service, "list")
+            and _has_action(target_catalog, module, service, "list")
+        ]
+
+    unknown = [service for service in requested if service not in services]
+    if unknown:
+        raise ValueError(
+            f"Unknown service(s) under module '{module}': {', '.join(unknown)}"
+        )
+    unlisted = [
+        service
+        for service in requested
+        if not (
+            _has_action(source_catalog, module, service, "list")
+            and _has_action(target_catalog, module, service, "list")
+        )
+    ]
+    if unlisted:
+        raise ValueError(
+            f"Service(s) cannot be listed on both profiles: {', '.join(unlisted)}"
+        )
+    return requested
+
+
+def _summarize_service_diffs(service_results: list[dict[str, Any]]) -> dict[str, int]:
+    summary = {
+        "services": len(service_results),
+        "services_completed": 0,
+        "services_failed": 0,
+        "compared": 0,
+        "only_in_source": 0,
+        "only_in_target": 0,
+        "different": 0,
+        "same": 0,
+        "ambiguous_match": 0,
+    }
+    for result in service_results:
+        summary[f"services_{result['status']}"] += 1
+        for key, value in (result.get("summary") or {}).items():
+            summary[key] += value
+    return summary
+
+
+def _emit_module_diff_summary(report: dict[str, Any]) -> None:
+    summary = report["summary"]
+    timings = report["timings"]
+    print("Diff completed")
+    print(f"Source profile: {report['source_profile']}")
+    print(f"Target profile: {report['target_profile']}")
+    print(f"Module: {report['module']}")
+    print(f"Match by: {report['match_by']}")
+    print(
+        f"Services: {summary['services']} "
+        f"(completed {summary['services_completed']}, "
+        f"failed {summary['services_failed']})"
+    )
+    for result in report["services"]:
+        elapsed = f"{result['elapsed_seconds']:.2f}s"
+        counts = result.get("summary")
+        if counts is None:
+            print(f"- {result['service']}: failed after {elapsed} ({result['reason']})")
+            continue
+        print(
+            f"- {result['service']}: compared {counts['compared']}, "
+            f"different {counts['different']}, "
+            f"only in source {counts['only_in_source']}, "
+            f"only in target {counts['only_in_target']}, "
+            f"ambiguous {counts['ambiguous_match']} ({elapsed})"
+        )
+    print(f"Compared: {summary['compared']}")
+    print(f"Only in source: {summary['only_in_source']}")
+    print(f"Only in target: {summary['only_in_target']}")
+    print(f"Different: {summary['different']}")
+    print(f"Same: {summary['same']}")
+    print(f"Ambiguous matches: {summary['ambiguous_match']}")
+    print(
+        f"Elapsed: {timings['total_seconds']:.2f}s "
+        f"(connect {timings['connect_seconds']:.2f}s)"
+    )
+    print(f"Report: {report['artifacts']['report']}")
+
+
+def _handle_module_diff(
+    args: dict[str, Any],
+    *,
+    settings: Settings | None,
+    plugin,
+) -> dict[str, Any]:
+    _validate_module_diff_args(args)
+
+    module = str(args["diff_module"])
+    match_by = str(args.get("match_by", "auto"))
+    include_paths = _parse_field_paths(args.get("fields"), flag_name="--fields")
+    ignore_paths = _parse_field_paths(
+        args.get("ignore_fields"), flag_name="--ignore-fields"
+    )
+    include_trie = _compile_field_trie(include_paths)
+    ignore_trie = _compile_field_trie(ignore_paths)
+
+    started = time.perf_counter()
+    session = _open_compare_session(
+        args,
+        source_settings=load_settings_for_profile(str(args["from"])),
+        target_settings=load_settings_for_profile(str(args["to"])),
+        settings=settings,
+        plugin=plugin,
+    )
+    connect_seconds = time.perf_counter() - started
+    services = _module_diff_services(
+        session.source_catalog,
+        session.target_catalog,
+        module,
+        _parse_service_names(args.get("services")),
+    )
+    if not services:
+        raise ValueError(f"No services in module '{module}' can be listed on both")
+
+    service_args = {**args, "all": True}
+
+    def run_service(service: str) -> dict[str, Any]:
+        service_started = time.perf_counter()
+        try:
+            diff_items, summary = _diff_service(
+                session,
+                service_args,
+                module,
+                service,
+                include_trie=include_trie,
+                ignore_trie=ignore_trie,
+                allow_empty=True,
+            )
+        except (requests.RequestException, ValueError) as exc:
+            return {
+                "service": service,
+                "status": "failed",
+                "reason": str(exc),
+                "elapsed_seconds": round(time.perf_counter() - service_started, 3),
+                "summary": None,
+                "items": [],
+            }
+        return {
+            "service": service,
+            "status": "completed",
+            "reason": None,
+            "elapsed_seconds": round(time.perf_counter() - service_started, 3),
+            "summary": summary,
+            "items": diff_items,
+        }
+
+    service_results = _run_service_schedule(
+        services,
+        {},
+        run_service,
+        workers=_positive_int_arg(args, "service_workers", DEFAULT_SERVICE_WORKERS),
+        continue_on_error=True,
+        block_dependents=False,
+    )
 
     out_path = str(args.get("out") or "").strip() or _default_artifact_path(
-        active_settings,
+        session.active_settings,
+        module,
+        "",
+        str(session.source_profile),
+        str(session.target_profile),
+        "diff",
+        timestamp=None,
+    )
+    report = {
+        "mode": "diff",
+        "module": module,
+        "service": None,
+        "source_profile": session.source_profile,
+        "target_profile": session.target_profile,
+        "match_by": match_by,
+        "field_filters": {
+            "fields": [_path_to_string(path) for path in include_paths],
+            "ignore_fields": [_path_to_string(path) for path in ignore_paths],
+        },
+        "summary": _summarize_service_diffs(service_results),
+        "timings": {
+            "connect_seconds": round(connect_seconds, 3),
+            "total_seconds": round(time.perf_counter() - started, 3),
+        },
+        "services": service_results,
+        "transport": _transport_stats(
+            source=session.source_cp, target=session.target_cp
+        ),
+        "artifacts": {"report": out_path},
+    }
+
+    write_value_to_file(
+        report,
+        out_path,
+        data_format="json",
+        mask_secrets=session.mask_secrets,
+    )
+    _emit_module_diff_summary(report)
+    return report
+
+
+def handle_diff_command(
+    args: dict[str, Any],
+    *,
+    settings: Settings | None,
+    plugin,
+) -> dict[str, Any]:
+    if args.get("diff_module"):
+        return _handle_module_diff(args, settings=settings, plugin=plugin)
+    if args.get("services") not in (None, ""):
+        raise ValueError(
+            f"--services only applies to module diffs: netloom {args.get('module')} "
+            "diff --from=... --to=..."
+        )
+
+    source_snapshot = str(args.get("from_snapshot") or "").strip() or None
+    target_snapshot = str(args.get("to_snapshot") or "").strip() or None
+    snapshot_mode = bool(source_snapshot or target_snapshot)
+    if snapshot_mode:
+        _validate_snapshot_diff_args(args)
+    else:
+        _validate_compare_args(
+            args,
+            module_key="module",
+            service_key="service",
+            operation_name="diff",
+        )
+
+    module = str(args["module"])
+    service = str(args["service"])
+    match_by = str(args.get("match_by", "auto"))
+    include_paths = _parse_field_paths(args.get("fields"), flag_name="--fields")
+    ignore_paths = _parse_field_paths(
+        args.get("ignore_fields"), flag_name="--ignore-fields"
+    )
+    include_trie = _compile_field_trie(include_paths)
+    ignore_trie = _compile_field_trie(ignore_paths)
+
+    source_settings = (
+        None if source_snapshot else load_settings_for_profile(str(args["from"]))
+    )
+    target_settings = (
+        None if target_snapshot else load_settings_for_profile(str(args["to"]))
+    )
+    session = _open_compare_session(
+        args,
+        source_settings=source_settings,
+        target_settings=target_settings,
+        settings=settings,
+        plugin=plugin,
+    )
+    diff_items, summary = _diff_service(
+        session,
+        args,
         module,
         service,
-        source_profile,
-        target_profile,
+        include_trie=include_trie,
+        ignore_trie=ignore_trie,
+        source_snapshot=source_snapshot,
+        target_snapshot=target_snapshot,
+    )
+
+    out_path = str(args.get("out") or "").strip() or _default_artifact_path(
+        session.active_settings,
+        module,
+        service,
+        session.source_profile or Path(str(source_snapshot)).stem,
+        session.target_profile or Path(str(target_snapshot)).stem,
         "diff",
         timestamp=None,
     )
@@ -878,8 +1286,10 @@ def handle_diff_command(
         "mode": "diff",
         "module": module,
         "service": service,
-        "source_profile": source_profile,
-        "target_profile": target_profile,
+        "source_profile": session.source_profile,
+        "target_profile": session.target_profile,
+        "source_snapshot": source_snapshot,
+        "target_snapshot": target_snapshot,
         "match_by": match_by,
         "field_filters": {
             "fields": [_path_to_string(path) for path in include_paths],
@@ -887,6 +1297,9 @@ def handle_diff_command(
         },
         "summary": summary,
         "items": diff_items,
+        "transport": _transport_stats(
+            source=session.source_cp, target=session.target_cp
+        ),
         "artifacts": {"report": out_path},
     }
 
@@ -894,7 +1307,7 @@ def handle_diff_command(
         report,
         out_path,
         data_format="json",
-        mask_secrets=mask_secrets,
+        mask_secrets=session.mask_secrets,
     )
     _emit_diff_summary(report)
     return report
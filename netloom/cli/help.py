@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from netloom.core.config import credentials_env_path, list_profiles, profiles_env_path
+from netloom.core.config import (
+    credentials_env_path,
+    daemon_socket_path,
+    list_profiles,
+    profiles_env_path,
+)
 from netloom.core.help import (
     NETLOOM_BANNER,
     render_action_block,
     render_cache_help,
     render_catalog_help,
     render_copy_builtin_help,
+    render_daemon_help,
     render_load_help,
     render_server_help,
     service_cli_actions,
@@ -34,6 +40,7 @@ def _render_usage(plugin=None) -> str:
         "  netloom load [list | show | <plugin>]",
         "  netloom server [list | show | use <profile>]",
         "  netloom cache [clear | update]",
+        "  netloom daemon [start | status | stop]",
         "  netloom <module> <service> <action> [options] [flags]",
         "  netloom <module> <service> copy --from=SOURCE --to=TARGET [options] [flags]",
         "  netloom copy <module> <service> --from=SOURCE --to=TARGET [options] [flags]",
@@ -92,6 +99,9 @@ def render_help(
     if module == "load":
         return render_load_help(header, usage, list_plugins())
 
+    if module == "daemon":
+        return render_daemon_help(header, usage, socket_path=daemon_socket_path())
+
     if module == "copy":
         return render_copy_builtin_help(header, usage)
 
@@ -9,6 +9,12 @@ from netloom import get_version
 from netloom.cli.commands import ACTIONS
 from netloom.cli.completion import print_completions
 from netloom.cli.copy import handle_copy_command
+from netloom.cli.daemon import (
+    WarmSessions,
+    forward_to_daemon,
+    handle_daemon_command,
+    is_forwardable,
+)
 from netloom.cli.diff import handle_diff_command
 from netloom.cli.help import render_help
 from netloom.cli.load import handle_load_command
@@ -44,7 +50,7 @@ def _completion_needs_catalog(words: list[str]) -> bool:
         return True
 
     module = positionals[0]
-    return module not in {"cache", "load", "server"}
+    return module not in {"cache", "daemon", "load", "server"}
 
 
 def _load_catalog_for_cli(
@@ -161,14 +167,24 @@ def main() -> None:
         complete(words)
         return
 
-    settings = load_settings()
+    args = parse_cli(sys.argv)
+    if is_forwardable(args):
+        exit_code = forward_to_daemon(args)
+        if exit_code is not None:
+            if exit_code:
+                raise SystemExit(exit_code)
+            return
+
+    run(args, load_settings())
+
+
+def run(args: dict, settings: Settings, sessions: WarmSessions | None = None) -> None:
     if not settings.verify_ssl:
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
     log_mgr = configure_logging(settings, root_name="netloom")
     log = log_mgr.get_logger(__name__)
 
-    args = parse_cli(sys.argv)
     active_settings = settings_with_cli_overrides(settings, args)
 
     log_level = args.get("log_level")
@@ -210,6 +226,12 @@ def main() -> None:
         )
         return
 
+    if args.get("module") == "daemon":
+        if handle_daemon_command(args, run):
+            return
+        print_help({"module": "daemon"}, settings=active_settings)
+        return
+
     try:
         plugin = get_plugin(None, settings=active_settings)
     except ValueError as exc:
@@ -249,6 +271,13 @@ def main() -> None:
     service = args.get("service")
     action = args.get("action")
 
+    if service == "copy" and not action:
+        handle_copy_command(args, settings=active_settings, plugin=plugin)
+        return
+    if service == "diff" and not action:
+        handle_diff_command(args, settings=active_settings, plugin=plugin)
+        return
+
     if not (module and service and action):
         print_help(args, plugin=plugin, settings=active_settings)
         return
@@ -268,19 +297,49 @@ def main() -> None:
         return
 
     mask_secrets = should_mask_secrets(args, active_settings)
-    cp = plugin.build_client(active_settings, mask_secrets=mask_secrets)
+    if sessions is None:
+        cp = plugin.build_client(active_settings, mask_secrets=mask_secrets)
+    else:
+        cp = sessions.client(plugin, active_settings, mask_secrets=mask_secrets)
     log.info(
         "Connecting via plugin '%s' to server: %s (SSL verify: %s)",
         plugin.name,
         active_settings.server,
         active_settings.verify_ssl,
     )
-    token = plugin.resolve_auth_token(cp, active_settings)
-    api_catalog = _get_catalog_for_cli(
-        plugin,
-        cp,
-        token=token,
-        settings=active_settings,
-        catalog_view=_catalog_view_from_args(args),
+    token = (
+        plugin.resolve_auth_token(cp, active_settings)
+        if sessions is None
+        else sessions.token(plugin, cp, active_settings)
+    )
+    catalog_view = _catalog_view_from_args(args)
+
+    def load_catalog() -> dict:
+        return _get_catalog_for_cli(
+            plugin,
+            cp,
+            token=token,
+            settings=active_settings,
+            catalog_view=catalog_view,
+        )
+
+    api_catalog = (
+        load_catalog()
+        if sessions is None
+        else sessions.catalog(plugin, active_settings, catalog_view, load_catalog)
     )
+    read_stats = getattr(cp, "transport_stats", None)
+    # A daemon's warm client keeps counting across commands.
+    baseline = read_stats() if read_stats is not None else {}
     command(cp, token, api_catalog, args, settings=active_settings)
+
+    stats = read_stats() if read_stats is not None else {}
+    stats = {key: value - baseline.get(key, 0) for key, value in stats.items()}
+    if stats.get("retries") or stats.get("throttled_requests"):
+        log.info(
+            "Transport: %s requests, %s retries, %s throttled for %.2fs",
+            stats["requests"],
+            stats["retries"],
+            stats["throttled_requests"],
+            stats["throttled_seconds"],
+        )
@@ -19,6 +19,9 @@ def parse_cli(argv: list[str]) -> dict:
         "decrypt",
         "dry_run",
         "continue_on_error",
+        "async",
+        "revalidate",
+        "allow_masked_secrets",
         "help",
     }
     valued_flags = {
@@ -67,6 +70,10 @@ def parse_cli(argv: list[str]) -> dict:
     else:
         if len(positionals) >= 2:
             args["service"] = positionals[1]
+            if positionals[1] == "copy" and len(positionals) == 2:
+                args["copy_module"] = positionals[0]
+            if positionals[1] == "diff" and len(positionals) == 2:
+                args["diff_module"] = positionals[0]
         if len(positionals) >= 3:
             args["action"] = positionals[2]
             if positionals[2] == "copy":
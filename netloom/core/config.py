@@ -10,6 +10,7 @@ APP_NAME = "netloom"
 ACTIVE_PROFILE_ENV = "NETLOOM_ACTIVE_PROFILE"
 ACTIVE_PLUGIN_ENV = "NETLOOM_ACTIVE_PLUGIN"
 CONFIG_DIR_ENV = "NETLOOM_CONFIG_DIR"
+DAEMON_SOCKET_ENV = "NETLOOM_DAEMON_SOCKET"
 CONFIG_FILE_NAME = "config.env"
 PLUGINS_DIR_NAME = "plugins"
 DEFAULTS_FILE_NAME = "defaults.env"
@@ -20,6 +21,13 @@ DEFAULT_FORMAT = "json"
 DEFAULT_HTTPS_PREFIX = "https://"
 DEFAULT_LOG_LEVEL = "INFO"
 DEFAULT_PLUGIN = None
+DEFAULT_PAGE_WORKERS = 1
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_SIZE = 16
+DEFAULT_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 0.5
+DEFAULT_RETRY_BACKOFF_MAX = 30.0
+DEFAULT_TOKEN_REFRESH_MARGIN = 60
 PROFILE_SCOPED_ENV_KEYS = (
     "NETLOOM_SERVER",
     "NETLOOM_HTTPS_PREFIX",
@@ -30,6 +38,20 @@ PROFILE_SCOPED_ENV_KEYS = (
     "NETLOOM_DATA_FORMAT",
     "NETLOOM_CSV_FIELDNAMES",
     "NETLOOM_LOG_LEVEL",
+    "NETLOOM_PAGE_WORKERS",
+    "NETLOOM_POOL_CONNECTIONS",
+    "NETLOOM_POOL_SIZE",
+    "NETLOOM_KEEP_ALIVE",
+    "NETLOOM_TCP_KEEPALIVE",
+    "NETLOOM_RETRIES",
+    "NETLOOM_RETRY_BACKOFF",
+    "NETLOOM_RETRY_BACKOFF_MAX",
+    "NETLOOM_RETRY_WRITES",
+    "NETLOOM_RATE_LIMIT",
+    "NETLOOM_RATE_BURST",
+    "NETLOOM_CATALOG_STALE_WHILE_REVALIDATE",
+    "NETLOOM_TOKEN_CACHE",
+    "NETLOOM_TOKEN_REFRESH_MARGIN",
     "NETLOOM_API_TOKEN",
     "NETLOOM_API_TOKEN_FILE",
     "NETLOOM_TOKEN",
@@ -79,6 +101,7 @@ RESERVED_ARGS = {
     "token_file",
     "api_token_file",
     "catalog_view",
+    "page_workers",
     "_complete",
     "_cword",
     "_cur",
@@ -97,6 +120,12 @@ def _int_value(raw: str | None, default: int) -> int:
     return int(raw)
 
 
+def _float_value(raw: str | None, default: float) -> float:
+    if raw is None or raw.strip() == "":
+        return default
+    return float(raw)
+
+
 def _xdg_cache_home() -> Path:
     return Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
 
@@ -116,6 +145,21 @@ def config_dir() -> Path:
     return _xdg_config_home() / APP_NAME
 
 
+def daemon_socket_path() -> Path:
+    # Resolved from the environment alone: the client checks for a daemon
+    # before it reads any config file.
+    override = os.getenv(DAEMON_SOCKET_ENV)
+    if override:
+        return Path(override).expanduser()
+    state_override = os.getenv("NETLOOM_STATE_DIR")
+    state_dir = (
+        Path(state_override).expanduser()
+        if state_override
+        else _xdg_state_home() / APP_NAME
+    )
+    return state_dir / "daemon.sock"
+
+
 def config_env_path() -> Path:
     return config_dir() / CONFIG_FILE_NAME
 
@@ -506,6 +550,20 @@ class Settings:
     log_level: str = DEFAULT_LOG_LEVEL
     log_file: Path | None = None
     log_to_file: bool = False
+    page_workers: int = DEFAULT_PAGE_WORKERS
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS
+    pool_size: int = DEFAULT_POOL_SIZE
+    keep_alive: bool = True
+    tcp_keepalive: int = 0
+    retries: int = DEFAULT_RETRIES
+    retry_backoff: float = DEFAULT_RETRY_BACKOFF
+    retry_backoff_max: float = DEFAULT_RETRY_BACKOFF_MAX
+    retry_writes: bool = False
+    rate_limit: float = 0.0
+    rate_burst: int = 0
+    catalog_stale_while_revalidate: bool = False
+    token_cache: bool = False
+    token_refresh_margin: int = DEFAULT_TOKEN_REFRESH_MARGIN
     grant_type: str = "client_credentials"
     client_id: str | None = None
     client_secret: str | None = None
@@ -649,6 +707,82 @@ def _build_settings_from_values(
         ).upper(),
         log_file=log_file,
         log_to_file=log_to_file,
+        page_workers=_int_value(
+            _resolve_value(
+                "NETLOOM_PAGE_WORKERS", values, active_profile=active_profile
+            ),
+            DEFAULT_PAGE_WORKERS,
+        ),
+        pool_connections=_int_value(
+            _resolve_value(
+                "NETLOOM_POOL_CONNECTIONS", values, active_profile=active_profile
+            ),
+            DEFAULT_POOL_CONNECTIONS,
+        ),
+        pool_size=_int_value(
+            _resolve_value("NETLOOM_POOL_SIZE", values, active_profile=active_profile),
+            DEFAULT_POOL_SIZE,
+        ),
+        keep_alive=_bool_value(
+            _resolve_value("NETLOOM_KEEP_ALIVE", values, active_profile=active_profile),
+            True,
+        ),
+        tcp_keepalive=_int_value(
+            _resolve_value(
+                "NETLOOM_TCP_KEEPALIVE", values, active_profile=active_profile
+            ),
+            0,
+        ),
+        retries=_int_value(
+            _resolve_value("NETLOOM_RETRIES", values, active_profile=active_profile),
+            DEFAULT_RETRIES,
+        ),
+        retry_backoff=_float_value(
+            _resolve_value(
+                "NETLOOM_RETRY_BACKOFF", values, active_profile=active_profile
+            ),
+            DEFAULT_RETRY_BACKOFF,
+        ),
+        retry_backoff_max=_float_value(
+            _resolve_value(
+                "NETLOOM_RETRY_BACKOFF_MAX", values, active_profile=active_profile
+            ),
+            DEFAULT_RETRY_BACKOFF_MAX,
+        ),
+        retry_writes=_bool_value(
+            _resolve_value(
+                "NETLOOM_RETRY_WRITES", values, active_profile=active_profile
+            ),
+            False,
+        ),
+        rate_limit=_float_value(
+            _resolve_value("NETLOOM_RATE_LIMIT", values, active_profile=active_profile),
+            0.0,
+        ),
+        rate_burst=_int_value(
+            _resolve_value("NETLOOM_RATE_BURST", values, active_profile=active_profile),
+            0,
+        ),
+        catalog_stale_while_revalidate=_bool_value(
+            _resolve_value(
+                "NETLOOM_CATALOG_STALE_WHILE_REVALIDATE",
+                values,
+                active_profile=active_profile,
+            ),
+            False,
+        ),
+        token_cache=_bool_value(
+            _resolve_value(
+                "NETLOOM_TOKEN_CACHE", values, active_profile=active_profile
+            ),
+            False,
+        ),
+        token_refresh_margin=_int_value(
+            _resolve_value(
+                "NETLOOM_TOKEN_REFRESH_MARGIN", values, active_profile=active_profile
+            ),
+            DEFAULT_TOKEN_REFRESH_MARGIN,
+        ),
         grant_type=_resolve_value(
             "NETLOOM_GRANT_TYPE", values, active_profile=active_profile
         )
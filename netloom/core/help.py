@@ -12,7 +12,7 @@ NETLOOM_BANNER = r"""
 |_| \_|\___|\__|_|\___/ \___/|_| |_| |_|
 """.strip("\n")
 PLUGIN_SELECTION_HINT = "<select a plugin with `netloom load <plugin>`>"
-BUILTIN_MODULES = ["cache", "copy", "load", "server"]
+BUILTIN_MODULES = ["cache", "copy", "daemon", "load", "server"]
 
 
 def service_cli_actions(service_entry: dict) -> list[str]:
@@ -47,13 +47,74 @@ def render_copy_action_help(module: str, service: str) -> str:
         "    - --match-by=auto|name|id\n"
         "    - --dry-run\n"
         "    - --continue-on-error\n"
+        "    - --parallel=N  (apply up to N plan items concurrently)\n"
+        "    - --async  (read source pages and apply writes on one event loop)\n"
         "    - --decrypt\n"
+        "  apply a saved plan (target only, no source reads):\n"
+        "    - --from-plan=PATH --to=TARGET_PROFILE\n"
+        "    - --revalidate  (re-check target matches with one listing)\n"
+        "    - --allow-masked-secrets  (apply writes whose secrets were masked)\n"
         "  artifacts:\n"
         "    - --out=PATH\n"
         "    - --save-source=PATH  (default: NETLOOM_OUT_DIR/<generated>_source.json)\n"
         "    - --save-payload=PATH "
         "(default: NETLOOM_OUT_DIR/<generated>_payload.json)\n"
-        "    - --save-plan=PATH    (default: NETLOOM_OUT_DIR/<generated>_plan.json)"
+        "    - --save-plan=PATH    (default: NETLOOM_OUT_DIR/<generated>_plan.json)\n"
+        "    - journal: NETLOOM_OUT_DIR/<generated>_journal.ndjson\n"
+        "    - --resume=JOURNAL  (skip items the journal records as completed)"
+    )
+
+
+def render_module_copy_help(module: str) -> str:
+    return (
+        f"copy ({module}, all services):\n"
+        "  usage: netloom <module> copy --from=SOURCE_PROFILE "
+        "--to=TARGET_PROFILE [options]\n"
+        "  legacy alias: netloom copy <module> --from=SOURCE_PROFILE "
+        "--to=TARGET_PROFILE [options]\n"
+        "  scope:\n"
+        "    - every object of every service that the source can list and the "
+        "target can add\n"
+        "    - services run after the services they reference where the plugin "
+        "maps them; other services run in no particular order\n"
+        "  behavior:\n"
+        "    - --on-conflict=fail|skip|update|replace\n"
+        "    - --match-by=auto|name|id\n"
+        "    - --dry-run\n"
+        "    - --continue-on-error  (keep going; dependents of a failed service "
+        "are still skipped)\n"
+        "    - --service-workers=N  (copy up to N independent services at once, "
+        "default 4)\n"
+        "    - --parallel=N  (apply up to N plan items concurrently per service)\n"
+        "    - --async  (read source pages and apply writes on one event loop)\n"
+        "    - --decrypt\n"
+        "  artifacts:\n"
+        "    - --out=PATH  (aggregated report)\n"
+        "    - per service: NETLOOM_OUT_DIR/<generated>_{source,payload,plan}.json "
+        "and _journal.ndjson"
+    )
+
+
+def render_module_diff_help(module: str) -> str:
+    return (
+        f"diff ({module}, all services):\n"
+        "  usage: netloom <module> diff --from=SOURCE_PROFILE "
+        "--to=TARGET_PROFILE [options]\n"
+        "  scope:\n"
+        "    - every object of every service both profiles can list\n"
+        "    - --services=a,b,c  (limit the diff to these services)\n"
+        "  behavior:\n"
+        "    - --match-by=auto|name|id\n"
+        "    - --fields=path1,path2\n"
+        "    - --ignore-fields=path1,path2\n"
+        "    - --service-workers=N  (diff up to N services at once, default 4)\n"
+        "  notes:\n"
+        "    each profile is authenticated once and its catalog shared by all "
+        "services\n"
+        "    a failed service is reported and the others still run\n"
+        "  output:\n"
+        "    - --out=PATH (default: NETLOOM_OUT_DIR/<generated>_diff.json)\n"
+        "    - aggregated report with per-service summaries and timings"
     )
 
 
@@ -67,6 +128,9 @@ def render_diff_action_help(module: str, service: str) -> str:
         "    - --name=VALUE\n"
         "    - --filter=JSON\n"
         "    - --all\n"
+        "  offline sides (JSON or NDJSON exports, whole collections):\n"
+        "    - --from-snapshot=PATH  (instead of --from)\n"
+        "    - --to-snapshot=PATH    (instead of --to)\n"
         "  behavior:\n"
         "    - --match-by=auto|name|id\n"
         "    - --fields=path1,path2\n"
@@ -192,6 +256,22 @@ def render_cache_help(header: str, usage: str) -> str:
     )
 
 
+def render_daemon_help(header: str, usage: str, *, socket_path: Path) -> str:
+    return (
+        header
+        + usage
+        + "\nBuilt-in module: daemon\n"
+        + "Commands:\n"
+        + "  netloom daemon start [--idle-timeout=SECONDS]\n"
+        + "  netloom daemon status\n"
+        + "  netloom daemon stop\n\n"
+        + "While the daemon runs, <module> <service> <action> commands are\n"
+        + "forwarded to it and reuse its clients, tokens and parsed catalogs.\n"
+        + "cache, copy, diff, load and server always run in-process.\n"
+        + f"Socket: {socket_path}  (override with NETLOOM_DAEMON_SOCKET)"
+    )
+
+
 def render_server_help(
     header: str,
     usage: str,
@@ -244,7 +324,9 @@ def render_copy_builtin_help(header: str, usage: str) -> str:
         + "  netloom copy <module> <service> --from=SOURCE_PROFILE "
         "--to=TARGET_PROFILE [options]\n"
         + "  netloom <module> <service> copy --from=SOURCE_PROFILE "
-        "--to=TARGET_PROFILE [options]\n\n"
+        "--to=TARGET_PROFILE [options]\n"
+        + "  netloom <module> copy --from=SOURCE_PROFILE --to=TARGET_PROFILE "
+        "[options]  (all services, dependency ordered)\n\n"
         + "Selectors:\n"
         + "  --id=VALUE\n"
         + "  --name=VALUE\n"
@@ -255,12 +337,21 @@ def render_copy_builtin_help(header: str, usage: str) -> str:
         + "  --match-by=auto|name|id\n"
         + "  --dry-run\n"
         + "  --continue-on-error\n"
+        + "  --parallel=N  (apply up to N plan items concurrently)\n"
+        + "  --async  (read source pages and apply writes on one event loop)\n"
+        + "  --service-workers=N  (module copy: services copied at once, default 4)\n"
         + "  --decrypt\n\n"
+        + "Apply a saved plan:\n"
+        + "  --from-plan=PATH --to=TARGET_PROFILE  (no source reads)\n"
+        + "  --revalidate  (re-check target matches with one listing)\n"
+        + "  --allow-masked-secrets  (apply writes whose secrets were masked)\n\n"
         + "Artifacts:\n"
         + "  --out=PATH\n"
         + "  --save-source=PATH  (default: NETLOOM_OUT_DIR/<generated>_source.json)\n"
         + "  --save-payload=PATH (default: NETLOOM_OUT_DIR/<generated>_payload.json)\n"
         + "  --save-plan=PATH    (default: NETLOOM_OUT_DIR/<generated>_plan.json)\n"
+        + "  journal: NETLOOM_OUT_DIR/<generated>_journal.ndjson\n"
+        + "  --resume=JOURNAL  (skip items the journal records as completed)\n"
     )
 
 
@@ -308,8 +399,15 @@ def render_catalog_help(
             header
             + usage
             + f"\nModule: {module}\nAvailable services:\n{available_services}"
+            + f"\nCopy every service: netloom {module} copy --from=... --to=..."
+            + f"\nDiff every service: netloom {module} diff --from=... --to=..."
         )
 
+    if service == "copy" and service not in services:
+        return render_module_copy_help(module)
+    if service == "diff" and service not in services:
+        return render_module_diff_help(module)
+
     if service not in services:
         available = ", ".join(sorted(services.keys()))
         return (
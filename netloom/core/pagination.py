@@ -1,13 +1,31 @@
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
 from typing import Any
 
+from netloom.core.config import DEFAULT_PAGE_WORKERS, Settings
 from netloom.core.resolver import query_params_for_action
 
 DEFAULT_PAGE_SIZE = 1000
 
 
+def resolve_page_workers(args: dict[str, Any], settings: Settings | None) -> int:
+    raw = args.get("page_workers")
+    if raw in (None, ""):
+        raw = getattr(settings, "page_workers", DEFAULT_PAGE_WORKERS)
+    try:
+        workers = int(raw)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("--page-workers must be a positive integer") from exc
+    if workers < 1:
+        raise ValueError("--page-workers must be a positive integer")
+    return workers
+
+
 def _extract_items(response: Any) -> list[Any] | None:
     if isinstance(response, dict):
         embedded = response.get("_embedded")
@@ -60,7 +78,9 @@ def _merge_list_responses(
     return first_response
 
 
-def fetch_all_list_results(cp, token: str, api_catalog: dict, args: dict[str, Any]):
+def _prepare_list_params(
+    cp, api_catalog: dict, args: dict[str, Any]
+) -> tuple[dict[str, Any], bool]:
     params = query_params_for_action(cp, api_catalog, args, "list")
     action_def = cp.get_action_definition(
         api_catalog, args["module"], args["service"], "list"
@@ -77,20 +97,95 @@ def fetch_all_list_results(cp, token: str, api_catalog: dict, args: dict[str, An
     if "offset" in allowed and "offset" not in params:
         params["offset"] = 0
 
-    response = cp.list(api_catalog, token, args, params=params or None)
-    page_items = _extract_items(response)
-    if page_items is None or "limit" not in allowed or "offset" not in allowed:
-        return response
-    if explicit_limit:
-        return response
+    paginate = "limit" in allowed and "offset" in allowed and not explicit_limit
+    return params, paginate
 
-    all_items = list(page_items)
-    total_count = _extract_total_count(response)
+
+def _iter_concurrent_pages(
+    cp,
+    token: str,
+    api_catalog: dict,
+    args: dict[str, Any],
+    params: dict[str, Any],
+    *,
+    start_offset: int,
+    total_count: int,
+    page_size: int,
+    max_workers: int,
+) -> Iterator[list[Any]]:
+    offsets = iter(range(start_offset, total_count, page_size))
+
+    def fetch_page(offset: int) -> list[Any] | None:
+        page_params = dict(params)
+        page_params["offset"] = offset
+        if "calculate_count" in page_params:
+            page_params["calculate_count"] = "false"
+        return _extract_items(
+            cp.list(api_catalog, token, args, params=page_params or None)
+        )
+
+    pending: deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            # Keep at most max_workers pages in flight and hand them out in
+            # offset order, so a slow consumer does not buffer the whole table.
+            for offset in offsets:
+                pending.append(executor.submit(fetch_page, offset))
+                if len(pending) >= max_workers:
+                    break
+            while pending:
+                page_items = pending.popleft().result()
+                if not page_items:
+                    return
+                yield page_items
+                if len(page_items) < page_size:
+                    return
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(executor.submit(fetch_page, next_offset))
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _iter_following_pages(
+    cp,
+    token: str,
+    api_catalog: dict,
+    args: dict[str, Any],
+    params: dict[str, Any],
+    *,
+    first_items: list[Any],
+    total_count: int | None,
+    max_workers: int,
+) -> Iterator[tuple[list[Any], int | None]]:
     page_size = int(params["limit"])
     current_offset = int(params.get("offset", 0))
+    seen = len(first_items)
+    page_items = first_items
+
+    if (
+        max_workers > 1
+        and total_count is not None
+        and len(page_items) >= page_size
+        and current_offset + len(page_items) < total_count
+    ):
+        for page_items in _iter_concurrent_pages(
+            cp,
+            token,
+            api_catalog,
+            args,
+            params,
+            start_offset=current_offset + len(page_items),
+            total_count=total_count,
+            page_size=page_size,
+            max_workers=max_workers,
+        ):
+            yield page_items, None
+        return
 
     while True:
-        if total_count is not None and len(all_items) >= total_count:
+        if total_count is not None and seen >= total_count:
             break
         if len(page_items) < page_size:
             break
@@ -109,10 +204,141 @@ def fetch_all_list_results(cp, token: str, api_catalog: dict, args: dict[str, An
         if page_items is None or not page_items:
             break
 
-        all_items.extend(page_items)
+        seen += len(page_items)
         current_offset = next_offset
+        page_count = _extract_total_count(next_response)
+        if total_count is None:
+            total_count = page_count
+        yield page_items, page_count
+
+
+def iter_list_pages(
+    cp,
+    token: str,
+    api_catalog: dict,
+    args: dict[str, Any],
+    *,
+    max_workers: int = DEFAULT_PAGE_WORKERS,
+) -> Iterator[list[Any]]:
+    params, paginate = _prepare_list_params(cp, api_catalog, args)
+    response = cp.list(api_catalog, token, args, params=params or None)
+    page_items = _extract_items(response)
+    if page_items is None:
+        if response is not None:
+            yield [response]
+        return
+
+    yield page_items
+    if not paginate:
+        return
+
+    for next_items, _ in _iter_following_pages(
+        cp,
+        token,
+        api_catalog,
+        args,
+        params,
+        first_items=page_items,
+        total_count=_extract_total_count(response),
+        max_workers=max_workers,
+    ):
+        yield next_items
+
 
+def iter_list_items(
+    cp,
+    token: str,
+    api_catalog: dict,
+    args: dict[str, Any],
+    *,
+    max_workers: int = DEFAULT_PAGE_WORKERS,
+) -> Iterator[Any]:
+    for page in iter_list_pages(cp, token, api_catalog, args, max_workers=max_workers):
+        yield from page
+
+
+def fetch_all_list_results(
+    cp,
+    token: str,
+    api_catalog: dict,
+    args: dict[str, Any],
+    *,
+    max_workers: int = DEFAULT_PAGE_WORKERS,
+):
+    params, paginate = _prepare_list_params(cp, api_catalog, args)
+    response = cp.list(api_catalog, token, args, params=params or None)
+    page_items = _extract_items(response)
+    if page_items is None or not paginate:
+        return response
+
+    all_items = list(page_items)
+    total_count = _extract_total_count(response)
+    for next_items, page_count in _iter_following_pages(
+        cp,
+        token,
+        api_catalog,
+        args,
+        params,
+        first_items=page_items,
+        total_count=total_count,
+        max_workers=max_workers,
+    ):
+        all_items.extend(next_items)
         if total_count is None:
-            total_count = _extract_total_count(next_response)
+            total_count = page_count
 
     return _merge_list_responses(response, all_items, total_count=total_count)
+
+
+async def fetch_list_items_async(
+    cp,
+    token: str,
+    api_catalog: dict,
+    args: dict[str, Any],
+) -> list[Any]:
+    params, paginate = _prepare_list_params(cp, api_catalog, args)
+    response = await cp.list(api_catalog, token, args, params=params or None)
+    page_items = _extract_items(response)
+    if page_items is None:
+        return [] if response is None else [response]
+
+    all_items = list(page_items)
+    if not paginate:
+        return all_items
+
+    page_size = int(params["limit"])
+    current_offset = int(params.get("offset", 0))
+    total_count = _extract_total_count(response)
+
+    async def fetch_page(offset: int, *, counted: bool) -> list[Any]:
+        page_params = dict(params)
+        page_params["offset"] = offset
+        if "calculate_count" in page_params and counted:
+            page_params["calculate_count"] = "false"
+        page = await cp.list(api_catalog, token, args, params=page_params or None)
+        return _extract_items(page) or []
+
+    if total_count is not None:
+        if len(page_items) < page_size:
+            return all_items
+        # The client bounds how many requests are actually in flight, so every
+        # remaining page can be scheduled at once.
+        pages = await asyncio.gather(
+            *(
+                fetch_page(offset, counted=True)
+                for offset in range(
+                    current_offset + len(page_items), total_count, page_size
+                )
+            )
+        )
+        for page in pages:
+            all_items.extend(page)
+            if len(page) < page_size:
+                break
+        return all_items
+
+    while len(page_items) >= page_size:
+        current_offset += len(page_items)
+        page_items = await fetch_page(current_offset, counted=False)
+        all_items.extend(page_items)
+    return all_items
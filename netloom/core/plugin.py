@@ -21,6 +21,8 @@ class PluginDefinition:
     preflight_error_for_payload: Callable[..., str | None]
     help_context: Callable[[], dict[str, Any]] | None = None
     normalize_diff_item: Callable[..., Any] | None = None
+    copy_service_dependencies: Callable[[str], dict[str, set[str]]] | None = None
+    build_async_client: Callable[..., Any] | None = None
 
 
 def _registry() -> dict[str, PluginDefinition]:
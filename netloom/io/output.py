@@ -3,14 +3,18 @@ from __future__ import annotations
 import csv
 import json
 import logging
+import sys
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator, TextIO
 
 from netloom.core.config import SECRET_FIELDS, Settings
 from netloom.io.files import ensure_parent_dir
 
 log = logging.getLogger(__name__)
 
+STREAM_FORMATS = {"json", "ndjson", "csv"}
+DEFAULT_STREAM_FLUSH_ITEMS = 1000
+
 
 def should_mask_secrets(args: dict | None, settings: Settings) -> bool:
     if not args:
@@ -77,6 +81,124 @@ def _console_text_for_raw_bytes(value: bytes) -> str:
     return decoded
 
 
+def _rows_for_value(value: Any, items_path: tuple[str | int, ...]) -> list[Any]:
+    if isinstance(value, dict):
+        extracted = _extract_by_path(value, items_path)
+        if isinstance(extracted, list):
+            return extracted
+        return [value]
+    if isinstance(value, list):
+        return value
+    return [{"value": value}]
+
+
+class _TeeWriter:
+    def __init__(self, handle: TextIO, console: TextIO | None):
+        self.handle = handle
+        self.console = console
+
+    def write(self, text: str) -> int:
+        self.handle.write(text)
+        if self.console is not None:
+            self.console.write(text)
+        return len(text)
+
+    def flush(self) -> None:
+        self.handle.flush()
+        if self.console is not None:
+            self.console.flush()
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    chunk: list[Any] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def write_pages_to_file(
+    pages: Iterable[Iterable[Any]],
+    path: str | Path,
+    *,
+    data_format: str = "ndjson",
+    csv_fieldnames: list[str] | None = None,
+    also_console: bool = False,
+    mask_secrets: bool = True,
+) -> int:
+    if data_format not in STREAM_FORMATS:
+        raise ValueError("data_format must be 'json', 'ndjson', or 'csv'")
+
+    path = Path(path)
+    ensure_parent_dir(path)
+    count = 0
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        out = _TeeWriter(handle, sys.stdout if also_console else None)
+        csv_writer = None
+        if data_format == "json":
+            out.write("[")
+        for page in pages:
+            for item in page:
+                safe_item = sanitize_secrets(item, mask_secrets=mask_secrets)
+                if data_format == "json":
+                    text = json.dumps(safe_item, indent=2, ensure_ascii=False)
+                    prefix = ",\n  " if count else "\n  "
+                    out.write(prefix + text.replace("\n", "\n  "))
+                elif data_format == "ndjson":
+                    out.write(json.dumps(safe_item, ensure_ascii=False) + "\n")
+                else:
+                    if csv_writer is None:
+                        if isinstance(safe_item, dict):
+                            fieldnames = csv_fieldnames or list(safe_item.keys())
+                            csv_writer = csv.DictWriter(
+                                out,
+                                fieldnames=fieldnames,
+                                lineterminator="\n",
+                                extrasaction="ignore",
+                            )
+                            csv_writer.writeheader()
+                        else:
+                            csv_writer = csv.writer(out, lineterminator="\n")
+                            csv_writer.writerow(["value"])
+                    if isinstance(csv_writer, csv.DictWriter):
+                        csv_writer.writerow(
+                            safe_item if isinstance(safe_item, dict) else {}
+                        )
+                    else:
+                        csv_writer.writerow([safe_item])
+                count += 1
+            out.flush()
+        if data_format == "json":
+            out.write("\n]\n" if count else "]\n")
+        out.flush()
+
+    log.debug("Wrote file to %s", path)
+    return count
+
+
+def write_items_to_file(
+    items: Iterable[Any],
+    path: str | Path,
+    *,
+    data_format: str = "ndjson",
+    csv_fieldnames: list[str] | None = None,
+    also_console: bool = False,
+    mask_secrets: bool = True,
+    flush_every: int = DEFAULT_STREAM_FLUSH_ITEMS,
+) -> int:
+    return write_pages_to_file(
+        _chunked(items, flush_every) if flush_every else [items],
+        path,
+        data_format=data_format,
+        csv_fieldnames=csv_fieldnames,
+        also_console=also_console,
+        mask_secrets=mask_secrets,
+    )
+
+
 def write_value_to_file(
     value: Any,
     path: str | Path,
@@ -91,8 +213,8 @@ def write_value_to_file(
 ) -> None:
     if mode not in {"a", "w"}:
         raise ValueError("mode must be 'a' or 'w'")
-    if data_format not in {"json", "csv", "raw"}:
-        raise ValueError("data_format must be 'json', 'csv', or 'raw'")
+    if data_format not in {"json", "ndjson", "csv", "raw"}:
+        raise ValueError("data_format must be 'json', 'ndjson', 'csv', or 'raw'")
 
     path = Path(path)
     ensure_parent_dir(path)
@@ -110,6 +232,17 @@ def write_value_to_file(
                 print(json.dumps(safe_value, indent=2, ensure_ascii=False))
             else:
                 print(safe_value)
+    elif data_format == "ndjson":
+        lines = [
+            json.dumps(row, ensure_ascii=False)
+            for row in _rows_for_value(safe_value, items_path)
+        ]
+        with path.open(mode, encoding="utf-8") as handle:
+            for line in lines:
+                handle.write(f"{line}\n")
+        if also_console:
+            for line in lines:
+                print(line)
     elif data_format == "raw":
         if isinstance(safe_value, bytes):
             binary_mode = "ab" if mode == "a" else "wb"
@@ -124,17 +257,7 @@ def write_value_to_file(
             if also_console:
                 print(text)
     else:
-        rows = None
-        if isinstance(safe_value, dict):
-            extracted = _extract_by_path(safe_value, items_path)
-            if isinstance(extracted, list):
-                rows = extracted
-        if rows is None and isinstance(safe_value, list):
-            rows = safe_value
-        if rows is None and isinstance(safe_value, dict):
-            rows = [safe_value]
-        if rows is None:
-            rows = [{"value": safe_value}]
+        rows = _rows_for_value(safe_value, items_path)
         if not rows:
             return
 
@@ -191,11 +314,25 @@ def log_to_file(
     csv_include_header: bool = True,
     items_path: tuple[str | int, ...] = ("_embedded", "items"),
     mask_secrets: bool = True,
+    stream: bool = False,
     **kwargs,
 ):
     if filename is None:
         raise ValueError("filename must be provided")
 
+    if stream:
+        # Pages are written and flushed as they arrive and are not kept, so
+        # there is no merged result to hand back.
+        write_pages_to_file(
+            thing,
+            filename,
+            data_format=data_format,
+            csv_fieldnames=csv_fieldnames,
+            also_console=also_console,
+            mask_secrets=mask_secrets,
+        )
+        return None
+
     if callable(thing):
         result = thing(*args, **kwargs)
         if result is not None:
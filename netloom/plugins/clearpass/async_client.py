@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from netloom.core.config import DEFAULT_POOL_SIZE, Settings
+from netloom.plugins.clearpass.client import ClearPassClient
+
+
+class AsyncClearPassClient:
+    def __init__(
+        self, client: ClearPassClient, *, max_in_flight: int = DEFAULT_POOL_SIZE
+    ):
+        # The blocking transport runs on a bounded pool sized to the client's
+        # connection pool, so every in-flight request has a connection to reuse.
+        self.client = client
+        self.max_in_flight = max(1, max_in_flight)
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def server(self) -> str:
+        return self.client.server
+
+    @property
+    def last_response_meta(self):
+        return self.client.last_response_meta
+
+    async def __aenter__(self) -> "AsyncClearPassClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def _run(self, func, *args, **kwargs):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_in_flight, thread_name_prefix="netloom-http"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(func, *args, **kwargs)
+        )
+
+    def get_action_definition(
+        self, api_catalog: dict, module: str, service: str, action: str
+    ) -> dict:
+        return self.client.get_action_definition(api_catalog, module, service, action)
+
+    def resolve_action(
+        self, api_catalog: dict, module: str, service: str, action: str, args: dict
+    ) -> tuple[dict, str, list[str]]:
+        return self.client.resolve_action(api_catalog, module, service, action, args)
+
+    def transport_stats(self) -> dict[str, float]:
+        return self.client.transport_stats()
+
+    async def request_path(
+        self,
+        method: str,
+        path: str,
+        *,
+        token: str | None = None,
+        params: dict | None = None,
+        json_body: dict | None = None,
+    ):
+        return await self._run(
+            self.client.request_path,
+            method,
+            path,
+            token=token,
+            params=params,
+            json_body=json_body,
+        )
+
+    async def request_action(
+        self,
+        api_catalog: dict,
+        action: str,
+        token: str,
+        args: dict,
+        *,
+        params: dict | None = None,
+        json_body: dict | None = None,
+    ):
+        return await self._run(
+            self.client.request_action,
+            api_catalog,
+            action,
+            token,
+            args,
+            params=params,
+            json_body=json_body,
+        )
+
+    async def login(self, api_paths: dict, credentials: dict) -> dict:
+        return await self._run(self.client.login, api_paths, credentials)
+
+    async def list(
+        self, api_catalog: dict, token: str, args: dict, *, params: dict | None = None
+    ):
+        return await self.request_action(
+            api_catalog, "list", token, args, params=params
+        )
+
+    async def get(
+        self, api_catalog: dict, token: str, args: dict, *, params: dict | None = None
+    ):
+        return await self.request_action(api_catalog, "get", token, args, params=params)
+
+    async def add(self, api_catalog: dict, token: str, args: dict, payload: dict):
+        return await self.request_action(
+            api_catalog, "add", token, args, json_body=payload
+        )
+
+    async def delete(
+        self, api_catalog: dict, token: str, args: dict, *, params: dict | None = None
+    ):
+        return await self.request_action(
+            api_catalog, "delete", token, args, params=params
+        )
+
+    async def update(self, api_catalog: dict, token: str, args: dict, payload: dict):
+        return await self.request_action(
+            api_catalog, "update", token, args, json_body=payload
+        )
+
+    async def replace(self, api_catalog: dict, token: str, args: dict, payload: dict):
+        return await self.request_action(
+            api_catalog, "replace", token, args, json_body=payload
+        )
+
+
+def build_async_client(cp: ClearPassClient, settings: Settings) -> AsyncClearPassClient:
+    return AsyncClearPassClient(cp, max_in_flight=settings.pool_size)
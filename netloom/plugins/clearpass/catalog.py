@@ -1,17 +1,28 @@
 from __future__ import annotations
 
-import copy
+import hashlib
 import html
 import json
 import logging
 import os
 import re
+import tempfile
+import threading
 import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from netloom.core.config import Settings, load_settings
+from netloom.plugins.clearpass.catalog_format import (
+    ReadOnlyMapping,
+    close_catalog,
+    load_packed_catalog,
+    materialize,
+    pack_catalog,
+)
 from netloom.plugins.clearpass.privileges import (
     normalize_effective_privileges,
     service_privilege_rule_index,
@@ -41,7 +52,174 @@ _DEFAULT_VISIBLE_SERVICE_KEYS: set[tuple[str, str]] = {
 @dataclass(frozen=True)
 class EndpointCacheConfig:
     ttl_seconds: int = 24 * 3600
-    cache_filename: str = "api_endpoints_cache.json"
+    cache_filename: str = "api_endpoints_cache.bin"
+    fetch_workers: int = 8
+    max_cached_catalogs: int = 16
+    max_cache_bytes: int = 256 * 1024 * 1024
+    refresh_lock_seconds: int = 30 * 60
+
+
+_CATALOG_INDEX_FILENAME = "api_catalog_index.json"
+_LEGACY_CACHE_FILENAME = "api_endpoints_cache.json"
+_CATALOG_INDEX_LOCK = threading.Lock()
+
+
+def _catalog_cache_key(settings: Settings) -> str:
+    # Effective privileges follow the API client, so the credential identity
+    # stands in for them until the catalog has been fetched.
+    credential = settings.client_id or ""
+    if not credential and settings.api_token:
+        credential = hashlib.sha256(settings.api_token.encode("utf-8")).hexdigest()
+    if not credential and settings.api_token_file:
+        credential = str(settings.api_token_file)
+    identity = "\0".join(
+        [settings.server or "", settings.active_profile or "", credential]
+    )
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()[:16]
+
+
+def _catalog_cache_path(settings: Settings, cfg: EndpointCacheConfig) -> Path:
+    stem, suffix = os.path.splitext(cfg.cache_filename)
+    return settings.paths.cache_dir / f"{stem}-{_catalog_cache_key(settings)}{suffix}"
+
+
+def _privilege_fingerprint(catalog: dict[str, Any]) -> str | None:
+    privilege_filter = catalog.get("privilege_filter")
+    if not isinstance(privilege_filter, dict):
+        return None
+    privileges = privilege_filter.get("effective_privileges") or []
+    encoded = json.dumps(privileges, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _read_catalog_index(
+    cache_dir: Path, cfg: EndpointCacheConfig
+) -> dict[str, dict[str, Any]]:
+    try:
+        data = json.loads((cache_dir / _CATALOG_INDEX_FILENAME).read_text("utf-8"))
+    except Exception:
+        data = {}
+    raw_entries = data.get("entries") if isinstance(data, dict) else None
+    entries = {
+        str(name): dict(entry)
+        for name, entry in (raw_entries or {}).items()
+        if isinstance(entry, dict)
+    }
+
+    # The directory is the source of truth; the index only adds LRU metadata.
+    stem, suffix = os.path.splitext(cfg.cache_filename)
+    present: dict[str, os.stat_result] = {}
+    for path in cache_dir.glob(f"{stem}-*{suffix}"):
+        try:
+            present[path.name] = path.stat()
+        except FileNotFoundError:
+            continue
+    for name in list(entries):
+        if name not in present:
+            entries.pop(name)
+    for name, stat in present.items():
+        entry = entries.setdefault(name, {"last_used": stat.st_mtime})
+        # Reads record use through the access time; see _mark_catalog_used.
+        entry["last_used"] = max(float(entry.get("last_used") or 0), stat.st_atime)
+        entry["size"] = stat.st_size
+    return entries
+
+
+def _write_catalog_index(cache_dir: Path, entries: dict[str, dict[str, Any]]) -> None:
+    with tempfile.NamedTemporaryFile(
+        "w", dir=cache_dir, suffix=".tmp", delete=False, encoding="utf-8"
+    ) as handle:
+        json.dump({"version": 1, "entries": entries}, handle, indent=2, sort_keys=True)
+    os.replace(handle.name, cache_dir / _CATALOG_INDEX_FILENAME)
+
+
+def _evict_catalogs(
+    cache_dir: Path,
+    entries: dict[str, dict[str, Any]],
+    cfg: EndpointCacheConfig,
+    *,
+    keep: str,
+) -> None:
+    max_count = max(int(cfg.max_cached_catalogs), 1)
+    max_bytes = max(int(cfg.max_cache_bytes), 0)
+    oldest_first = sorted(
+        (name for name in entries if name != keep),
+        key=lambda name: float(entries[name].get("last_used") or 0),
+    )
+    total = sum(int(entry.get("size") or 0) for entry in entries.values())
+    for name in oldest_first:
+        if len(entries) <= max_count and total <= max_bytes:
+            break
+        (cache_dir / name).unlink(missing_ok=True)
+        total -= int(entries.pop(name).get("size") or 0)
+        log.debug("[api_catalog] evicted cached catalog %s", name)
+
+
+def _mark_catalog_used(path: Path) -> None:
+    # Only the access time moves: the mtime drives the TTL, and rewriting the
+    # index would put a cache-directory write on every completion and help run.
+    try:
+        os.utime(path, ns=(time.time_ns(), path.stat().st_mtime_ns))
+    except OSError as exc:
+        log.debug("[api_catalog] could not mark %s as used: %s", path, exc)
+
+
+def _index_saved_catalog(
+    settings: Settings,
+    cfg: EndpointCacheConfig,
+    path: Path,
+    catalog: dict[str, Any],
+) -> None:
+    cache_dir = settings.paths.cache_dir
+    try:
+        with _CATALOG_INDEX_LOCK:
+            entries = _read_catalog_index(cache_dir, cfg)
+            entry = entries.get(path.name)
+            if entry is None:
+                return
+            entry["last_used"] = time.time()
+            entry["server"] = settings.server
+            entry["profile"] = settings.active_profile
+            entry["privilege_fingerprint"] = _privilege_fingerprint(catalog)
+            _evict_catalogs(cache_dir, entries, cfg, keep=path.name)
+            _write_catalog_index(cache_dir, entries)
+    except OSError as exc:
+        log.debug("[api_catalog] could not update catalog index: %s", exc)
+
+
+def _document_fingerprint(text: str, headers: Any) -> dict[str, str]:
+    fingerprint = {"sha256": hashlib.sha256(text.encode("utf-8")).hexdigest()}
+    headers = headers or {}
+    etag = headers.get("ETag")
+    if etag:
+        fingerprint["etag"] = str(etag)
+    last_modified = headers.get("Last-Modified")
+    if last_modified:
+        fingerprint["last_modified"] = str(last_modified)
+    return fingerprint
+
+
+def _reusable_document_fingerprints(
+    previous: dict[str, Any] | None, server: Any
+) -> dict[str, dict[str, Any]]:
+    if not isinstance(previous, dict):
+        return {}
+    # Parsed modules are only reusable when they were produced by this parser
+    # for the same appliance.
+    if previous.get("version") != _CATALOG_VERSION:
+        return {}
+    if previous.get("server") != server:
+        return {}
+    if not isinstance(previous.get("full_modules"), Mapping):
+        return {}
+    fingerprints = previous.get("document_fingerprints")
+    if not isinstance(fingerprints, Mapping):
+        return {}
+    return {
+        str(module_name): entry
+        for module_name, entry in fingerprints.items()
+        if isinstance(entry, dict) and isinstance(entry.get("documents"), dict)
+    }
 
 
 def _camel_to_kebab(name: str) -> str:
@@ -110,6 +288,40 @@ def _extract_modules_from_api_docs(text: str) -> list[str]:
     return _extract_module_doc_paths_from_api_docs_html(text)
 
 
+def _listing_has_apigility_services(listing: dict[str, Any]) -> bool:
+    services = listing.get("services")
+    if not isinstance(services, list):
+        return False
+    return any(
+        isinstance(service, dict) and isinstance(service.get("route"), str)
+        for service in services
+    )
+
+
+def _swagger_subdoc_paths(module_name: str, listing: dict[str, Any]) -> list[str]:
+    listing_apis = listing.get("apis")
+    if not isinstance(listing_apis, list):
+        return []
+
+    sub_paths: list[str] = []
+    for item in listing_apis:
+        if not isinstance(item, dict):
+            continue
+        path = item.get("path")
+        if not isinstance(path, str):
+            continue
+
+        if path.startswith("/api/"):
+            sub_paths.append(path)
+        elif path.startswith(f"/{module_name}/"):
+            sub_paths.append(f"/api/apigility/documentation{path}")
+        elif path.startswith("/"):
+            sub_paths.append(f"/api/apigility/documentation/{module_name}{path}")
+        else:
+            sub_paths.append(f"/api/apigility/documentation/{module_name}/{path}")
+    return sub_paths
+
+
 def _extract_placeholders(path: str) -> list[str]:
     return _PLACEHOLDER_RE.findall(path)
 
@@ -628,15 +840,20 @@ def _visible_catalog_modules(
 def project_catalog_view(
     catalog: dict[str, Any] | None, *, catalog_view: str = _CATALOG_VIEW_VISIBLE
 ) -> dict[str, Any] | None:
-    if not isinstance(catalog, dict):
+    if not isinstance(catalog, Mapping):
         return None
 
     normalized_view = _normalize_catalog_view(catalog_view)
     projected = dict(catalog)
+    modules = catalog.get("modules")
     if normalized_view == _CATALOG_VIEW_FULL:
         full_modules = catalog.get("full_modules")
-        if isinstance(full_modules, dict):
-            projected["modules"] = copy.deepcopy(full_modules)
+        if isinstance(full_modules, Mapping):
+            modules = full_modules
+    if isinstance(modules, Mapping):
+        # Both views share the cached structure; callers get read-only module,
+        # service, entry, and action maps instead of a private copy.
+        projected["modules"] = ReadOnlyMapping(modules, depth=4)
     projected["catalog_view"] = normalized_view
     return projected
 
@@ -761,18 +978,74 @@ class ApiEndpointCache:
         self.token = token
         self.cfg = cfg or EndpointCacheConfig()
         self.settings = settings or load_settings()
-        self.cache_path = self.settings.paths.cache_dir / self.cfg.cache_filename
+        self.cache_path = _catalog_cache_path(self.settings, self.cfg)
         self.settings.paths.ensure()
+        self._doc_fingerprints: dict[str, dict[str, str]] = {}
+        self._listing_paths: dict[str, str] = {}
 
     def get_catalog(self, *, force_refresh: bool = False) -> dict[str, Any]:
+        previous = None
         if not force_refresh:
             catalog = self._load_if_fresh()
             if catalog:
+                _mark_catalog_used(self.cache_path)
                 return catalog
-        catalog = self._build_catalog_from_clearpass()
+            # An expired cache still seeds an incremental refresh.
+            previous = self._load_cached()
+            if previous and self.settings.catalog_stale_while_revalidate:
+                self._start_background_refresh()
+                return previous
+        catalog = self._build_catalog_from_clearpass(previous=previous)
         self._save(catalog)
         return catalog
 
+    def _acquire_refresh_lock(self) -> Path | None:
+        lock_path = self.cache_path.with_suffix(".lock")
+        try:
+            if time.time() - lock_path.stat().st_mtime > self.cfg.refresh_lock_seconds:
+                # A refresher that died mid-build must not block refreshes forever.
+                lock_path.unlink(missing_ok=True)
+        except FileNotFoundError:
+            pass
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        except FileExistsError:
+            return None
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(str(os.getpid()))
+        return lock_path
+
+    def _start_background_refresh(self) -> threading.Thread | None:
+        lock_path = self._acquire_refresh_lock()
+        if lock_path is None:
+            log.info("Serving stale API catalog; a refresh is already running.")
+            return None
+
+        def refresh() -> None:
+            # The caller keeps serving, and may close, the stale catalog, so
+            # the refresh maps its own copy.
+            seed = self._load_cached()
+            try:
+                self._save(self._build_catalog_from_clearpass(previous=seed))
+                log.info("Background API catalog refresh finished.")
+            except Exception as exc:
+                log.warning("Background API catalog refresh failed: %s", exc)
+            finally:
+                lock_path.unlink(missing_ok=True)
+                if seed is not None:
+                    close_catalog(seed)
+
+        log.info("Serving stale API catalog; refreshing in the background.")
+        # Non-daemon, so the interpreter finishes the refresh before exiting:
+        # the command's output is not delayed, but its exit is. Help and
+        # completion read the cache through load_cached_catalog and never
+        # start a refresh.
+        thread = threading.Thread(
+            target=refresh, name="netloom-catalog-refresh", daemon=False
+        )
+        thread.start()
+        return thread
+
     def _load_if_fresh(self) -> dict[str, Any] | None:
         try:
             stat = self.cache_path.stat()
@@ -782,38 +1055,85 @@ class ApiEndpointCache:
         # A stale cache is treated as a miss so the next read rebuilds it.
         if time.time() - stat.st_mtime > self.cfg.ttl_seconds:
             return None
+        return self._load_cached()
 
-        try:
-            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
-        except Exception:
-            return None
-
-        if (
-            isinstance(data, dict)
-            and data.get("version") in {2, 3, 4, 5}
-            and isinstance(data.get("modules"), dict)
-        ):
-            return data
-        return None
+    def _load_cached(self) -> dict[str, Any] | None:
+        return _read_catalog_file(self.cache_path)
 
     def _save(self, api_catalog: dict[str, Any]) -> None:
-        tmp = self.cache_path.with_suffix(".tmp")
-        tmp.write_text(
-            json.dumps(api_catalog, indent=2, sort_keys=True), encoding="utf-8"
-        )
-        os.replace(tmp, self.cache_path)
-
-    def _raw_get_text(self, path: str) -> str:
+        # Concurrent rebuilds each write their own temp file; the last rename wins.
+        with tempfile.NamedTemporaryFile(
+            dir=self.cache_path.parent, suffix=".tmp", delete=False
+        ) as handle:
+            handle.write(pack_catalog(api_catalog))
+        os.replace(handle.name, self.cache_path)
+        _index_saved_catalog(self.settings, self.cfg, self.cache_path, api_catalog)
+
+    def _raw_get(self, path: str, extra_headers: dict[str, str] | None = None):
         url = f"{self.cp.https_prefix}{self.cp.server}{path}"
         headers = {
             "Accept": "application/json, application/vnd.swagger+json, */*",
             "Authorization": f"Bearer {self.token}",
         }
-        response = self.cp.session.get(
+        if extra_headers:
+            headers.update(extra_headers)
+        throttle = getattr(self.cp, "wait_for_rate_limit", None)
+        if throttle is not None:
+            throttle()
+        return self.cp.session.get(
             url, headers=headers, verify=self.cp.verify_ssl, timeout=self.cp.timeout
         )
+
+    def _raw_get_text(self, path: str) -> str:
+        response = self._raw_get(path)
         response.raise_for_status()
-        return response.text
+        text = response.text
+        self._doc_fingerprints[path] = _document_fingerprint(
+            text, getattr(response, "headers", None)
+        )
+        return text
+
+    def _document_unchanged(self, path: str, fingerprint: dict[str, Any]) -> bool:
+        conditional: dict[str, str] = {}
+        if fingerprint.get("etag"):
+            conditional["If-None-Match"] = str(fingerprint["etag"])
+        if fingerprint.get("last_modified"):
+            conditional["If-Modified-Since"] = str(fingerprint["last_modified"])
+        try:
+            response = self._raw_get(path, conditional)
+            if getattr(response, "status_code", None) == 304:
+                return True
+            response.raise_for_status()
+            text = response.text
+        except Exception as exc:
+            log.debug("[api_catalog] revalidate %s failed: %s", path, exc)
+            return False
+        return _document_fingerprint(text, None)["sha256"] == fingerprint.get("sha256")
+
+    def _module_unchanged(self, entry: dict[str, Any]) -> bool:
+        documents = entry.get("documents") or {}
+        if not documents:
+            return False
+        return all(
+            isinstance(fingerprint, dict)
+            and self._document_unchanged(path, fingerprint)
+            for path, fingerprint in documents.items()
+        )
+
+    def _module_fingerprints(
+        self, module_name: str, subdoc_paths: list[str]
+    ) -> dict[str, Any] | None:
+        listing_path = self._listing_paths.get(module_name)
+        if listing_path is None:
+            return None
+        documents: dict[str, dict[str, str]] = {}
+        for path in [listing_path, *subdoc_paths]:
+            fingerprint = self._doc_fingerprints.get(path)
+            if fingerprint is None:
+                # A partially fetched module is always re-crawled next time.
+                return None
+            documents[path] = fingerprint
+        return {"documents": documents}
 
     def _load_json(self, path: str) -> dict[str, Any] | None:
         try:
@@ -830,6 +1150,29 @@ class ApiEndpointCache:
             return None
         return parsed if isinstance(parsed, dict) else None
 
+    def _load_module_listing(self, module_path: str) -> dict[str, Any] | None:
+        module_name = module_path.rsplit("/", 1)[-1]
+        # ClearPass exposes both Apigility listings and Swagger subdocuments.
+        for path in (
+            f"/api/apigility/documentation/{module_name}",
+            f"/api/apigility/documentation/{module_name}/swagger",
+            module_path,
+            f"{module_path}.json",
+        ):
+            listing = self._load_json(path)
+            if listing is not None:
+                self._listing_paths[module_name] = path
+                return listing
+        return None
+
+    def _map_fetch(self, fetch, paths: list[str]) -> list[Any]:
+        workers = min(max(int(self.cfg.fetch_workers), 1), len(paths) or 1)
+        if workers == 1:
+            return [fetch(path) for path in paths]
+        # Workers share the client's requests.Session and its connection pool.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch, paths))
+
     def _load_effective_privileges(self) -> list[dict[str, str]]:
         try:
             response = self.cp.request(
@@ -1104,7 +1447,42 @@ class ApiEndpointCache:
         else:
             log.info("[api_catalog] %s: 0 services", cli_module)
 
-    def _build_catalog_from_clearpass(self) -> dict[str, Any]:
+    def _reusable_cli_modules(
+        self,
+        module_names: list[str],
+        previous_fingerprints: dict[str, dict[str, Any]],
+        previous: dict[str, Any] | None,
+    ) -> dict[str, dict[str, Any]]:
+        if not previous_fingerprints or not isinstance(previous, dict):
+            return {}
+        candidates = [name for name in module_names if name in previous_fingerprints]
+        unchanged = {
+            name
+            for name, same in zip(
+                candidates,
+                self._map_fetch(
+                    lambda name: self._module_unchanged(previous_fingerprints[name]),
+                    candidates,
+                ),
+            )
+            if same
+        }
+        previous_modules = previous.get("full_modules") or {}
+        # Several module docs can feed one CLI module; reuse it only when all of
+        # them are unchanged.
+        names_by_cli: dict[str, list[str]] = {}
+        for name in module_names:
+            names_by_cli.setdefault(_module_to_cli(name), []).append(name)
+        return {
+            cli_module: materialize(previous_modules[cli_module])
+            for cli_module, names in names_by_cli.items()
+            if cli_module in previous_modules
+            and all(name in unchanged for name in names)
+        }
+
+    def _build_catalog_from_clearpass(
+        self, previous: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         api_docs_text = self._raw_get_text("/api-docs")
         module_doc_paths = _extract_modules_from_api_docs(api_docs_text)
         effective_privileges = self._load_effective_privileges()
@@ -1118,24 +1496,62 @@ class ApiEndpointCache:
                 "[api_catalog] modules: %s", _format_name_list(discovered_modules)
             )
 
+        module_names = [path.rsplit("/", 1)[-1] for path in module_doc_paths]
+        previous_fingerprints = _reusable_document_fingerprints(
+            previous, getattr(self.cp, "server", None)
+        )
+        reused_modules = self._reusable_cli_modules(
+            module_names, previous_fingerprints, previous
+        )
+        fetch_paths = [
+            path
+            for path, module_name in zip(module_doc_paths, module_names)
+            if _module_to_cli(module_name) not in reused_modules
+        ]
+        if previous_fingerprints:
+            log.info(
+                "Reusing %d unchanged modules; re-crawling %d module docs.",
+                len(reused_modules),
+                len(fetch_paths),
+            )
+
+        # Documents are fetched concurrently, but parsed strictly in discovery
+        # order so the catalog matches a serial build exactly.
+        listings = dict(
+            zip(
+                (path.rsplit("/", 1)[-1] for path in fetch_paths),
+                self._map_fetch(self._load_module_listing, fetch_paths),
+            )
+        )
+        subdoc_paths = {
+            module_name: _swagger_subdoc_paths(module_name, listing)
+            for module_name, listing in listings.items()
+            if listing is not None and not _listing_has_apigility_services(listing)
+        }
+        flat_subdoc_paths = [
+            sub_path for paths in subdoc_paths.values() for sub_path in paths
+        ]
+        subdocs_by_path = dict(
+            zip(flat_subdoc_paths, self._map_fetch(self._load_json, flat_subdoc_paths))
+        )
+
         modules: dict[str, dict[str, Any]] = {}
+        document_fingerprints: dict[str, dict[str, Any]] = {}
 
-        for module_path in module_doc_paths:
-            module_name = module_path.rsplit("/", 1)[-1]
+        for module_name in module_names:
             cli_module = _module_to_cli(module_name)
-            module_services = modules.setdefault(cli_module, {})
+            if cli_module in reused_modules:
+                modules.setdefault(cli_module, reused_modules[cli_module])
+                document_fingerprints[module_name] = previous_fingerprints[module_name]
+                continue
 
-            # ClearPass exposes both Apigility listings and Swagger subdocuments.
-            listing = self._load_json(f"/api/apigility/documentation/{module_name}")
-            if listing is None:
-                for alt in (
-                    f"/api/apigility/documentation/{module_name}/swagger",
-                    module_path,
-                    f"{module_path}.json",
-                ):
-                    listing = self._load_json(alt)
-                    if listing is not None:
-                        break
+            module_services = modules.setdefault(cli_module, {})
+            listing = listings.get(module_name)
+            fingerprints = self._module_fingerprints(
+                module_name, subdoc_paths.get(module_name, [])
+            )
+            if fingerprints is not None:
+                document_fingerprints[module_name] = fingerprints
 
             if listing is None:
                 log.warning("[api_catalog] %s: no JSON docs found", module_name)
@@ -1155,23 +1571,8 @@ class ApiEndpointCache:
                 )
                 continue
 
-            for item in listing_apis:
-                if not isinstance(item, dict):
-                    continue
-                path = item.get("path")
-                if not isinstance(path, str):
-                    continue
-
-                if path.startswith("/api/"):
-                    sub_path = path
-                elif path.startswith(f"/{module_name}/"):
-                    sub_path = f"/api/apigility/documentation{path}"
-                elif path.startswith("/"):
-                    sub_path = f"/api/apigility/documentation/{module_name}{path}"
-                else:
-                    sub_path = f"/api/apigility/documentation/{module_name}/{path}"
-
-                subdoc = self._load_json(sub_path)
+            for sub_path in subdoc_paths.get(module_name, []):
+                subdoc = subdocs_by_path.get(sub_path)
                 if not subdoc:
                     continue
                 self._process_swagger_subdoc(module_services, subdoc)
@@ -1182,6 +1583,8 @@ class ApiEndpointCache:
 
             self._log_module_services(cli_module, module_services)
 
+        # The filtered views are cheap next to the crawl, and rebuilding them
+        # keeps modules removed upstream out of the visible catalog.
         filtered_modules, privilege_metadata = _filter_catalog_by_effective_privileges(
             {"modules": modules}, effective_privileges
         )
@@ -1214,6 +1617,7 @@ class ApiEndpointCache:
             "full_modules": modules,
             "privilege_filter": privilege_metadata,
             "catalog_visibility": visibility_metadata,
+            "document_fingerprints": document_fingerprints,
         }
         log.info("Visible modules in cache: %d", len(visible_modules))
         log.info("Visible services in cache: %d", _count_services(visible_modules))
@@ -1236,11 +1640,28 @@ def get_api_catalog(
     return project_catalog_view(catalog, catalog_view=catalog_view) or {"modules": {}}
 
 
+def _read_catalog_file(path: Path) -> dict[str, Any] | None:
+    try:
+        data = load_packed_catalog(path)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        log.debug("[api_catalog] could not read %s: %s", path, exc)
+        return None
+
+    if (
+        isinstance(data, dict)
+        and data.get("version") in {2, 3, 4, 5}
+        and isinstance(data.get("modules"), Mapping)
+    ):
+        return data
+    return None
+
+
 def get_cache_file_path(settings: Settings | None = None) -> Path:
-    cfg = EndpointCacheConfig()
     active_settings = settings or load_settings()
     active_settings.paths.ensure()
-    return active_settings.paths.cache_dir / cfg.cache_filename
+    return _catalog_cache_path(active_settings, EndpointCacheConfig())
 
 
 def load_cached_catalog(
@@ -1248,25 +1669,21 @@ def load_cached_catalog(
     *,
     catalog_view: str = _CATALOG_VIEW_VISIBLE,
 ) -> dict[str, Any] | None:
-    path = get_cache_file_path(settings=settings)
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except FileNotFoundError:
-        return None
-    except Exception:
+    active_settings = settings or load_settings()
+    path = get_cache_file_path(settings=active_settings)
+    data = _read_catalog_file(path)
+    if data is None:
         return None
-
-    if (
-        isinstance(data, dict)
-        and data.get("version") in {2, 3, 4, 5}
-        and isinstance(data.get("modules"), dict)
-    ):
-        return project_catalog_view(data, catalog_view=catalog_view)
-    return None
+    _mark_catalog_used(path)
+    return project_catalog_view(data, catalog_view=catalog_view)
 
 
 def clear_api_cache(settings: Settings | None = None) -> bool:
-    path = get_cache_file_path(settings=settings)
+    active_settings = settings or load_settings()
+    path = get_cache_file_path(settings=active_settings)
+    # Catalogs from before per-profile keys lived in one shared file.
+    legacy_path = active_settings.paths.cache_dir / _LEGACY_CACHE_FILENAME
+    legacy_path.unlink(missing_ok=True)
     try:
         path.unlink()
         return True
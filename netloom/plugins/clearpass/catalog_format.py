@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+PACKED_MAGIC = b"NLCAT1\n"
+_HEADER_LENGTH = struct.Struct(">Q")
+# Top-level keys stored as per-entry blobs, with the nesting depth that is
+# indexed: modules -> services for the two module maps, modules for the rest.
+LAZY_SECTIONS = {"modules": 2, "full_modules": 2, "document_fingerprints": 1}
+
+
+class PackedMapping(Mapping):
+    def __init__(self, buffer: Any, base: int, index: dict[str, Any]):
+        self._buffer = buffer
+        self._base = base
+        self._index = index
+        self._decoded: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+        entry = self._index[key]
+        if isinstance(entry, dict):
+            value: Any = PackedMapping(self._buffer, self._base, entry)
+        else:
+            offset, length = entry
+            start = self._base + offset
+            value = json.loads(bytes(self._buffer[start : start + length]))
+        self._decoded[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __repr__(self) -> str:
+        return f"PackedMapping({list(self._index)!r})"
+
+    def close(self) -> None:
+        # Every mapping of one catalog shares the buffer; closing it releases
+        # the replaced cache file instead of waiting for garbage collection.
+        close = getattr(self._buffer, "close", None)
+        if close is not None:
+            close()
+
+
+class ReadOnlyMapping(Mapping):
+    def __init__(self, data: Mapping[str, Any], depth: int = 1):
+        self._data = data
+        self._depth = depth
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._data[key]
+        if self._depth > 1 and isinstance(value, Mapping):
+            return ReadOnlyMapping(value, self._depth - 1)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"ReadOnlyMapping({self._data!r})"
+
+    def close(self) -> None:
+        close = getattr(self._data, "close", None)
+        if close is not None:
+            close()
+
+
+def close_catalog(catalog: Mapping[str, Any]) -> None:
+    for value in catalog.values():
+        if isinstance(value, (PackedMapping, ReadOnlyMapping)):
+            value.close()
+
+
+def materialize(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: materialize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [materialize(item) for item in value]
+    return value
+
+
+def pack_catalog(catalog: Mapping[str, Any]) -> bytes:
+    blobs: list[bytes] = []
+    offsets: dict[bytes, list[int]] = {}
+    size = 0
+
+    def add_blob(value: Any) -> list[int]:
+        nonlocal size
+        blob = json.dumps(
+            materialize(value), separators=(",", ":"), sort_keys=True
+        ).encode("utf-8")
+        # The visible and full views repeat most services; store each once.
+        existing = offsets.get(blob)
+        if existing is not None:
+            return existing
+        entry = [size, len(blob)]
+        offsets[blob] = entry
+        blobs.append(blob)
+        size += len(blob)
+        return entry
+
+    def index(value: Any, depth: int) -> Any:
+        if depth == 0 or not isinstance(value, Mapping):
+            return add_blob(value)
+        return {str(key): index(item, depth - 1) for key, item in value.items()}
+
+    meta: dict[str, Any] = {}
+    sections: dict[str, Any] = {}
+    for key, value in catalog.items():
+        depth = LAZY_SECTIONS.get(key)
+        if depth is not None and isinstance(value, Mapping):
+            sections[key] = index(value, depth)
+        else:
+            meta[key] = materialize(value)
+
+    header = json.dumps(
+        {"meta": meta, "sections": sections}, separators=(",", ":"), sort_keys=True
+    ).encode("utf-8")
+    return b"".join([PACKED_MAGIC, _HEADER_LENGTH.pack(len(header)), header, *blobs])
+
+
+def _map_file(path: Path) -> Any:
+    with path.open("rb") as handle:
+        # Windows cannot replace a file that is still mapped, and a stale
+        # catalog may be swapped out while this process keeps reading it.
+        if os.name == "nt":
+            return handle.read()
+        try:
+            return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b""
+
+
+def load_packed_catalog(path: Path) -> dict[str, Any] | None:
+    buffer = _map_file(path)
+    prefix_end = len(PACKED_MAGIC) + _HEADER_LENGTH.size
+    if len(buffer) < prefix_end or bytes(buffer[: len(PACKED_MAGIC)]) != PACKED_MAGIC:
+        return None
+    (header_length,) = _HEADER_LENGTH.unpack(
+        bytes(buffer[len(PACKED_MAGIC) : prefix_end])
+    )
+    base = prefix_end + header_length
+    header = json.loads(bytes(buffer[prefix_end:base]))
+    if not isinstance(header, dict) or not isinstance(header.get("meta"), dict):
+        return None
+
+    catalog = dict(header["meta"])
+    for key, index in (header.get("sections") or {}).items():
+        if isinstance(index, dict):
+            catalog[key] = PackedMapping(buffer, base, index)
+        else:
+            offset, length = index
+            catalog[key] = json.loads(
+                bytes(buffer[base + offset : base + offset + length])
+            )
+    return catalog
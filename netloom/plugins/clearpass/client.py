@@ -1,12 +1,30 @@
 from __future__ import annotations
 
 import logging
+import math
+import random
 import re
+import socket
+import threading
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
 from urllib.parse import quote
 
 import requests
-
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from netloom.core.config import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_RETRIES,
+    DEFAULT_RETRY_BACKOFF,
+    DEFAULT_RETRY_BACKOFF_MAX,
+)
 from netloom.io.output import sanitize_secrets
 
 log = logging.getLogger(__name__)
@@ -20,6 +38,8 @@ _TEXT_CONTENT_MARKERS = (
     "csv",
     "x-www-form-urlencoded",
 )
+_RETRY_STATUSES = {429, 502, 503, 504}
+_READ_METHODS = {"GET", "HEAD", "OPTIONS"}
 
 
 @dataclass(frozen=True)
@@ -51,6 +71,83 @@ def _filename_from_content_disposition(value: str | None) -> str | None:
     return match.group(1).strip().strip('"')
 
 
+def _retry_after_seconds(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _tcp_keepalive_options(idle_seconds: int) -> list[tuple[int, int, int]]:
+    if idle_seconds <= 0:
+        return []
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # macOS spells the idle-time option TCP_KEEPALIVE.
+    idle_option = getattr(socket, "TCP_KEEPIDLE", None) or getattr(
+        socket, "TCP_KEEPALIVE", None
+    )
+    if idle_option is not None:
+        options.append((socket.IPPROTO_TCP, idle_option, idle_seconds))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, idle_seconds))
+    return options
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.throttled_requests = 0
+        self.throttled_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            # Reserve the token up front so waiting threads are served in
+            # arrival order and can sleep outside the lock.
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            if wait:
+                self.throttled_requests += 1
+                self.throttled_seconds += wait
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class _TransportAdapter(HTTPAdapter):
+    __attrs__ = [*HTTPAdapter.__attrs__, "socket_options"]
+
+    def __init__(self, *, socket_options: list[tuple[int, int, int]], **kwargs):
+        # HTTPAdapter.__init__ builds the pool manager, so set this first.
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.socket_options:
+            kwargs["socket_options"] = [
+                *HTTPConnection.default_socket_options,
+                *self.socket_options,
+            ]
+        super().init_poolmanager(*args, **kwargs)
+
+
 class ClearPassClient:
     def __init__(
         self,
@@ -60,6 +157,16 @@ class ClearPassClient:
         verify_ssl: bool = False,
         timeout: int = 15,
         mask_secrets: bool = True,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keep_alive: bool = True,
+        tcp_keepalive: int = 0,
+        retries: int = DEFAULT_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        retry_backoff_max: float = DEFAULT_RETRY_BACKOFF_MAX,
+        retry_writes: bool = False,
+        rate_limit: float = 0.0,
+        rate_burst: int = 0,
     ):
         self.server = server
         self.https_prefix = https_prefix
@@ -68,7 +175,108 @@ class ClearPassClient:
         self.mask_secrets = mask_secrets
         self.session = requests.Session()
         self.session.headers.update({"accept": "application/json"})
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        adapter = _TransportAdapter(
+            socket_options=_tcp_keepalive_options(tcp_keepalive),
+            pool_connections=max(1, pool_connections),
+            pool_maxsize=max(1, pool_size),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.retries = max(0, retries)
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.retry_writes = retry_writes
+        self.rate_limiter = (
+            _TokenBucket(rate_limit, rate_burst or math.ceil(rate_limit))
+            if rate_limit > 0
+            else None
+        )
+        self.request_count = 0
+        self.retry_count = 0
+        self._stats_lock = threading.Lock()
         self.last_response_meta = ResponseMetadata()
+        self.on_unauthorized: Callable[[str], Any] | None = None
+
+    def wait_for_rate_limit(self) -> float:
+        with self._stats_lock:
+            self.request_count += 1
+        if self.rate_limiter is None:
+            return 0.0
+        waited = self.rate_limiter.acquire()
+        if waited:
+            log.debug("Rate limit held a request to %s for %.3fs", self.server, waited)
+        return waited
+
+    def transport_stats(self) -> dict[str, float]:
+        limiter = self.rate_limiter
+        return {
+            "requests": self.request_count,
+            "retries": self.retry_count,
+            "throttled_requests": limiter.throttled_requests if limiter else 0,
+            "throttled_seconds": (
+                round(limiter.throttled_seconds, 3) if limiter else 0.0
+            ),
+        }
+
+    def _can_retry(self, method: str, attempt: int) -> bool:
+        if attempt >= self.retries:
+            return False
+        return method in _READ_METHODS or self.retry_writes
+
+    def _retry_delay(self, attempt: int, retry_after: float | None) -> float:
+        if retry_after is not None:
+            return retry_after
+        ceiling = min(self.retry_backoff * (2**attempt), self.retry_backoff_max)
+        return random.uniform(0, ceiling)
+
+    def _send_with_retries(self, method: str, url: str, **kwargs):
+        attempt = 0
+        while True:
+            self.wait_for_rate_limit()
+            try:
+                response = self.session.request(method=method, url=url, **kwargs)
+            except requests.exceptions.SSLError:
+                raise
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if not self._can_retry(method, attempt):
+                    raise
+                reason = type(exc).__name__
+                delay = self._retry_delay(attempt, None)
+            else:
+                if response.status_code not in _RETRY_STATUSES or not (
+                    self._can_retry(method, attempt)
+                ):
+                    return response
+                reason = f"HTTP {response.status_code}"
+                retry_after = _retry_after_seconds(response.headers.get("retry-after"))
+                if retry_after is not None and retry_after > self.retry_backoff_max:
+                    # Retrying sooner would only spend attempts inside the
+                    # server's back-off window.
+                    raise requests.HTTPError(
+                        f"{reason} from {url}: the server asked to retry after "
+                        f"{retry_after:.0f}s, longer than NETLOOM_RETRY_BACKOFF_MAX "
+                        f"({self.retry_backoff_max:g}s)",
+                        response=response,
+                    )
+                delay = self._retry_delay(attempt, retry_after)
+                response.close()
+            attempt += 1
+            with self._stats_lock:
+                self.retry_count += 1
+                total = self.retry_count
+            log.warning(
+                "Retrying %s %s after %s in %.2fs (attempt %s/%s, %s retries total)",
+                method,
+                url,
+                reason,
+                delay,
+                attempt + 1,
+                self.retries + 1,
+                total,
+            )
+            time.sleep(delay)
 
     def request(
         self,
@@ -105,9 +313,9 @@ class ClearPassClient:
     ):
         url = f"{self.https_prefix}{self.server}{path}"
         headers = {"Authorization": f"Bearer {token}"} if token else None
-        response = self.session.request(
-            method=method.upper(),
-            url=url,
+        response = self._send_with_retries(
+            method.upper(),
+            url,
             params=params,
             json=json_body,
             headers=headers,
@@ -152,6 +360,8 @@ class ClearPassClient:
             for line in debug_lines:
                 if line.strip():
                     log.debug(line)
+            if response.status_code == 401 and token and self.on_unauthorized:
+                self.on_unauthorized(token)
             raise
 
         if response.status_code == 204 or not response.content:
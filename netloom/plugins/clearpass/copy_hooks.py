@@ -33,6 +33,24 @@ _DIFF_IGNORE_FIELDS = {
     "change_of_authorization",
 }
 _MASKED_SECRET_VALUES = {"", "********", "******", "*****", "<hidden>", "<masked>"}
+# Services that reference other services of the same module by name, so the
+# referenced objects must exist on the target before these are written. Only
+# policyelements is mapped so far; other modules copy with no ordering.
+_COPY_SERVICE_DEPENDENCIES = {
+    "policyelements": {
+        "network-device-group": {"network-device"},
+        "role-mapping": {"role"},
+        "enforcement-policy": {"role"},
+        "service": {
+            "auth-method",
+            "auth-source",
+            "enforcement-policy",
+            "posture-policy",
+            "proxy-target",
+            "role-mapping",
+        },
+    },
+}
 
 
 def _is_masked_secret_placeholder(key: str, value: Any) -> bool:
@@ -74,6 +92,13 @@ def normalize_copy_payload(
     return _drop_blank_secret_fields(payload)
 
 
+def copy_service_dependencies(module: str) -> dict[str, set[str]]:
+    return {
+        service: set(dependencies)
+        for service, dependencies in _COPY_SERVICE_DEPENDENCIES.get(module, {}).items()
+    }
+
+
 def normalize_diff_item(module: str, service: str, item: Any) -> Any:
     del module, service
 
@@ -18,7 +18,7 @@ def build_help_context() -> dict[str, list[str]]:
         "common_options": [
             ("--file=PATH                        Path to JSON/CSV bulk payload input."),
             "--out=PATH                         Override the output file path.",
-            "--data-format=JSON|CSV|RAW         Output format (default: json).",
+            "--data-format=JSON|NDJSON|CSV|RAW  Output format (default: json).",
             "--csv-fieldnames=A,B,C             Fields and order for CSV output.",
             (
                 "--filter=JSON|FIELD:OP:VALUE       Server-side filter applied "
@@ -29,6 +29,10 @@ def build_help_context() -> dict[str, list[str]]:
                 "--all/copy requests."
             ),
             ("--calculate-count=true|false       Request total count metadata."),
+            (
+                "--page-workers=N                   Fetch remaining list pages "
+                "concurrently when the total count is known."
+            ),
             "--log-level=LEVEL                  Select log level (default: info).",
             "--api-token=TOKEN                  Use an existing bearer token.",
             "--token-file=PATH                  Load a bearer token from a file.",
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from functools import partial
+from typing import Any
+
 from netloom.core.config import Settings
 from netloom.core.plugin import PluginDefinition
 from netloom.io.files import load_api_token_file
-from netloom.plugins.clearpass import catalog
+from netloom.plugins.clearpass import catalog, token_cache
+from netloom.plugins.clearpass.async_client import build_async_client
 from netloom.plugins.clearpass.client import ClearPassClient
 from netloom.plugins.clearpass.copy_hooks import (
+    copy_service_dependencies,
     normalize_copy_payload,
     normalize_diff_item,
     preflight_error_for_payload,
@@ -27,6 +32,16 @@ def build_client(settings: Settings, *, mask_secrets: bool = True) -> ClearPassC
             verify_ssl=settings.verify_ssl,
             timeout=settings.timeout,
             mask_secrets=mask_secrets,
+            pool_connections=settings.pool_connections,
+            pool_size=settings.pool_size,
+            keep_alive=settings.keep_alive,
+            tcp_keepalive=settings.tcp_keepalive,
+            retries=settings.retries,
+            retry_backoff=settings.retry_backoff,
+            retry_backoff_max=settings.retry_backoff_max,
+            retry_writes=settings.retry_writes,
+            rate_limit=settings.rate_limit,
+            rate_burst=settings.rate_burst,
         )
     except TypeError as exc:
         if "mask_secrets" not in str(exc):
@@ -41,12 +56,40 @@ def build_client(settings: Settings, *, mask_secrets: bool = True) -> ClearPassC
         return cp
 
 
-def resolve_auth_token(cp: ClearPassClient, settings: Settings) -> str:
+def _invalidate_tokens(stores: list[Any], settings: Settings, token: str) -> None:
+    for store in stores:
+        store.invalidate_cached_token(settings, token)
+
+
+def resolve_auth_token(
+    cp: ClearPassClient,
+    settings: Settings,
+    *,
+    use_cache: bool = True,
+    token_store: Any = None,
+) -> str:
     if settings.api_token:
         return settings.api_token
     if settings.api_token_file:
         return load_api_token_file(settings.api_token_file)
-    return cp.login(catalog.OAUTH_ENDPOINTS, settings.credentials)["access_token"]
+    credentials = settings.credentials
+    stores = [token_store] if token_store is not None else []
+    if settings.token_cache:
+        stores.append(token_cache)
+    if not (use_cache and stores):
+        return cp.login(catalog.OAUTH_ENDPOINTS, credentials)["access_token"]
+    token = None
+    for store in stores:
+        token = store.load_cached_token(settings)
+        if token is not None:
+            break
+    if token is None:
+        response = cp.login(catalog.OAUTH_ENDPOINTS, credentials)
+        token = response["access_token"]
+        for store in stores:
+            store.store_token(settings, response)
+    cp.on_unauthorized = partial(_invalidate_tokens, stores, settings)
+    return token
 
 
 PLUGIN = PluginDefinition(
@@ -62,4 +105,6 @@ PLUGIN = PluginDefinition(
     preflight_error_for_payload=preflight_error_for_payload,
     help_context=build_help_context,
     normalize_diff_item=normalize_diff_item,
+    copy_service_dependencies=copy_service_dependencies,
+    build_async_client=build_async_client,
 )
@@ -414,7 +414,9 @@ def main(argv: list[str] | None = None) -> int:
     if args.limit > 0:
         target_services = target_services[: args.limit]
 
-    baseline_token = resolve_auth_token(discovery_cp, discovery_settings)
+    baseline_token = resolve_auth_token(
+        discovery_cp, discovery_settings, use_cache=False
+    )
     baseline_effective = _effective_privileges(discovery_cp, baseline_token)
 
     baseline_access: dict[str, dict[str, Any]] = {}
@@ -474,7 +476,11 @@ def main(argv: list[str] | None = None) -> int:
                     continue
 
                 time.sleep(max(args.sleep_seconds, 0))
-                discovery_token = resolve_auth_token(discovery_cp, discovery_settings)
+                # Privileges are fixed when a token is issued, so every probe
+                # needs a fresh one.
+                discovery_token = resolve_auth_token(
+                    discovery_cp, discovery_settings, use_cache=False
+                )
                 effective = _effective_privileges(discovery_cp, discovery_token)
                 probe = _probe_service(
                     discovery_cp, discovery_token, catalog, module_name, service_name
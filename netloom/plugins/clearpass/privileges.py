@@ -3,6 +3,7 @@ from __future__ import annotations
 import html
 import json
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -399,7 +400,7 @@ def _catalog_candidate_records(catalog: dict[str, Any]) -> list[dict[str, Any]]:
     modules = catalog.get("modules") or {}
     records: list[dict[str, Any]] = []
     for module_name, services in modules.items():
-        if not isinstance(services, dict):
+        if not isinstance(services, Mapping):
             continue
         for service_name, service_entry in services.items():
             if not isinstance(service_entry, dict):
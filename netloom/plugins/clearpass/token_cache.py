@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from netloom.core.config import Settings
+
+log = logging.getLogger(__name__)
+
+_TOKEN_CACHE_DIRNAME = "tokens"
+_TOKEN_CACHE_VERSION = 1
+
+
+def _token_cache_path(settings: Settings) -> Path:
+    identity = "\0".join([settings.server or "", settings.active_profile or ""])
+    key = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:16]
+    return settings.paths.state_dir / _TOKEN_CACHE_DIRNAME / f"oauth-{key}.json"
+
+
+def _credentials_fingerprint(settings: Settings) -> str:
+    # Rotating the secret or pointing the profile elsewhere must not reuse a
+    # token issued to the old identity.
+    identity = "\0".join(
+        [
+            settings.server or "",
+            settings.grant_type,
+            settings.client_id or "",
+            settings.client_secret or "",
+        ]
+    )
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+def _read_token_cache(path: Path) -> dict[str, Any] | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        log.debug("Ignoring unreadable token cache %s: %s", path, exc)
+        return None
+    if not isinstance(data, dict) or data.get("version") != _TOKEN_CACHE_VERSION:
+        return None
+    return data
+
+
+def load_cached_token(settings: Settings) -> str | None:
+    data = _read_token_cache(_token_cache_path(settings))
+    if data is None or data.get("fingerprint") != _credentials_fingerprint(settings):
+        return None
+    token = data.get("access_token")
+    obtained_at = data.get("obtained_at")
+    expires_in = data.get("expires_in")
+    if not isinstance(token, str) or not token:
+        return None
+    if not isinstance(obtained_at, (int, float)) or not isinstance(
+        expires_in, (int, float)
+    ):
+        return None
+    refresh_at = obtained_at + expires_in - max(0, settings.token_refresh_margin)
+    if time.time() >= refresh_at:
+        return None
+    return token
+
+
+def store_token(settings: Settings, response: dict[str, Any]) -> bool:
+    token = response.get("access_token")
+    try:
+        expires_in = int(response.get("expires_in"))
+    except (TypeError, ValueError):
+        return False
+    if not isinstance(token, str) or not token or expires_in <= 0:
+        return False
+    path = _token_cache_path(settings)
+    entry = {
+        "version": _TOKEN_CACHE_VERSION,
+        "server": settings.server,
+        "profile": settings.active_profile,
+        "fingerprint": _credentials_fingerprint(settings),
+        "access_token": token,
+        "expires_in": expires_in,
+        "obtained_at": time.time(),
+    }
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # NamedTemporaryFile creates the file as 0600, so the token is never
+        # readable by other users, even before the rename.
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as handle:
+            json.dump(entry, handle, indent=2, sort_keys=True)
+        os.replace(handle.name, path)
+    except OSError as exc:
+        log.debug("Could not write token cache %s: %s", path, exc)
+        return False
+    return True
+
+
+def invalidate_cached_token(settings: Settings, token: str | None = None) -> bool:
+    path = _token_cache_path(settings)
+    if token is not None:
+        data = _read_token_cache(path)
+        # Another process may already have replaced the rejected token.
+        if data is None or data.get("access_token") != token:
+            return False
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return False
+    log.info("Discarded the cached OAuth token for %s", settings.server)
+    return True
@@ -0,0 +1,146 @@
+# Compare diff field filtering against the previous deepcopy implementation.
+# Usage: python scripts/bench_diff_filters.py [--items=20000] [--repeat=3]
+
+from __future__ import annotations
+
+import copy
+import sys
+import time
+from collections import defaultdict
+from typing import Any
+
+from netloom.cli.diff import (
+    _apply_field_filters,
+    _compile_field_trie,
+    _parse_field_paths,
+)
+
+_MISSING = object()
+IGNORE_FIELDS = "description,attributes.vendor,attributes.tags,snmp.version,radsec"
+
+
+def _legacy_select_paths(value: Any, paths: list[tuple[str | int, ...]]) -> Any:
+    if any(not path for path in paths):
+        return copy.deepcopy(value)
+    if isinstance(value, dict):
+        grouped: dict[str, list[tuple[str | int, ...]]] = defaultdict(list)
+        for path in paths:
+            if isinstance(path[0], str):
+                grouped[path[0]].append(path[1:])
+        if not grouped:
+            return _MISSING
+        selected = {}
+        for key, child_paths in grouped.items():
+            if key in value:
+                child = _legacy_select_paths(value[key], child_paths)
+                if child is not _MISSING:
+                    selected[key] = child
+        return selected if selected else _MISSING
+    if isinstance(value, list):
+        indexed: dict[int, list[tuple[str | int, ...]]] = defaultdict(list)
+        for path in paths:
+            if isinstance(path[0], int):
+                indexed[path[0]].append(path[1:])
+        if not indexed:
+            return _MISSING
+        selected_list = []
+        for index in sorted(indexed):
+            if 0 <= index < len(value):
+                child = _legacy_select_paths(value[index], indexed[index])
+                if child is not _MISSING:
+                    selected_list.append(child)
+        return selected_list if selected_list else _MISSING
+    return _MISSING
+
+
+def _legacy_remove_path(value: Any, path: tuple[str | int, ...]) -> Any:
+    if value is _MISSING or not path:
+        return _MISSING
+    head, *tail = path
+    if (isinstance(value, dict) and isinstance(head, str)) or (
+        isinstance(value, list) and isinstance(head, int)
+    ):
+        updated = copy.deepcopy(value)
+        if isinstance(updated, dict) and head not in updated:
+            return updated
+        if isinstance(updated, list) and not (0 <= head < len(updated)):
+            return updated
+        if not tail:
+            updated.pop(head)
+            return updated
+        updated[head] = _legacy_remove_path(updated[head], tuple(tail))
+        return updated
+    return copy.deepcopy(value)
+
+
+def _legacy_apply(value: Any, include_paths, ignore_paths) -> Any:
+    filtered = copy.deepcopy(value)
+    if include_paths:
+        filtered = _legacy_select_paths(filtered, include_paths)
+        if filtered is _MISSING:
+            return None
+    for path in ignore_paths:
+        filtered = _legacy_remove_path(filtered, path)
+        if filtered is _MISSING:
+            return None
+    return filtered
+
+
+def _items(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "name": f"switch-{index}",
+            "description": f"Access switch {index}",
+            "ip_address": f"10.{index // 65536}.{index // 256 % 256}.{index % 256}",
+            "vendor_name": "Aruba",
+            "attributes": {
+                "location": f"rack-{index % 40}",
+                "vendor": "Aruba",
+                "tags": ["access", "campus", f"floor-{index % 12}"],
+            },
+            "snmp": {"version": "V2C", "community": "public", "port": 161},
+            "radsec": {"enabled": False, "port": 2083},
+            "groups": [{"name": f"group-{index % 7}", "members": list(range(8))}],
+        }
+        for index in range(count)
+    ]
+
+
+def _time(label: str, func, items: list[dict[str, Any]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<10} {best * 1000:9.1f} ms")
+    return best
+
+
+def main(argv: list[str]) -> None:
+    options = dict(arg[2:].split("=", 1) for arg in argv if arg.startswith("--"))
+    items = _items(int(options.get("items", 20000)))
+    repeat = int(options.get("repeat", 3))
+    ignore_paths = _parse_field_paths(IGNORE_FIELDS, flag_name="--ignore-fields")
+    ignore_trie = _compile_field_trie(ignore_paths)
+
+    for item in items[:100]:
+        assert _legacy_apply(item, [], ignore_paths) == _apply_field_filters(
+            item, None, ignore_trie
+        )
+
+    print(f"{len(items)} items, ignore fields: {IGNORE_FIELDS}")
+    legacy = _time(
+        "deepcopy", lambda item: _legacy_apply(item, [], ignore_paths), items, repeat
+    )
+    current = _time(
+        "trie",
+        lambda item: _apply_field_filters(item, None, ignore_trie),
+        items,
+        repeat,
+    )
+    print(f"speedup    {legacy / current:9.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,102 @@
+# Compare ClearPassClient transport settings against a local mock server.
+# Usage: python scripts/bench_http_pool.py [--requests=2000] [--threads=32]
+#        [--certfile=cert.pem --keyfile=key.pem]  (serve HTTPS instead of HTTP)
+
+from __future__ import annotations
+
+import ssl
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import urllib3
+
+from netloom.plugins.clearpass.client import ClearPassClient
+
+_BODY = b'{"ok":true}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, delayed ACKs
+    # stall every reused connection.
+    disable_nagle_algorithm = True
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with _Handler.lock:
+            _Handler.connections += 1
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(_BODY)))
+        if self.close_connection:
+            self.send_header("connection", "close")
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+def _serve(certfile: str | None, keyfile: str | None) -> ThreadingHTTPServer:
+    server = _Server(("127.0.0.1", 0), _Handler)
+    if certfile:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certfile, keyfile)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _run(label: str, client: ClearPassClient, requests: int, threads: int) -> None:
+    _Handler.connections = 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(
+            executor.map(
+                lambda _: client.request_path("GET", "/api/role"), range(requests)
+            )
+        )
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:<28} {elapsed * 1000:8.1f} ms  "
+        f"{requests / elapsed:8.0f} req/s  {_Handler.connections:5d} connections"
+    )
+
+
+def main(argv: list[str]) -> None:
+    options = dict(arg[2:].split("=", 1) for arg in argv if arg.startswith("--"))
+    requests = int(options.get("requests", 2000))
+    threads = int(options.get("threads", 32))
+    certfile = options.get("certfile")
+    server = _serve(certfile, options.get("keyfile"))
+    host = f"127.0.0.1:{server.server_address[1]}"
+    prefix = "https://" if certfile else "http://"
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    print(f"{requests} GETs from {threads} threads over {prefix.rstrip(':/')}")
+    scenarios = [
+        ("fresh connection per call", {"keep_alive": False}),
+        ("requests default pool (10)", {"pool_size": 10}),
+        (f"pool size {threads}", {"pool_size": threads}),
+    ]
+    for label, transport in scenarios:
+        client = ClearPassClient(host, https_prefix=prefix, **transport)
+        _run(label, client, requests, threads)
+        client.session.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,10 +1,30 @@
+import copy
+import json
+import os
+import threading
+from dataclasses import replace
+
+import pytest
+
+from netloom.cli.completion import completion_candidates
 from netloom.core.config import AppPaths, Settings
+from netloom.core.help import render_catalog_help
 from netloom.plugins.clearpass.catalog import (
     ApiEndpointCache,
+    EndpointCacheConfig,
     _filter_catalog_by_effective_privileges,
     _visible_catalog_modules,
+    load_cached_catalog,
     project_catalog_view,
 )
+from netloom.plugins.clearpass.catalog_format import (
+    PackedMapping,
+    close_catalog,
+    load_packed_catalog,
+    materialize,
+    pack_catalog,
+)
+from netloom.plugins.clearpass.client import ClearPassClient
 
 
 class FakeCP:
@@ -14,6 +34,17 @@ class FakeCP:
     timeout = 5
 
 
+def _settings(tmp_path):
+    return Settings(
+        paths=AppPaths(
+            cache_dir=tmp_path / "cache",
+            state_dir=tmp_path / "state",
+            response_dir=tmp_path / "responses",
+            app_log_dir=tmp_path / "logs",
+        ).ensure()
+    )
+
+
 def test_process_swagger_subdoc_captures_body_and_response_metadata(tmp_path):
     settings = Settings(
         paths=AppPaths(
@@ -268,3 +299,379 @@ def test_project_catalog_view_can_switch_to_full_modules():
     assert projected["catalog_view"] == "full"
     assert "endpoint" in projected["modules"]["identities"]
     assert "guest" in projected["modules"]["identities"]
+
+
+def test_close_catalog_releases_the_mapped_cache_file(tmp_path):
+    catalog, _ = _build_with_workers(tmp_path, 1)
+    path = tmp_path / "packed.json"
+    path.write_bytes(pack_catalog(catalog))
+    projected = project_catalog_view(load_packed_catalog(path), catalog_view="full")
+    assert "endpoint" in projected["modules"]["identities"]
+
+    close_catalog(projected)
+
+    with pytest.raises(ValueError):
+        projected["full_modules"]["policyelements"]["role-0"]
+
+
+def test_project_catalog_view_shares_full_modules_read_only(tmp_path):
+    catalog, _ = _build_with_workers(tmp_path, 1)
+    snapshot = copy.deepcopy(catalog)
+    projected = project_catalog_view(catalog, catalog_view="full")
+    modules = projected["modules"]
+
+    with pytest.raises(TypeError):
+        modules["identities"] = {}
+    with pytest.raises(TypeError):
+        modules["policyelements"]["role-0"] = {}
+    with pytest.raises(TypeError):
+        modules["policyelements"]["role-0"]["actions"] = {}
+    with pytest.raises(TypeError):
+        modules["policyelements"]["role-0"]["actions"]["list"] = {}
+    assert (
+        modules["policyelements"]["role-0"]["actions"]["list"]
+        is catalog["full_modules"]["policyelements"]["role-0"]["actions"]["list"]
+    )
+
+    cp = ClearPassClient("example:443", https_prefix="https://")
+    cp.resolve_action(projected, "policyelements", "role-2", "get", {"id": 7})
+    completion_candidates(["policyelements"], projected)
+    completion_candidates(["policyelements", "role-1"], projected)
+    render_catalog_help(
+        "",
+        "",
+        api_catalog=projected,
+        module="policyelements",
+        service="role-1",
+        action="list",
+        has_plugin=True,
+    )
+
+    assert catalog == snapshot
+
+
+class _DocsResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+        self.headers = {} if payload is None else {"ETag": _etag(payload)}
+
+    def raise_for_status(self):
+        if self.payload is None:
+            raise RuntimeError("not found")
+
+    @property
+    def text(self):
+        return json.dumps(self.payload)
+
+
+def _etag(payload):
+    return f'"{len(json.dumps(payload))}-{hash(json.dumps(payload))}"'
+
+
+class _DocsSession:
+    def __init__(self, docs):
+        self.docs = docs
+        self.urls = []
+        self.not_modified = []
+
+    def get(self, url, **kwargs):
+        path = url.split("example:443", 1)[1]
+        payload = self.docs.get(path)
+        etag = (kwargs.get("headers") or {}).get("If-None-Match")
+        if payload is not None and etag == _etag(payload):
+            self.not_modified.append(path)
+            return _DocsResponse(payload, status_code=304)
+        self.urls.append(url)
+        return _DocsResponse(payload)
+
+
+def _swagger_subdoc(resource):
+    return {
+        "resourcePath": f"/{resource}",
+        "apis": [
+            {
+                "path": f"/{resource}",
+                "operations": [
+                    {"method": "GET", "parameters": [{"name": "filter"}]},
+                    {"method": "POST"},
+                ],
+            },
+            {
+                "path": f"/{resource}/{{{resource}_id}}",
+                "operations": [{"method": "GET"}, {"method": "DELETE"}],
+            },
+        ],
+    }
+
+
+def _crawl_docs():
+    docs = {
+        "/api-docs": {
+            "apis": [
+                {"path": "/api-docs/Identities-v1"},
+                {"path": "/api-docs/PolicyElements-v1"},
+                {"path": "/api-docs/Missing-v1"},
+            ]
+        },
+        "/api/apigility/documentation/Identities-v1": {
+            "services": [
+                {
+                    "name": "Endpoint",
+                    "route": "/api/endpoint[/:endpoint_id]",
+                    "collection_http_methods": ["GET", "POST"],
+                    "entity_http_methods": ["GET", "PATCH"],
+                }
+            ]
+        },
+        "/api/apigility/documentation/PolicyElements-v1": {
+            "apis": [{"path": f"/role-{index}"} for index in range(6)]
+        },
+    }
+    for index in range(6):
+        docs[f"/api/apigility/documentation/PolicyElements-v1/role-{index}"] = (
+            _swagger_subdoc(f"role-{index}")
+        )
+    return docs
+
+
+def _build_with_workers(tmp_path, workers):
+    cp = FakeCP()
+    cp.session = _DocsSession(_crawl_docs())
+    cache = ApiEndpointCache(
+        cp,
+        token="tok",
+        cfg=EndpointCacheConfig(fetch_workers=workers),
+        settings=_settings(tmp_path / str(workers)),
+    )
+    catalog = cache._build_catalog_from_clearpass()
+    catalog.pop("generated_at")
+    return catalog, cp.session.urls
+
+
+def test_build_catalog_parallel_fetch_matches_serial_build(tmp_path):
+    serial, serial_urls = _build_with_workers(tmp_path, 1)
+    parallel, parallel_urls = _build_with_workers(tmp_path, 4)
+
+    assert json.dumps(parallel, indent=2, sort_keys=True) == json.dumps(
+        serial, indent=2, sort_keys=True
+    )
+    assert sorted(parallel_urls) == sorted(serial_urls)
+    assert sorted(serial["full_modules"]["policyelements"]) == [
+        f"role-{index}" for index in range(6)
+    ]
+    assert "endpoint" in serial["full_modules"]["identities"]
+
+
+def test_incremental_refresh_only_recrawls_changed_modules(tmp_path):
+    docs = _crawl_docs()
+    cp = FakeCP()
+    cp.session = _DocsSession(docs)
+    settings = _settings(tmp_path)
+    first = ApiEndpointCache(cp, token="tok", settings=settings)
+    first._save(first._build_catalog_from_clearpass())
+    initial = first._load_cached()
+
+    cp.session = _DocsSession(docs)
+    unchanged = ApiEndpointCache(cp, token="tok", settings=settings)
+    same = unchanged._build_catalog_from_clearpass(previous=initial)
+    assert [url.split("example:443", 1)[1] for url in cp.session.urls] == [
+        "/api-docs",
+        "/api/apigility/documentation/Missing-v1",
+        "/api/apigility/documentation/Missing-v1/swagger",
+        "/api-docs/Missing-v1",
+        "/api-docs/Missing-v1.json",
+    ]
+    assert len(cp.session.not_modified) == 8
+    for key in ("modules", "full_modules", "document_fingerprints"):
+        assert same[key] == initial[key]
+
+    changed_docs = _crawl_docs()
+    changed_docs["/api/apigility/documentation/PolicyElements-v1/role-2"]["apis"][0][
+        "operations"
+    ].append({"method": "PUT"})
+    cp.session = _DocsSession(changed_docs)
+    refreshed = ApiEndpointCache(
+        cp, token="tok", settings=settings
+    )._build_catalog_from_clearpass(previous=initial)
+    fetched = {url.split("example:443", 1)[1] for url in cp.session.urls}
+    assert "/api/apigility/documentation/PolicyElements-v1/role-0" in fetched
+    assert "/api/apigility/documentation/Identities-v1" not in fetched
+
+    cp.session = _DocsSession(changed_docs)
+    full = ApiEndpointCache(
+        cp, token="tok", settings=_settings(tmp_path / "full")
+    )._build_catalog_from_clearpass()
+    for key in ("modules", "full_modules", "document_fingerprints"):
+        assert refreshed[key] == full[key]
+    assert "replace" in refreshed["full_modules"]["policyelements"]["role-2"]["actions"]
+
+
+def test_incremental_refresh_drops_modules_removed_upstream(tmp_path):
+    docs = _crawl_docs()
+    cp = FakeCP()
+    cp.session = _DocsSession(docs)
+    settings = _settings(tmp_path)
+    first = ApiEndpointCache(cp, token="tok", settings=settings)
+    first._save(first._build_catalog_from_clearpass())
+    initial = first._load_cached()
+    assert "identities" in initial["modules"]
+
+    removed = _crawl_docs()
+    # Every remaining module is unchanged, so all of them are reused.
+    removed["/api-docs"]["apis"] = [{"path": "/api-docs/PolicyElements-v1"}]
+    cp.session = _DocsSession(removed)
+    refreshed = ApiEndpointCache(
+        cp, token="tok", settings=settings
+    )._build_catalog_from_clearpass(previous=initial)
+
+    assert "identities" not in refreshed["full_modules"]
+    assert "identities" not in refreshed["modules"]
+    assert "policyelements" in refreshed["modules"]
+
+
+def _profile_settings(tmp_path, profile, server="example:443"):
+    return replace(_settings(tmp_path), server=server, active_profile=profile)
+
+
+def test_catalog_cache_is_keyed_per_profile_and_evicts_lru(tmp_path):
+    cfg = EndpointCacheConfig(max_cached_catalogs=2)
+    catalogs = {}
+    for profile in ("lab", "prod", "dev"):
+        settings = _profile_settings(tmp_path, profile)
+        cache = ApiEndpointCache(FakeCP(), token="tok", cfg=cfg, settings=settings)
+        catalog = {
+            "version": 5,
+            "modules": {profile: {}},
+            "privilege_filter": {"effective_privileges": [{"name": profile}]},
+        }
+        cache._save(catalog)
+        catalogs[profile] = cache.cache_path
+        if profile == "prod":
+            load_cached_catalog(_profile_settings(tmp_path, "lab"))
+
+    assert len({path.name for path in catalogs.values()}) == 3
+    assert catalogs["lab"].exists()
+    assert not catalogs["prod"].exists()
+    assert catalogs["dev"].exists()
+    assert load_cached_catalog(_profile_settings(tmp_path, "prod")) is None
+    assert load_cached_catalog(_profile_settings(tmp_path, "dev"))["modules"] == {
+        "dev": {}
+    }
+
+    index = json.loads((tmp_path / "cache" / "api_catalog_index.json").read_text())
+    entry = index["entries"][catalogs["dev"].name]
+    assert entry["profile"] == "dev"
+    assert entry["privilege_fingerprint"]
+    assert sorted(index["entries"]) == sorted(
+        [catalogs["lab"].name, catalogs["dev"].name]
+    )
+
+
+def test_reading_cached_catalog_does_not_write_the_cache_dir(tmp_path):
+    settings = _profile_settings(tmp_path, "lab")
+    cache = ApiEndpointCache(FakeCP(), token="tok", settings=settings)
+    cache._save({"version": 5, "modules": {"lab": {}}})
+    os.utime(cache.cache_path, ns=(0, cache.cache_path.stat().st_mtime_ns))
+    cache_dir = tmp_path / "cache"
+    index = (cache_dir / "api_catalog_index.json").read_bytes()
+    before = cache_dir.stat().st_mtime_ns, cache.cache_path.stat().st_mtime_ns
+
+    assert load_cached_catalog(settings)["modules"] == {"lab": {}}
+
+    assert (cache_dir / "api_catalog_index.json").read_bytes() == index
+    assert (cache_dir.stat().st_mtime_ns, cache.cache_path.stat().st_mtime_ns) == (
+        before
+    )
+    assert cache.cache_path.stat().st_atime_ns > 0
+
+
+def test_concurrent_catalog_saves_use_separate_temp_files(tmp_path):
+    settings = _profile_settings(tmp_path, "lab")
+    caches = [
+        ApiEndpointCache(FakeCP(), token="tok", settings=settings) for _ in range(8)
+    ]
+    errors = []
+
+    def save(i, cache):
+        try:
+            cache._save({"version": 5, "modules": {f"m{i}": {}}})
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=save, args=(i, cache)) for i, cache in enumerate(caches)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert errors == []
+    assert list((tmp_path / "cache").glob("*.tmp")) == []
+    assert len(load_cached_catalog(settings)["modules"]) == 1
+
+
+def test_stale_catalog_is_served_while_refreshing_in_background(tmp_path):
+    settings = replace(
+        _profile_settings(tmp_path, "lab"), catalog_stale_while_revalidate=True
+    )
+    cache = ApiEndpointCache(FakeCP(), token="tok", settings=settings)
+    cache._save({"version": 5, "modules": {"stale": {}}})
+    os.utime(cache.cache_path, (0, 0))
+
+    release = threading.Event()
+    previous_seen = []
+
+    def slow_build(previous=None):
+        previous_seen.append(previous)
+        release.wait(5)
+        return {"version": 5, "modules": {"fresh": {}}}
+
+    cache._build_catalog_from_clearpass = slow_build
+    assert cache.get_catalog()["modules"] == {"stale": {}}
+
+    # A second invocation sees the lock and does not start another rebuild.
+    other = ApiEndpointCache(FakeCP(), token="tok", settings=settings)
+    other._build_catalog_from_clearpass = slow_build
+    assert other.get_catalog()["modules"] == {"stale": {}}
+
+    release.set()
+    for thread in threading.enumerate():
+        if thread.name == "netloom-catalog-refresh":
+            thread.join(5)
+
+    assert len(previous_seen) == 1
+    assert previous_seen[0]["modules"] == {"stale": {}}
+    assert cache._load_cached()["modules"] == {"fresh": {}}
+    assert not cache.cache_path.with_suffix(".lock").exists()
+
+
+def test_packed_catalog_round_trips_and_decodes_lazily(tmp_path):
+    catalog, _ = _build_with_workers(tmp_path, 1)
+    path = tmp_path / "catalog.bin"
+    path.write_bytes(pack_catalog(catalog))
+
+    loaded = load_packed_catalog(path)
+    modules = loaded["modules"]
+    assert isinstance(modules, PackedMapping)
+    assert sorted(modules) == sorted(catalog["modules"])
+    assert modules._decoded == {}
+
+    services = modules["policyelements"]
+    assert sorted(services) == sorted(catalog["modules"]["policyelements"])
+    assert services["role-3"] == catalog["modules"]["policyelements"]["role-3"]
+    assert list(services._decoded) == ["role-3"]
+    assert list(modules._decoded) == ["policyelements"]
+
+    assert materialize(loaded) == json.loads(json.dumps(catalog))
+
+
+def test_load_cached_catalog_reads_packed_cache_file(tmp_path):
+    settings = _profile_settings(tmp_path, "lab")
+    cache = ApiEndpointCache(FakeCP(), token="tok", settings=settings)
+    cache._save({"version": 5, "modules": {"identities": {"endpoint": {}}}})
+
+    assert cache.cache_path.read_bytes().startswith(b"NLCAT1\n")
+    loaded = load_cached_catalog(settings)
+    assert loaded["modules"]["identities"] == {"endpoint": {}}
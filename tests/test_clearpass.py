@@ -1,7 +1,17 @@
+import asyncio
+import dataclasses
+import os
+import stat
+import threading
+
 import pytest
 import requests
 
 import netloom.plugins.clearpass.client as clearpass
+import netloom.plugins.clearpass.token_cache as token_cache
+from netloom.core.config import AppPaths, Settings
+from netloom.plugins.clearpass.async_client import AsyncClearPassClient
+from netloom.plugins.clearpass.plugin import resolve_auth_token
 
 MISSING = object()
 
@@ -39,6 +49,9 @@ class FakeResp:
             raise ValueError("not json")
         return self._json_value
 
+    def close(self):
+        pass
+
 
 class FakeLogger:
     def __init__(self):
@@ -54,6 +67,35 @@ class FakeLogger:
         self.debug_calls.append(msg)
 
 
+def test_client_mounts_tuned_transport_adapter():
+    cp = clearpass.ClearPassClient(
+        "server:443",
+        https_prefix="https://",
+        pool_connections=2,
+        pool_size=24,
+        keep_alive=False,
+        tcp_keepalive=45,
+    )
+
+    adapter = cp.session.get_adapter("https://server:443/api")
+    assert adapter is cp.session.get_adapter("http://server:443/api")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 24
+    assert adapter._pool_connections == 2
+    socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+    assert (clearpass.socket.SOL_SOCKET, clearpass.socket.SO_KEEPALIVE, 1) in (
+        socket_options
+    )
+    assert cp.session.headers["Connection"] == "close"
+
+
+def test_client_default_transport_keeps_connections_alive():
+    cp = clearpass.ClearPassClient("server:443", https_prefix="https://")
+
+    adapter = cp.session.get_adapter("https://server:443/api")
+    assert "socket_options" not in adapter.poolmanager.connection_pool_kw
+    assert cp.session.headers["Connection"] == "keep-alive"
+
+
 def test_request_success_json(monkeypatch):
     cp = clearpass.ClearPassClient(
         "server:443", https_prefix="https://", verify_ssl=False
@@ -177,3 +219,264 @@ def test_request_http_error_can_show_secrets_when_masking_disabled(monkeypatch):
 
     joined = "\n".join(fake_log.debug_calls)
     assert "SUPERSECRET" in joined
+
+
+def _scripted_session(monkeypatch, cp, outcomes):
+    calls = []
+
+    def request(**kw):
+        calls.append(kw["method"])
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(cp.session, "request", request)
+    return calls
+
+
+def test_request_retries_transient_status_and_honours_retry_after(monkeypatch, caplog):
+    cp = clearpass.ClearPassClient("server:443", https_prefix="https://")
+    sleeps = []
+    monkeypatch.setattr(clearpass.time, "sleep", sleeps.append)
+    calls = _scripted_session(
+        monkeypatch,
+        cp,
+        [
+            FakeResp(status_code=503, headers={"retry-after": "2"}),
+            FakeResp(status_code=429, headers={"retry-after": "25"}),
+            FakeResp(json_value={"ok": True}),
+        ],
+    )
+
+    with caplog.at_level("WARNING", logger=clearpass.log.name):
+        assert cp.request_path("GET", "/api/role") == {"ok": True}
+
+    assert calls == ["GET", "GET", "GET"]
+    assert sleeps == [2.0, 25.0]
+    assert cp.retry_count == 2
+    assert "after HTTP 429" in caplog.text
+    assert "2 retries total" in caplog.text
+
+
+def test_request_fails_when_retry_after_exceeds_the_backoff_cap(monkeypatch):
+    cp = clearpass.ClearPassClient("server:443", https_prefix="https://")
+    sleeps = []
+    monkeypatch.setattr(clearpass.time, "sleep", sleeps.append)
+    calls = _scripted_session(
+        monkeypatch,
+        cp,
+        [FakeResp(status_code=429, headers={"retry-after": "120"})],
+    )
+
+    with pytest.raises(requests.HTTPError, match="retry after 120s"):
+        cp.request_path("GET", "/api/role")
+
+    assert calls == ["GET"]
+    assert sleeps == []
+    assert cp.retry_count == 0
+
+
+def test_request_retries_connection_errors_with_capped_backoff(monkeypatch):
+    cp = clearpass.ClearPassClient(
+        "server:443",
+        https_prefix="https://",
+        retries=2,
+        retry_backoff=1.0,
+        retry_backoff_max=1.5,
+    )
+    sleeps = []
+    monkeypatch.setattr(clearpass.time, "sleep", sleeps.append)
+    _scripted_session(
+        monkeypatch,
+        cp,
+        [requests.ConnectionError("reset")] * 3,
+    )
+
+    with pytest.raises(requests.ConnectionError):
+        cp.request_path("GET", "/api/role/1")
+
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 1.0
+    assert 0 <= sleeps[1] <= 1.5
+
+
+def test_request_retries_writes_only_when_enabled(monkeypatch):
+    monkeypatch.setattr(clearpass.time, "sleep", lambda delay: None)
+    unavailable = dict(status_code=503, reason="Unavailable", raise_http=True)
+
+    cp = clearpass.ClearPassClient("server:443", https_prefix="https://")
+    calls = _scripted_session(
+        monkeypatch, cp, [FakeResp(**unavailable), FakeResp(**unavailable)]
+    )
+    with pytest.raises(requests.HTTPError):
+        cp.request_path("POST", "/api/role", json_body={"name": "x"})
+    with pytest.raises(requests.HTTPError):
+        cp.request_path("DELETE", "/api/role/1")
+    assert calls == ["POST", "DELETE"]
+
+    cp = clearpass.ClearPassClient(
+        "server:443", https_prefix="https://", retry_writes=True
+    )
+    calls = _scripted_session(
+        monkeypatch,
+        cp,
+        [FakeResp(**unavailable), FakeResp(status_code=201, json_value={"id": 7})],
+    )
+    assert cp.request_path("POST", "/api/role", json_body={"name": "x"}) == {"id": 7}
+    assert calls == ["POST", "POST"]
+
+
+def test_rate_limiter_spaces_requests_beyond_the_burst(monkeypatch):
+    now = [100.0]
+    sleeps = []
+    monkeypatch.setattr(clearpass.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(clearpass.time, "sleep", sleeps.append)
+    cp = clearpass.ClearPassClient(
+        "server:443", https_prefix="https://", rate_limit=10, rate_burst=2
+    )
+    monkeypatch.setattr(cp.session, "request", lambda **kw: FakeResp())
+
+    for _ in range(5):
+        cp.request_path("GET", "/api/role")
+    now[0] += 1.0
+    cp.request_path("GET", "/api/role")
+
+    assert sleeps == pytest.approx([0.1, 0.2, 0.3])
+    stats = cp.transport_stats()
+    assert stats["requests"] == 6
+    assert stats["throttled_requests"] == 3
+    assert stats["throttled_seconds"] == pytest.approx(0.6)
+
+
+def test_rate_limiter_is_shared_by_threads_using_one_client(monkeypatch):
+    cp = clearpass.ClearPassClient(
+        "server:443", https_prefix="https://", rate_limit=200, rate_burst=1
+    )
+    monkeypatch.setattr(cp.session, "request", lambda **kw: FakeResp())
+
+    started = clearpass.time.monotonic()
+    threads = [
+        clearpass.threading.Thread(
+            target=lambda: [cp.request_path("GET", "/api/role") for _ in range(5)]
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 20 requests with one token up front need at least 19 refills at 200/s.
+    assert clearpass.time.monotonic() - started >= 19 / 200
+    assert cp.transport_stats()["requests"] == 20
+
+
+def test_async_client_runs_requests_on_a_bounded_pool(monkeypatch):
+    cp = clearpass.ClearPassClient("server:443", https_prefix="https://")
+    lock = threading.Lock()
+    threads = set()
+
+    def request(**kwargs):
+        with lock:
+            threads.add(threading.current_thread().name)
+        return FakeResp(json_value={"path": kwargs["url"].rsplit("/", 1)[1]})
+
+    monkeypatch.setattr(cp.session, "request", request)
+
+    async def run():
+        async with AsyncClearPassClient(cp, max_in_flight=2) as client:
+            results = await asyncio.gather(
+                *(client.request_path("GET", f"/api/role/{i}") for i in range(6))
+            )
+            return client, results
+
+    client, results = asyncio.run(run())
+
+    assert [result["path"] for result in results] == [str(index) for index in range(6)]
+    assert len(threads) <= 2
+    assert all(name.startswith("netloom-http") for name in threads)
+    assert client._executor is None
+    assert client.transport_stats()["requests"] == 6
+
+
+def _token_settings(tmp_path, **overrides):
+    overrides.setdefault("token_cache", True)
+    paths = AppPaths(
+        cache_dir=tmp_path / "cache",
+        state_dir=tmp_path / "state",
+        response_dir=tmp_path / "responses",
+        app_log_dir=tmp_path / "logs",
+    )
+    return Settings(
+        server="server:443",
+        client_id="client",
+        client_secret="secret",
+        active_profile="dev",
+        paths=paths,
+        **overrides,
+    )
+
+
+class _LoginCP:
+    def __init__(self):
+        self.logins = 0
+        self.on_unauthorized = None
+
+    def login(self, api_paths, credentials):
+        self.logins += 1
+        return {"access_token": f"token-{self.logins}", "expires_in": 3600}
+
+
+def test_resolve_auth_token_reuses_cached_token_until_refresh_margin(
+    monkeypatch, tmp_path
+):
+    now = [1000.0]
+    monkeypatch.setattr(token_cache.time, "time", lambda: now[0])
+    settings = _token_settings(tmp_path)
+    cp = _LoginCP()
+
+    assert resolve_auth_token(cp, settings) == "token-1"
+    assert resolve_auth_token(_LoginCP(), settings) == "token-1"
+    path = token_cache._token_cache_path(settings)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert "secret" not in path.read_text(encoding="utf-8")
+
+    now[0] += 3600 - settings.token_refresh_margin
+    assert resolve_auth_token(cp, settings) == "token-2"
+    assert cp.logins == 2
+
+
+def test_resolve_auth_token_ignores_cache_for_other_credentials(tmp_path):
+    settings = _token_settings(tmp_path)
+    resolve_auth_token(_LoginCP(), settings)
+    rotated = dataclasses.replace(settings, client_secret="rotated")
+    cp = _LoginCP()
+
+    resolve_auth_token(cp, rotated)
+    resolve_auth_token(cp, settings, use_cache=False)
+    resolve_auth_token(cp, dataclasses.replace(settings, token_cache=False))
+
+    assert cp.logins == 3
+
+
+def test_unauthorized_response_discards_cached_token(monkeypatch, tmp_path):
+    settings = _token_settings(tmp_path)
+    cp = clearpass.ClearPassClient("server:443", https_prefix="https://", retries=0)
+    monkeypatch.setattr(
+        cp,
+        "login",
+        lambda api_paths, credentials: {"access_token": "stale", "expires_in": 3600},
+    )
+    monkeypatch.setattr(
+        cp.session,
+        "request",
+        lambda **kw: FakeResp(status_code=401, reason="Unauthorized", raise_http=True),
+    )
+    token = resolve_auth_token(cp, settings)
+
+    with pytest.raises(requests.HTTPError):
+        cp.request_path("GET", "/api/role", token=token)
+
+    assert token_cache.load_cached_token(settings) is None
+    assert not token_cache._token_cache_path(settings).exists()
@@ -321,6 +321,155 @@ def test_list_handler_fetches_all_pages(monkeypatch, api_catalog, settings):
     assert logged["thing"]["count"] == 5
 
 
+def test_list_handler_fetches_remaining_pages_concurrently_with_count(
+    monkeypatch, api_catalog, settings
+):
+    calls = []
+    import netloom.core.pagination as pagination
+
+    monkeypatch.setattr(pagination, "DEFAULT_PAGE_SIZE", 2)
+
+    class CP:
+        last_response_meta = None
+
+        def get_action_definition(self, api_catalog, module, service, action):
+            return api_catalog["modules"][module][service]["actions"][action]
+
+        def list(self, api_catalog, token, args, *, params=None):
+            calls.append(dict(params or {}))
+            offset = int((params or {}).get("offset", 0))
+            limit = int((params or {}).get("limit", 25))
+            items = [
+                {"id": item_id}
+                for item_id in range(offset + 1, min(offset + limit, 7) + 1)
+            ]
+            response = {"_embedded": {"items": items}}
+            if offset == 0:
+                response["count"] = 7
+            return response
+
+    logged = {}
+    monkeypatch.setattr(
+        commands,
+        "log_to_file",
+        lambda thing, filename, **kwargs: logged.update(
+            {"thing": thing, "filename": str(filename)}
+        ),
+    )
+
+    commands.list_handler(
+        CP(),
+        "tok",
+        api_catalog,
+        {
+            "module": "identities",
+            "service": "endpoint",
+            "action": "list",
+            "calculate_count": True,
+            "page_workers": "3",
+        },
+        settings=settings,
+    )
+
+    assert calls[0] == {
+        "limit": 2,
+        "offset": 0,
+        "sort": None,
+        "calculate_count": "true",
+    }
+    assert sorted(call["offset"] for call in calls[1:]) == [2, 4, 6]
+    assert all(call["calculate_count"] == "false" for call in calls[1:])
+    assert [item["id"] for item in logged["thing"]["_embedded"]["items"]] == [
+        1,
+        2,
+        3,
+        4,
+        5,
+        6,
+        7,
+    ]
+    assert logged["thing"]["count"] == 7
+
+
+def test_list_handler_rejects_invalid_page_workers(api_catalog, settings):
+    class CP:
+        last_response_meta = None
+
+        def get_action_definition(self, api_catalog, module, service, action):
+            return api_catalog["modules"][module][service]["actions"][action]
+
+    with pytest.raises(ValueError, match="--page-workers"):
+        commands.list_handler(
+            CP(),
+            "tok",
+            api_catalog,
+            {
+                "module": "identities",
+                "service": "endpoint",
+                "action": "list",
+                "page_workers": "0",
+            },
+            settings=settings,
+        )
+
+
+def test_list_handler_streams_ndjson_pages_to_file(
+    monkeypatch, api_catalog, settings, tmp_path, capsys
+):
+    import netloom.core.pagination as pagination
+
+    monkeypatch.setattr(pagination, "DEFAULT_PAGE_SIZE", 2)
+
+    class CP:
+        last_response_meta = None
+
+        def get_action_definition(self, api_catalog, module, service, action):
+            return api_catalog["modules"][module][service]["actions"][action]
+
+        def list(self, api_catalog, token, args, *, params=None):
+            offset = int((params or {}).get("offset", 0))
+            items = [
+                {"id": item_id, "password": f"secret-{item_id}"}
+                for item_id in range(offset + 1, min(offset + 2, 3) + 1)
+            ]
+            return {"_embedded": {"items": items}, "count": 3}
+
+    streamed = []
+    log_to_file = commands.log_to_file
+
+    def fake_log_to_file(thing, *args, **kwargs):
+        streamed.append(kwargs.get("stream"))
+        return log_to_file(thing, *args, **kwargs)
+
+    monkeypatch.setattr(commands, "log_to_file", fake_log_to_file)
+    out = tmp_path / "endpoints.ndjson"
+
+    written = commands.list_handler(
+        CP(),
+        "tok",
+        api_catalog,
+        {
+            "module": "identities",
+            "service": "endpoint",
+            "action": "list",
+            "data_format": "ndjson",
+            "out": str(out),
+            "console": True,
+        },
+        settings=settings,
+    )
+
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert written is None
+    assert streamed == [True]
+    assert [json.loads(line) for line in lines] == [
+        {"id": 1, "password": ""},
+        {"id": 2, "password": ""},
+        {"id": 3, "password": ""},
+    ]
+    assert capsys.readouterr().out.splitlines() == lines
+
+
 def test_get_handler_calls_cp_and_logs(monkeypatch, api_catalog, settings):
     logged = {}
 
@@ -402,6 +551,7 @@ def test_get_handler_all_fetches_all_pages_without_count(
             "service": "endpoint",
             "action": "get",
             "all": True,
+            "page_workers": "4",
         },
         settings=settings,
     )
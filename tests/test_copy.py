@@ -1,5 +1,7 @@
 import json
 import re
+import threading
+import time
 import types
 from pathlib import Path
 
@@ -419,6 +421,79 @@ def test_handle_copy_command_updates_existing_match_and_restores_secret(
     assert report["items"][0]["response"]["radius_secret"] == "abc123"
 
 
+class _CountingTargetCP(_TargetCP):
+    def __init__(self, catalog, matches=None):
+        super().__init__(catalog, matches)
+        self.list_calls = []
+        self.get_calls = []
+
+    def list(self, api_catalog, token, args, *, params=None):
+        self.list_calls.append(dict(args))
+        return super().list(api_catalog, token, args, params=params)
+
+    def get(self, api_catalog, token, args, *, params=None):
+        self.get_calls.append(dict(args))
+        return super().get(api_catalog, token, args, params=params)
+
+
+def test_handle_copy_command_matches_many_items_from_one_target_listing(
+    monkeypatch, tmp_path
+):
+    catalog = _catalog()
+    source_cp = _SourceCP(
+        catalog,
+        [
+            {"id": 1, "name": "switch-a", "radius_secret": "one"},
+            {"id": 2, "name": "switch-b", "radius_secret": "two"},
+            {"id": 3, "name": "switch-c", "radius_secret": "three"},
+        ],
+    )
+    target_cp = _CountingTargetCP(
+        catalog,
+        {
+            "switch-b": {"id": 42, "name": "switch-b"},
+            "other": {"id": 3, "name": "other"},
+        },
+    )
+
+    monkeypatch.setattr(copymod, "list_profiles", lambda: ["dev", "prod"])
+    monkeypatch.setattr(
+        copymod,
+        "load_settings_for_profile",
+        lambda profile: _make_settings(tmp_path, profile),
+    )
+
+    def build_client(settings, *, mask_secrets=True):
+        return source_cp if settings.server == "dev" else target_cp
+
+    report = copymod.handle_copy_command(
+        {
+            "module": "copy",
+            "copy_module": "policyelements",
+            "copy_service": "network-device",
+            "from": "dev",
+            "to": "prod",
+            "all": True,
+            "dry_run": True,
+            "on_conflict": "update",
+        },
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=_plugin(build_client, catalog),
+    )
+
+    assert len(target_cp.list_calls) == 1
+    assert "filter" not in target_cp.list_calls[0]
+    assert target_cp.get_calls == []
+    assert [item["action"] for item in report["items"]] == [
+        "create",
+        "update",
+        "update",
+    ]
+    assert report["items"][1]["target_match"] == {"id": 42, "name": "switch-b"}
+    assert report["items"][2]["match_by"] == "id"
+    assert report["items"][2]["target_match"] == {"id": 3, "name": "other"}
+
+
 def test_handle_copy_command_uses_cached_catalog_by_default(monkeypatch, tmp_path):
     catalog = _catalog()
     source_cp = _SourceCP(
@@ -760,3 +835,600 @@ def test_handle_copy_command_rejects_missing_selector(monkeypatch, tmp_path):
             settings=_make_settings(tmp_path, "prod"),
             plugin=_plugin(lambda settings, mask_secrets=True: None, _catalog()),
         )
+
+
+class _SlowTargetCP(_TargetCP):
+    def __init__(self, catalog, *, fail_name=None):
+        super().__init__(catalog, {})
+        self.fail_name = fail_name
+        self.lock = threading.Lock()
+
+    def add(self, api_catalog, token, args, payload):
+        index = int(payload["name"].rsplit("-", 1)[1])
+        time.sleep(0.01 * (5 - index % 5))
+        with self.lock:
+            self.add_calls.append({"args": args, "payload": payload})
+        if payload["name"] == self.fail_name:
+            raise RuntimeError("boom")
+        return {"id": 3000 + index, **payload}
+
+
+def _parallel_copy(monkeypatch, tmp_path, target_cp, **extra):
+    catalog = _catalog()
+    source_cp = _SourceCP(
+        catalog,
+        [
+            {"id": index, "name": f"switch-{index}", "radius_secret": "s"}
+            for index in range(6)
+        ],
+    )
+    monkeypatch.setattr(copymod, "list_profiles", lambda: ["dev", "prod"])
+    monkeypatch.setattr(
+        copymod,
+        "load_settings_for_profile",
+        lambda profile: _make_settings(tmp_path, profile),
+    )
+
+    def build_client(settings, *, mask_secrets=True):
+        return source_cp if settings.server == "dev" else target_cp
+
+    return copymod.handle_copy_command(
+        {
+            "module": "copy",
+            "copy_module": "policyelements",
+            "copy_service": "network-device",
+            "from": "dev",
+            "to": "prod",
+            "all": True,
+            **extra,
+        },
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=_plugin(build_client, catalog),
+    )
+
+
+def test_handle_copy_command_parallel_reports_in_plan_order(monkeypatch, tmp_path):
+    target_cp = _SlowTargetCP(_catalog())
+
+    report = _parallel_copy(monkeypatch, tmp_path, target_cp, parallel="3")
+
+    assert report["summary"]["created"] == 6
+    assert [item["label"] for item in report["items"]] == [
+        f"switch-{index}" for index in range(6)
+    ]
+    assert [item["response"]["id"] for item in report["items"]] == [
+        3000 + index for index in range(6)
+    ]
+
+
+def test_handle_copy_command_parallel_stops_submitting_after_failure(
+    monkeypatch, tmp_path
+):
+    target_cp = _SlowTargetCP(_catalog(), fail_name="switch-1")
+
+    report = _parallel_copy(monkeypatch, tmp_path, target_cp, parallel="2")
+
+    assert len(target_cp.add_calls) <= 3
+    assert report["summary"]["failed"] == 1
+    labels = [item["label"] for item in report["items"]]
+    assert labels == sorted(labels)
+    assert "switch-5" not in labels
+
+
+class _AsyncCP:
+    def __init__(self, cp):
+        self.cp = cp
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    def __getattr__(self, name):
+        method = getattr(self.cp, name)
+        if name not in {"list", "get", "add", "update", "replace"}:
+            return method
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        return call
+
+
+def test_handle_copy_command_async_pages_source_and_applies_in_order(
+    monkeypatch, tmp_path
+):
+    import netloom.core.pagination as pagination
+
+    catalog = _catalog()
+    source_cp = _PagedSourceCP(
+        catalog,
+        [
+            {"id": index, "name": f"switch-{index}", "radius_secret": "s"}
+            for index in range(6)
+        ],
+    )
+    target_cp = _SlowTargetCP(catalog)
+    opened = []
+    monkeypatch.setattr(pagination, "DEFAULT_PAGE_SIZE", 2)
+    monkeypatch.setattr(copymod, "list_profiles", lambda: ["dev", "prod"])
+    monkeypatch.setattr(
+        copymod,
+        "load_settings_for_profile",
+        lambda profile: _make_settings(tmp_path, profile),
+    )
+
+    def build_client(settings, *, mask_secrets=True):
+        return source_cp if settings.server == "dev" else target_cp
+
+    def build_async_client(cp, settings):
+        opened.append(_AsyncCP(cp))
+        return opened[-1]
+
+    plugin = _plugin(build_client, catalog)
+    plugin.build_async_client = build_async_client
+
+    report = copymod.handle_copy_command(
+        {
+            "module": "copy",
+            "copy_module": "policyelements",
+            "copy_service": "network-device",
+            "from": "dev",
+            "to": "prod",
+            "all": True,
+            "async": True,
+        },
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=plugin,
+    )
+
+    assert [call["offset"] for call in source_cp.list_calls] == [0, 2, 4]
+    assert report["summary"]["created"] == 6
+    assert [item["response"]["id"] for item in report["items"]] == [
+        3000 + index for index in range(6)
+    ]
+    assert [wrapper.cp for wrapper in opened] == [source_cp, target_cp]
+    assert all(wrapper.closed for wrapper in opened)
+
+
+def test_handle_copy_command_async_requires_plugin_support(monkeypatch, tmp_path):
+    with pytest.raises(ValueError, match="--async is not supported"):
+        _parallel_copy(
+            monkeypatch, tmp_path, _SlowTargetCP(_catalog()), **{"async": True}
+        )
+
+
+def test_handle_copy_command_rejects_invalid_parallel(monkeypatch, tmp_path):
+    with pytest.raises(ValueError, match="--parallel must be a positive integer"):
+        _parallel_copy(monkeypatch, tmp_path, _SlowTargetCP(_catalog()), parallel="0")
+
+
+def _write_plan(tmp_path, monkeypatch, items):
+    catalog = _catalog()
+    source_cp = _SourceCP(catalog, items)
+    target_cp = _TargetCP(catalog, {})
+    monkeypatch.setattr(copymod, "list_profiles", lambda: ["dev", "prod"])
+    monkeypatch.setattr(
+        copymod,
+        "load_settings_for_profile",
+        lambda profile: _make_settings(tmp_path, profile),
+    )
+
+    def build_client(settings, *, mask_secrets=True):
+        return source_cp if settings.server == "dev" else target_cp
+
+    plan_path = tmp_path / "plan.json"
+    copymod.handle_copy_command(
+        {
+            "module": "copy",
+            "copy_module": "policyelements",
+            "copy_service": "network-device",
+            "from": "dev",
+            "to": "prod",
+            "all": True,
+            "dry_run": True,
+            "decrypt": True,
+            "save_plan": str(plan_path),
+        },
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=_plugin(build_client, catalog),
+    )
+    return plan_path
+
+
+def test_handle_copy_command_applies_saved_plan_with_target_only(
+    monkeypatch, tmp_path, capsys
+):
+    plan_path = _write_plan(
+        tmp_path,
+        monkeypatch,
+        [
+            {"id": 1, "name": "switch-a", "ip_address": "10.0.0.1"},
+            {"id": 2, "name": "switch-b", "tacacs_secret": "t"},
+        ],
+    )
+    plan = json.loads(plan_path.read_text(encoding="utf-8"))
+    plan[1]["payload"]["tacacs_secret"] = ""
+    plan[1]["payload"]["snmpv2_read"] = "public"
+    plan[0]["payload"]["radius_secret"] = "new-secret"
+    plan[0]["reason"] = None
+    plan_path.write_text(json.dumps(plan), encoding="utf-8")
+
+    catalog = _catalog()
+    target_cp = _TargetCP(catalog, {})
+    built = []
+
+    def build_client(settings, *, mask_secrets=True):
+        built.append(settings.server)
+        return target_cp
+
+    report = copymod.handle_copy_command(
+        {
+            "module": "copy",
+            "copy_module": "policyelements",
+            "copy_service": "network-device",
+            "to": "prod",
+            "from_plan": str(plan_path),
+            "allow_masked_secrets": True,
+        },
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=_plugin(build_client, catalog),
+    )
+
+    assert built == ["prod"]
+    assert report["summary"]["created"] == 2
+    assert [call["payload"]["name"] for call in target_cp.add_calls] == [
+        "switch-a",
+        "switch-b",
+    ]
+    assert "tacacs_secret" not in target_cp.add_calls[1]["payload"]
+    assert f"Plan: {plan_path}" in capsys.readouterr().out
+
+
+def test_handle_copy_command_refuses_plan_writes_with_masked_secrets(
+    monkeypatch, tmp_path, caplog
+):
+    plan_path = _write_plan(
+        tmp_path,
+        monkeypatch,
+        [
+            {"id": 1, "name": "switch-a", "radius_secret": "one"},
+            {"id": 2, "name": "switch-b", "radius_secret": "two", "tacacs_secret": "t"},
+        ],
+    )
+    plan = json.loads(plan_path.read_text(encoding="utf-8"))
+    plan[1]["payload"]["radius_secret"] = ""
+    plan_path.write_text(json.dumps(plan), encoding="utf-8")
+    catalog = _catalog()
+    args = {
+        "module": "copy",
+        "copy_module": "policyelements",
+        "copy_service": "network-device",
+        "to": "prod",
+        "from_plan": str(plan_path),
+        "continue_on_error": True,
+    }
+
+    target_cp = _TargetCP(catalog, {})
+    report = copymod.handle_copy_command(
+        args,
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=_plugin(lambda settings, mask_secrets=True: target_cp, catalog),
+    )
+
+    assert [item["status"] for item in report["items"]] == ["success", "failed"]
+    assert "masked secrets (radius_secret)" in report["items"][1]["reason"]
+    assert [call["payload"]["name"] for call in target_cp.add_calls] == ["switch-a"]
+
+    target_cp = _TargetCP(catalog, {})
+    with caplog.at_level("WARNING", logger=copymod.log.name):
+        report = copymod.handle_copy_command(
+            {**args, "allow_masked_secrets": True},
+            settings=_make_settings(tmp_path, "prod"),
+            plugin=_plugin(lambda settings, mask_secrets=True: target_cp, catalog),
+        )
+
+    assert report["summary"]["created"] == 2
+    assert "radius_secret" not in target_cp.add_calls[1]["payload"]
+    assert "switch-b: applying without masked secrets (radius_secret)" in caplog.text
+
+
+def test_handle_copy_command_revalidates_saved_plan_matches(monkeypatch, tmp_path):
+    plan_path = _write_plan(
+        tmp_path,
+        monkeypatch,
+        [
+            {"id": 1, "name": "switch-a", "radius_secret": "one"},
+            {"id": 2, "name": "switch-b", "radius_secret": "two"},
+        ],
+    )
+
+    catalog = _catalog()
+    target_cp = _CountingTargetCP(catalog, {"switch-a": {"id": 9, "name": "switch-a"}})
+
+    report = copymod.handle_copy_command(
+        {
+            "module": "copy",
+            "copy_module": "policyelements",
+            "copy_service": "network-device",
+            "to": "prod",
+            "from_plan": str(plan_path),
+            "revalidate": True,
+            "continue_on_error": True,
+        },
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=_plugin(lambda settings, mask_secrets=True: target_cp, catalog),
+    )
+
+    assert len(target_cp.list_calls) == 1
+    assert [item["status"] for item in report["items"]] == ["failed", "success"]
+    assert report["items"][0]["reason"] == "target changed since the plan was saved"
+    assert [call["payload"]["name"] for call in target_cp.add_calls] == ["switch-b"]
+
+
+def test_handle_copy_command_rejects_plan_with_selectors(monkeypatch, tmp_path):
+    monkeypatch.setattr(copymod, "list_profiles", lambda: ["dev", "prod"])
+    with pytest.raises(ValueError, match="--from-plan cannot be combined"):
+        copymod.handle_copy_command(
+            {
+                "copy_module": "policyelements",
+                "copy_service": "network-device",
+                "to": "prod",
+                "from_plan": str(tmp_path / "plan.json"),
+                "all": True,
+            },
+            settings=_make_settings(tmp_path, "prod"),
+            plugin=_plugin(lambda settings, mask_secrets=True: None, _catalog()),
+        )
+
+
+def test_handle_copy_command_resumes_from_journal(monkeypatch, tmp_path):
+    catalog = _catalog()
+    items = [
+        {"id": index, "name": f"switch-{index}", "radius_secret": "s"}
+        for index in range(3)
+    ]
+    source_cp = _SourceCP(catalog, items)
+    monkeypatch.setattr(copymod, "list_profiles", lambda: ["dev", "prod"])
+    monkeypatch.setattr(
+        copymod,
+        "load_settings_for_profile",
+        lambda profile: _make_settings(tmp_path, profile),
+    )
+    args = {
+        "module": "copy",
+        "copy_module": "policyelements",
+        "copy_service": "network-device",
+        "from": "dev",
+        "to": "prod",
+        "all": True,
+    }
+
+    failing_target = _SlowTargetCP(catalog, fail_name="switch-1")
+    first = copymod.handle_copy_command(
+        args,
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=_plugin(
+            lambda settings, mask_secrets=True: (
+                source_cp if settings.server == "dev" else failing_target
+            ),
+            catalog,
+        ),
+    )
+    journal_path = Path(first["artifacts"]["journal"])
+    assert journal_path.name.endswith("_journal.ndjson")
+    journal = [json.loads(line) for line in journal_path.read_text().splitlines()]
+    assert [(entry["label"], entry["status"]) for entry in journal] == [
+        ("switch-0", "success"),
+        ("switch-1", "failed"),
+    ]
+    assert "payload" not in journal[0]
+
+    target_cp = _TargetCP(catalog, {"switch-0": {"id": 3000, "name": "switch-0"}})
+    resumed = copymod.handle_copy_command(
+        {**args, "resume": str(journal_path)},
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=_plugin(
+            lambda settings, mask_secrets=True: (
+                source_cp if settings.server == "dev" else target_cp
+            ),
+            catalog,
+        ),
+    )
+
+    assert [call["payload"]["name"] for call in target_cp.add_calls] == [
+        "switch-1",
+        "switch-2",
+    ]
+    assert resumed["items"][0]["status"] == "skipped"
+    assert resumed["summary"]["created"] == 2
+    assert resumed["artifacts"]["journal"] == str(journal_path)
+    assert len(journal_path.read_text().splitlines()) == 4
+
+
+def test_handle_copy_command_rejects_missing_journal(monkeypatch, tmp_path):
+    monkeypatch.setattr(copymod, "list_profiles", lambda: ["dev", "prod"])
+    with pytest.raises(ValueError, match="Journal file not found"):
+        copymod.handle_copy_command(
+            {
+                "copy_module": "policyelements",
+                "copy_service": "network-device",
+                "from": "dev",
+                "to": "prod",
+                "all": True,
+                "resume": str(tmp_path / "missing.ndjson"),
+            },
+            settings=_make_settings(tmp_path, "prod"),
+            plugin=_plugin(lambda settings, mask_secrets=True: None, _catalog()),
+        )
+
+
+def _module_catalog(*services):
+    entry = _catalog()["modules"]["policyelements"]["network-device"]
+    return {"modules": {"policyelements": {service: entry for service in services}}}
+
+
+class _ModuleSourceCP(_BaseCP):
+    def __init__(self, catalog, items_by_service):
+        super().__init__(catalog)
+        self.items_by_service = items_by_service
+
+    def list(self, api_catalog, token, args, *, params=None):
+        return {"_embedded": {"items": self.items_by_service.get(args["service"], [])}}
+
+
+class _ModuleTargetCP(_TargetCP):
+    def __init__(self, catalog, *, fail_service=None):
+        super().__init__(catalog)
+        self.fail_service = fail_service
+        self.events = []
+        self.lock = threading.Lock()
+
+    def add(self, api_catalog, token, args, payload):
+        with self.lock:
+            self.events.append(("start", args["service"]))
+        time.sleep(0.02)
+        with self.lock:
+            self.events.append(("end", args["service"]))
+        if args["service"] == self.fail_service:
+            raise requests.HTTPError("rejected")
+        return super().add(api_catalog, token, args, payload)
+
+
+def _module_copy(monkeypatch, tmp_path, target_cp, **extra):
+    catalog = target_cp.catalog
+    source_cp = _ModuleSourceCP(
+        catalog,
+        {
+            "network-device": [
+                {"id": 1, "name": "switch-a", "radius_secret": "abc123"},
+                {"id": 2, "name": "switch-b", "radius_secret": "abc123"},
+            ],
+            "network-device-group": [{"id": 5, "name": "core"}],
+            "role": [{"id": 9, "name": "guest"}],
+        },
+    )
+    built = []
+
+    def build_client(settings, *, mask_secrets=True):
+        built.append(settings.server)
+        return source_cp if settings.server == "dev" else target_cp
+
+    monkeypatch.setattr(copymod, "list_profiles", lambda: ["dev", "prod"])
+    monkeypatch.setattr(
+        copymod,
+        "load_settings_for_profile",
+        lambda profile: _make_settings(tmp_path, profile),
+    )
+    plugin = _plugin(build_client, catalog)
+    plugin.copy_service_dependencies = lambda module: {
+        "network-device-group": {"network-device"},
+        "service": {"role"},
+    }
+    report = copymod.handle_copy_command(
+        {
+            "module": "policyelements",
+            "service": "copy",
+            "copy_module": "policyelements",
+            "from": "dev",
+            "to": "prod",
+            **extra,
+        },
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=plugin,
+    )
+    return report, built
+
+
+def test_handle_copy_command_copies_module_in_dependency_order(
+    monkeypatch, tmp_path, capsys
+):
+    catalog = _module_catalog("network-device-group", "network-device", "role")
+    target_cp = _ModuleTargetCP(catalog)
+
+    report, built = _module_copy(monkeypatch, tmp_path, target_cp)
+
+    assert sorted(built) == ["dev", "prod"]
+    assert [result["service"] for result in report["services"]] == [
+        "network-device",
+        "role",
+        "network-device-group",
+    ]
+    events = target_cp.events
+    group_start = events.index(("start", "network-device-group"))
+    assert (
+        max(
+            index
+            for index, event in enumerate(events)
+            if event == ("end", "network-device")
+        )
+        < group_start
+    )
+    # role has no dependencies and overlaps the network-device writes.
+    assert events.index(("start", "role")) < events.index(("end", "network-device"))
+    assert report["summary"]["services_completed"] == 3
+    assert report["summary"]["created"] == 4
+    assert "Module: policyelements" in capsys.readouterr().out
+
+
+def test_handle_copy_command_module_copy_skips_dependents_of_failed_service(
+    monkeypatch, tmp_path
+):
+    catalog = _module_catalog("network-device-group", "network-device", "role")
+    target_cp = _ModuleTargetCP(catalog, fail_service="network-device")
+
+    report, _ = _module_copy(monkeypatch, tmp_path, target_cp, continue_on_error=True)
+
+    results = {result["service"]: result for result in report["services"]}
+    assert results["network-device"]["status"] == "failed"
+    assert results["role"]["status"] == "completed"
+    assert results["network-device-group"] == {
+        "service": "network-device-group",
+        "status": "skipped",
+        "reason": "dependency failed: network-device",
+    }
+    assert ("start", "network-device-group") not in target_cp.events
+
+
+def test_module_copy_records_unexpected_service_errors_as_failed():
+    def run_service(service):
+        if service == "role":
+            raise KeyError("name")
+        return {"service": service, "status": "completed"}
+
+    results = copymod._run_service_schedule(
+        ["network-device", "role", "role-mapping"],
+        {"role-mapping": {"role"}},
+        run_service,
+        workers=2,
+        continue_on_error=True,
+        block_dependents=True,
+    )
+
+    assert results == [
+        {"service": "network-device", "status": "completed"},
+        {"service": "role", "status": "failed", "reason": "'name'"},
+        {
+            "service": "role-mapping",
+            "status": "skipped",
+            "reason": "dependency failed: role",
+        },
+    ]
+
+
+def test_handle_copy_command_module_copy_rejects_selectors(monkeypatch, tmp_path):
+    monkeypatch.setattr(copymod, "list_profiles", lambda: ["dev", "prod"])
+
+    with pytest.raises(ValueError, match="--name only apply to single-service"):
+        copymod.handle_copy_command(
+            {
+                "copy_module": "policyelements",
+                "from": "dev",
+                "to": "prod",
+                "name": "switch-a",
+            },
+            settings=_make_settings(tmp_path, "prod"),
+            plugin=_plugin(lambda settings, mask_secrets=True: None, _catalog()),
+        )
@@ -0,0 +1,240 @@
+import io
+import logging
+import os
+import sys
+import threading
+import types
+from dataclasses import replace
+
+import pytest
+
+import netloom.cli.daemon as daemon
+from netloom.core.config import AppPaths, Settings
+from netloom.plugins.clearpass.plugin import PLUGIN
+
+
+def _settings(tmp_path):
+    paths = AppPaths(
+        cache_dir=tmp_path / "cache",
+        state_dir=tmp_path / "state",
+        response_dir=tmp_path / "responses",
+        app_log_dir=tmp_path / "logs",
+    ).ensure()
+    return Settings(server="example:443", paths=paths)
+
+
+@pytest.fixture
+def running_daemon(monkeypatch, tmp_path):
+    monkeypatch.setattr(daemon, "load_settings", lambda: _settings(tmp_path))
+    monkeypatch.setattr(daemon, "config_dir", lambda: tmp_path / "config")
+    started = []
+
+    def start(run):
+        server = daemon.NetloomDaemon(tmp_path / "d.sock", run)
+        server.timeout = 0.05
+        server.thread = threading.Thread(target=server.serve, daemon=True)
+        server.thread.start()
+        started.append(server)
+        return server
+
+    yield start
+    for server in started:
+        server.stopping = True
+        server.thread.join(timeout=5)
+
+
+def test_is_forwardable_only_accepts_catalog_actions():
+    assert daemon.is_forwardable(
+        {"module": "identities", "service": "endpoint", "action": "list"}
+    )
+    assert not daemon.is_forwardable({"module": "identities", "service": "endpoint"})
+    assert not daemon.is_forwardable(
+        {"module": "cache", "service": "clear", "action": "list"}
+    )
+    assert not daemon.is_forwardable(
+        {"module": "identities", "service": "endpoint", "action": "copy"}
+    )
+    assert not daemon.is_forwardable(
+        {"module": "identities", "service": "endpoint", "action": "list", "help": True}
+    )
+
+
+def test_forward_to_daemon_without_socket_runs_locally(tmp_path):
+    args = {"module": "identities", "service": "endpoint", "action": "list"}
+
+    assert daemon.forward_to_daemon(args, socket_path=tmp_path / "d.sock") is None
+
+
+def test_forward_to_daemon_streams_output_and_exit_code(
+    monkeypatch, tmp_path, running_daemon
+):
+    calls = []
+    daemon_handler = logging.NullHandler()
+    monkeypatch.setattr(logging.getLogger("netloom"), "handlers", [daemon_handler])
+
+    def run(args, settings, sessions):
+        calls.append((args, settings.server, os.getcwd(), os.environ["NETLOOM_X"]))
+        print("listed 2 items")
+        logging.getLogger("netloom").handlers[:] = [
+            logging.StreamHandler(stream=sys.stderr)
+        ]
+        logging.getLogger("netloom.cli").warning("slow server")
+        raise SystemExit(3)
+
+    server = running_daemon(run)
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+    monkeypatch.setenv("NETLOOM_X", "from-client")
+    args = {"module": "identities", "service": "endpoint", "action": "list"}
+
+    out, err = io.StringIO(), io.StringIO()
+
+    exit_code = daemon.forward_to_daemon(
+        args, socket_path=server.socket_path, stdout=out, stderr=err
+    )
+
+    assert exit_code == 3
+    assert out.getvalue() == "listed 2 items\n"
+    assert "slow server" in err.getvalue()
+    assert calls == [(args, "example:443", str(workdir), "from-client")]
+    assert logging.getLogger("netloom").handlers == [daemon_handler]
+    status = daemon._request_control(server.socket_path, "status")["status"]
+    assert status["commands"] == 1
+    assert status["pid"] == os.getpid()
+
+
+def test_forward_to_daemon_reports_command_errors(tmp_path, running_daemon):
+    def run(args, settings, sessions):
+        raise ValueError("bad filter")
+
+    server = running_daemon(run)
+    args = {"module": "identities", "service": "endpoint", "action": "list"}
+    err = io.StringIO()
+
+    exit_code = daemon.forward_to_daemon(
+        args, socket_path=server.socket_path, stderr=err
+    )
+
+    assert exit_code == 1
+    assert "ValueError: bad filter" in err.getvalue()
+
+
+def test_daemon_closes_log_handlers_opened_by_commands(
+    monkeypatch, tmp_path, running_daemon
+):
+    monkeypatch.setattr(logging.getLogger("netloom"), "handlers", [])
+    opened = []
+
+    def run(args, settings, sessions):
+        handler = logging.FileHandler(tmp_path / "netloom.log", encoding="utf-8")
+        opened.append(handler)
+        logging.getLogger("netloom").handlers[:] = [handler]
+        logging.getLogger("netloom.cli").warning("logged to file")
+
+    server = running_daemon(run)
+    args = {"module": "identities", "service": "endpoint", "action": "list"}
+
+    for _ in range(2):
+        daemon.forward_to_daemon(args, socket_path=server.socket_path)
+
+    assert len(opened) == 2
+    assert all(handler.stream is None for handler in opened)
+    assert logging.getLogger("netloom").handlers == []
+
+
+def test_daemon_keeps_tokens_warm_without_the_disk_cache(
+    monkeypatch, tmp_path, running_daemon
+):
+    settings = replace(_settings(tmp_path), client_id="client", client_secret="s")
+    monkeypatch.setattr(daemon, "load_settings", lambda: settings)
+    logins = []
+
+    class LoginCP:
+        on_unauthorized = None
+
+        def login(self, api_paths, credentials):
+            logins.append(credentials["client_id"])
+            return {"access_token": f"token-{len(logins)}", "expires_in": 3600}
+
+    cp = LoginCP()
+
+    def run(args, settings, sessions):
+        print(sessions.token(PLUGIN, cp, settings))
+
+    server = running_daemon(run)
+    args = {"module": "identities", "service": "endpoint", "action": "list"}
+    outputs = []
+    for _ in range(2):
+        out = io.StringIO()
+        daemon.forward_to_daemon(args, socket_path=server.socket_path, stdout=out)
+        outputs.append(out.getvalue())
+
+    assert settings.token_cache is False
+    assert outputs == ["token-1\n", "token-1\n"]
+    assert logins == ["client"]
+    assert not (tmp_path / "state" / "tokens").exists()
+
+    cp.on_unauthorized("token-1")
+    out = io.StringIO()
+    daemon.forward_to_daemon(args, socket_path=server.socket_path, stdout=out)
+    assert out.getvalue() == "token-2\n"
+
+
+def test_daemon_asks_other_versions_to_run_locally(running_daemon):
+    server = running_daemon(lambda args, settings, sessions: None)
+    sock = daemon._connect(server.socket_path)
+
+    with sock, sock.makefile("rwb") as stream:
+        daemon._send(stream, {"version": 1, "netloom": "0.0.0-other", "args": {}})
+        reply = stream.readline()
+
+    assert reply == b'{"fallback": "version mismatch"}\n'
+    assert server.sessions.commands == 0
+
+
+def test_daemon_stop_removes_socket(running_daemon):
+    server = running_daemon(lambda args, settings, sessions: None)
+
+    reply = daemon._request_control(server.socket_path, "stop")
+    server.thread.join(timeout=5)
+
+    assert reply == {"stopped": os.getpid()}
+    assert not server.socket_path.exists()
+    assert daemon._request_control(server.socket_path, "status") is None
+
+
+def test_warm_sessions_reuse_clients_and_reload_changed_catalogs(tmp_path):
+    settings = _settings(tmp_path)
+    built = []
+    loads = []
+    plugin = types.SimpleNamespace(
+        name="clearpass",
+        build_client=lambda settings, mask_secrets=True: (
+            built.append(mask_secrets) or types.SimpleNamespace(server=settings.server)
+        ),
+    )
+    sessions = daemon.WarmSessions()
+    closed = []
+
+    class PackedModules(dict):
+        def close(self):
+            closed.append(self)
+
+    def load():
+        loads.append(1)
+        return {"modules": PackedModules()}
+
+    first = sessions.client(plugin, settings, mask_secrets=True)
+    assert sessions.client(plugin, settings, mask_secrets=True) is first
+    assert sessions.client(plugin, settings, mask_secrets=False) is not first
+    sessions.catalog(plugin, settings, "visible", load)
+    sessions.catalog(plugin, settings, "visible", load)
+    (settings.paths.cache_dir / "refreshed.json").write_text("{}")
+    os.utime(settings.paths.cache_dir, ns=(0, 1))
+    sessions.catalog(plugin, settings, "visible", load)
+
+    assert built == [True, False]
+    assert len(loads) == 2
+    assert len(closed) == 1
+    assert sessions.describe()["servers"] == ["example:443"]
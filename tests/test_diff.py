@@ -1,5 +1,6 @@
 import json
 import re
+import threading
 import types
 from pathlib import Path
 from uuid import uuid4
@@ -517,3 +518,377 @@ def test_handle_diff_command_rejects_missing_selector(monkeypatch):
             settings=_make_settings(temp_root, "prod"),
             plugin=types.SimpleNamespace(),
         )
+
+
+def test_handle_diff_command_skips_structural_diff_for_identical_items(
+    monkeypatch, tmp_path
+):
+    catalog = _catalog()
+    items = [
+        {"id": 1, "name": "alpha", "tags": ["b", "a"], "nested": {"x": 1}},
+        {"id": 2, "name": "beta", "description": "old"},
+    ]
+    source_cp = _CollectionCP(catalog, items)
+    target_cp = _CollectionCP(
+        catalog,
+        [
+            {"id": 7, "name": "alpha", "nested": {"x": 1}, "tags": ["b", "a"]},
+            {"id": 8, "name": "beta", "description": "new"},
+        ],
+    )
+    compared = []
+    original = diffmod._collect_changed_values
+
+    def tracking_collect(source, target, **kwargs):
+        if not kwargs:
+            compared.append(source.get("name"))
+        return original(source, target, **kwargs)
+
+    monkeypatch.setattr(diffmod, "_collect_changed_values", tracking_collect)
+    _setup_profiles(monkeypatch, tmp_path)
+    report = diffmod.handle_diff_command(
+        {
+            "module": "policyelements",
+            "service": "role",
+            "action": "diff",
+            "from": "lab",
+            "to": "prod",
+            "all": True,
+        },
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=_plugin(_build_client_for(source_cp, target_cp), catalog),
+    )
+
+    assert report["summary"]["same"] == 1
+    assert report["summary"]["different"] == 1
+    assert compared == ["beta"]
+
+
+def test_canonical_digest_ignores_key_order_only():
+    assert diffmod._canonical_digest({"a": 1, "b": [1, 2]}) == (
+        diffmod._canonical_digest({"b": [1, 2], "a": 1})
+    )
+    assert diffmod._canonical_digest({"b": [1, 2]}) != (
+        diffmod._canonical_digest({"b": [2, 1]})
+    )
+    assert diffmod._canonical_digest({1: "a", "b": 2}) is None
+
+
+def _filter(value, fields="", ignore_fields=""):
+    include = diffmod._parse_field_paths(fields, flag_name="--fields")
+    ignore = diffmod._parse_field_paths(ignore_fields, flag_name="--ignore-fields")
+    return diffmod._apply_field_filters(
+        value,
+        diffmod._compile_field_trie(include),
+        diffmod._compile_field_trie(ignore),
+    )
+
+
+def test_apply_field_filters_projects_without_mutating_input():
+    value = {
+        "name": "alpha",
+        "attributes": {"location": "rack-1", "vendor": "Aruba", "tags": ["a"]},
+        "groups": [{"name": "g1", "size": 1}, {"name": "g2", "size": 2}],
+    }
+    original = json.loads(json.dumps(value))
+
+    assert _filter(value, ignore_fields="attributes.vendor,attributes.tags") == {
+        "name": "alpha",
+        "attributes": {"location": "rack-1"},
+        "groups": value["groups"],
+    }
+    assert _filter(value, fields="groups[1].name,name") == {
+        "groups": [{"name": "g2"}],
+        "name": "alpha",
+    }
+    assert _filter(value, fields="attributes", ignore_fields="attributes.tags") == {
+        "attributes": {"location": "rack-1", "vendor": "Aruba"}
+    }
+    assert _filter(value, fields="attributes.vendor", ignore_fields="attributes") == {}
+    assert _filter(value, fields="missing") is None
+    assert _filter(value, fields="missing", ignore_fields="attributes") is None
+    assert _filter(value, ignore_fields="groups[0],groups[1].size") == {
+        "name": "alpha",
+        "attributes": value["attributes"],
+        "groups": [{"name": "g2"}],
+    }
+    assert value == original
+
+
+class _RendezvousCP(_CollectionCP):
+    def __init__(self, catalog, items, barrier):
+        super().__init__(catalog, items)
+        self.barrier = barrier
+
+    def list(self, api_catalog, token, args, *, params=None):
+        # Both sides must be listing at the same time to get past the barrier.
+        self.barrier.wait()
+        return super().list(api_catalog, token, args, params=params)
+
+
+def test_handle_diff_command_connects_and_fetches_both_sides_concurrently(
+    monkeypatch, tmp_path
+):
+    catalog = _catalog()
+    list_barrier = threading.Barrier(2, timeout=5)
+    source_cp = _RendezvousCP(catalog, [{"id": 1, "name": "alpha"}], list_barrier)
+    target_cp = _RendezvousCP(catalog, [{"id": 2, "name": "alpha"}], list_barrier)
+    auth_barrier = threading.Barrier(2, timeout=5)
+
+    def resolve_auth_token(cp, settings):
+        auth_barrier.wait()
+        return f"{settings.server}-token"
+
+    plugin = _plugin(_build_client_for(source_cp, target_cp), catalog)
+    plugin.resolve_auth_token = resolve_auth_token
+    _setup_profiles(monkeypatch, tmp_path)
+    report = diffmod.handle_diff_command(
+        {
+            "module": "policyelements",
+            "service": "role",
+            "action": "diff",
+            "from": "lab",
+            "to": "prod",
+            "all": True,
+        },
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=plugin,
+    )
+
+    assert report["summary"]["same"] == 1
+
+
+def _no_network(settings, *, mask_secrets=True):
+    raise AssertionError(f"unexpected connection to {settings.server}")
+
+
+def test_handle_diff_command_compares_two_snapshots_offline(
+    monkeypatch, tmp_path, capsys
+):
+    source_path = tmp_path / "baseline.json"
+    source_path.write_text(
+        json.dumps(
+            [
+                {"id": 1, "name": "alpha", "description": "same"},
+                {"id": 2, "name": "beta", "description": "old"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    target_path = tmp_path / "nightly.ndjson"
+    target_path.write_text(
+        "\n".join(
+            json.dumps(item)
+            for item in (
+                {"id": 7, "name": "alpha", "description": "same"},
+                {"id": 8, "name": "beta", "description": "new"},
+                {"id": 9, "name": "gamma"},
+            )
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    _setup_profiles(monkeypatch, tmp_path)
+
+    report = diffmod.handle_diff_command(
+        {
+            "module": "policyelements",
+            "service": "role",
+            "action": "diff",
+            "from_snapshot": str(source_path),
+            "to_snapshot": str(target_path),
+        },
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=_plugin(_no_network, _catalog()),
+    )
+
+    assert report["summary"]["same"] == 1
+    assert report["summary"]["different"] == 1
+    assert report["summary"]["only_in_target"] == 1
+    assert report["source_profile"] is None
+    assert Path(report["artifacts"]["report"]).name.startswith(
+        "policyelements_role_baseline_to_nightly_"
+    )
+    assert f"Source snapshot: {source_path}" in capsys.readouterr().out
+
+
+def test_handle_diff_command_mixes_live_source_with_target_snapshot(
+    monkeypatch, tmp_path
+):
+    catalog = _catalog()
+    source_cp = _CollectionCP(
+        catalog,
+        [{"id": 1, "name": "alpha", "description": "live"}],
+    )
+    target_path = tmp_path / "export.json"
+    target_path.write_text(
+        json.dumps(
+            {
+                "_embedded": {
+                    "items": [{"id": 5, "name": "alpha", "description": "saved"}]
+                },
+                "count": 1,
+            }
+        ),
+        encoding="utf-8",
+    )
+    _setup_profiles(monkeypatch, tmp_path)
+
+    report = diffmod.handle_diff_command(
+        {
+            "module": "policyelements",
+            "service": "role",
+            "action": "diff",
+            "from": "lab",
+            "to_snapshot": str(target_path),
+        },
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=_plugin(_build_client_for(source_cp, None), catalog),
+    )
+
+    assert report["source_profile"] == "lab"
+    assert report["target_snapshot"] == str(target_path)
+    different = report["items"][0]
+    assert different["changed_values"]["description"] == {
+        "source": "live",
+        "target": "saved",
+    }
+
+
+def test_handle_diff_command_rejects_profile_and_snapshot_for_one_side(
+    monkeypatch, tmp_path
+):
+    _setup_profiles(monkeypatch, tmp_path)
+    with pytest.raises(ValueError, match="Use either --to or --to-snapshot"):
+        diffmod.handle_diff_command(
+            {
+                "module": "policyelements",
+                "service": "role",
+                "action": "diff",
+                "from": "lab",
+                "to": "prod",
+                "to_snapshot": str(tmp_path / "export.json"),
+            },
+            settings=_make_settings(tmp_path, "prod"),
+            plugin=_plugin(_no_network, _catalog()),
+        )
+
+
+def _module_catalog():
+    catalog = _catalog()
+    services = catalog["modules"]["policyelements"]
+    for name in ("role-mapping", "enforcement-policy"):
+        services[name] = {
+            "actions": {
+                action: {
+                    **definition,
+                    "paths": [
+                        path.replace("role", name) for path in definition["paths"]
+                    ],
+                }
+                for action, definition in services["role"]["actions"].items()
+            }
+        }
+    services["audit"] = {"actions": {"get": services["role"]["actions"]["get"]}}
+    return catalog
+
+
+class _ServiceCP(_CollectionCP):
+    def __init__(self, catalog, items_by_service, fail_service=None):
+        super().__init__(catalog, [])
+        self.items_by_service = items_by_service
+        self.fail_service = fail_service
+
+    def list(self, api_catalog, token, args, *, params=None):
+        if args["service"] == self.fail_service:
+            raise requests.ConnectionError("connection reset")
+        items = self.items_by_service.get(args["service"], [])
+        return {"_embedded": {"items": items}, "count": len(items)}
+
+
+def test_handle_diff_command_diffs_every_service_of_a_module(monkeypatch, tmp_path):
+    catalog = _module_catalog()
+    source_cp = _ServiceCP(
+        catalog,
+        {
+            "role": [{"id": 1, "name": "alpha"}],
+            "role-mapping": [{"id": 2, "name": "map", "rules": ["a"]}],
+        },
+        fail_service="enforcement-policy",
+    )
+    target_cp = _ServiceCP(
+        catalog,
+        {
+            "role": [{"id": 5, "name": "alpha"}, {"id": 6, "name": "beta"}],
+            "role-mapping": [{"id": 7, "name": "map", "rules": ["b"]}],
+        },
+    )
+    authenticated = []
+    plugin = _plugin(_build_client_for(source_cp, target_cp), catalog)
+    plugin.resolve_auth_token = lambda cp, settings: (
+        authenticated.append(settings.server) or f"{settings.server}-token"
+    )
+    _setup_profiles(monkeypatch, tmp_path)
+
+    report = diffmod.handle_diff_command(
+        {
+            "module": "policyelements",
+            "service": "diff",
+            "diff_module": "policyelements",
+            "from": "lab",
+            "to": "prod",
+            "service_workers": "2",
+        },
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=plugin,
+    )
+
+    assert sorted(authenticated) == ["lab", "prod"]
+    results = {result["service"]: result for result in report["services"]}
+    assert list(results) == ["enforcement-policy", "role", "role-mapping"]
+    assert results["enforcement-policy"]["status"] == "failed"
+    assert "connection reset" in results["enforcement-policy"]["reason"]
+    assert results["role"]["summary"]["only_in_target"] == 1
+    assert results["role-mapping"]["summary"]["different"] == 1
+    assert all(result["elapsed_seconds"] >= 0 for result in report["services"])
+    assert report["summary"]["services_failed"] == 1
+    assert report["summary"]["compared"] == 2
+    assert Path(report["artifacts"]["report"]).name.startswith(
+        "policyelements_lab_to_prod_"
+    )
+
+
+def test_handle_diff_command_limits_module_diff_to_requested_services(
+    monkeypatch, tmp_path
+):
+    catalog = _module_catalog()
+    cp = _ServiceCP(catalog, {"role": [{"id": 1, "name": "alpha"}]})
+    _setup_profiles(monkeypatch, tmp_path)
+    args = {
+        "module": "policyelements",
+        "service": "diff",
+        "diff_module": "policyelements",
+        "from": "lab",
+        "to": "prod",
+        "services": "role",
+    }
+
+    report = diffmod.handle_diff_command(
+        args,
+        settings=_make_settings(tmp_path, "prod"),
+        plugin=_plugin(_build_client_for(cp, cp), catalog),
+    )
+    assert [result["service"] for result in report["services"]] == ["role"]
+
+    with pytest.raises(ValueError, match="cannot be listed on both profiles: audit"):
+        diffmod.handle_diff_command(
+            {**args, "services": "role,audit"},
+            settings=_make_settings(tmp_path, "prod"),
+            plugin=_plugin(_build_client_for(cp, cp), catalog),
+        )
+    with pytest.raises(ValueError, match="only apply to single-service diffs"):
+        diffmod.handle_diff_command(
+            {**args, "name": "alpha"},
+            settings=_make_settings(tmp_path, "prod"),
+            plugin=_plugin(_build_client_for(cp, cp), catalog),
+        )
@@ -121,6 +121,15 @@ def test_render_help_includes_server_builtin(monkeypatch):
     assert "  - prod" in text
 
 
+def test_render_help_includes_daemon_builtin(monkeypatch):
+    monkeypatch.setattr(helpmod, "daemon_socket_path", lambda: "/tmp/netloom.sock")
+
+    text = helpmod.render_help({}, {"module": "daemon"}, version="1.9.1")
+
+    assert "netloom daemon start [--idle-timeout=SECONDS]" in text
+    assert "Socket: /tmp/netloom.sock" in text
+
+
 def test_render_help_without_catalog_lists_builtin_modules():
     text = helpmod.render_help({}, {}, version="1.4.7")
 
@@ -187,6 +196,38 @@ def test_render_help_for_copy_action():
     assert "legacy alias: netloom copy <module> <service>" in text
 
 
+def test_render_help_for_module_copy():
+    text = helpmod.render_help(
+        {
+            "modules": {
+                "policyelements": {
+                    "network-device": {
+                        "actions": {
+                            "list": {"method": "GET", "paths": ["/api/network-device"]}
+                        }
+                    }
+                }
+            }
+        },
+        {"module": "policyelements", "service": "copy"},
+        version="1.7.1",
+    )
+
+    assert "usage: netloom <module> copy" in text
+    assert "--service-workers=N" in text
+
+
+def test_render_help_for_module_diff():
+    text = helpmod.render_help(
+        {"modules": {"policyelements": {"role": {"actions": {}}}}},
+        {"module": "policyelements", "service": "diff"},
+        version="1.7.1",
+    )
+
+    assert "usage: netloom <module> diff" in text
+    assert "--services=a,b,c" in text
+
+
 def test_render_help_for_diff_action():
     text = helpmod.render_help(
         {
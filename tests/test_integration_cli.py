@@ -1,6 +1,8 @@
 import sys
 import types
 
+import pytest
+
 import netloom.cli.main as main
 from netloom.core.config import AppPaths, Settings
 
@@ -157,6 +159,27 @@ def test_main_invalid_log_level_exits_early(monkeypatch, tmp_path):
     assert "Invalid log level" in mgr.logger.errors[0]
 
 
+def test_main_forwards_actions_to_running_daemon(monkeypatch):
+    forwarded = []
+    monkeypatch.setattr(
+        main,
+        "load_settings",
+        lambda: (_ for _ in ()).throw(AssertionError("should not load settings")),
+    )
+    monkeypatch.setattr(
+        main, "forward_to_daemon", lambda args: forwarded.append(args) or 2
+    )
+    monkeypatch.setattr(sys, "argv", ["netloom", "identities", "endpoint", "list"])
+
+    with pytest.raises(SystemExit) as exc:
+        main.main()
+
+    assert exc.value.code == 2
+    assert forwarded == [
+        {"module": "identities", "service": "endpoint", "action": "list"}
+    ]
+
+
 def test_main_version_prints_and_exits(monkeypatch, capsys, tmp_path):
     mgr = FakeLogMgr()
     settings = make_settings(tmp_path)
@@ -3,7 +3,12 @@ import json
 import pytest
 
 from netloom.io.files import load_api_token_file, load_payload_file
-from netloom.io.output import _extract_by_path, log_to_file, sanitize_secrets
+from netloom.io.output import (
+    _extract_by_path,
+    log_to_file,
+    sanitize_secrets,
+    write_items_to_file,
+)
 
 
 def test_extract_by_path_happy():
@@ -170,3 +175,48 @@ def test_log_to_file_json_can_leave_secrets_visible(tmp_path):
     value = {"radius_secret": "abc123"}
     log_to_file(value, filename=out, data_format="json", mask_secrets=False)
     assert json.loads(out.read_text(encoding="utf-8"))["radius_secret"] == "abc123"
+
+
+def test_write_items_to_file_json_array_matches_merged_output(tmp_path):
+    items = [{"id": 1, "client_secret": "x"}, {"id": 2, "name": "b"}]
+    streamed = tmp_path / "streamed.json"
+    merged = tmp_path / "merged.json"
+
+    count = write_items_to_file(iter(items), streamed, data_format="json")
+    log_to_file(items, filename=merged, data_format="json")
+
+    assert count == 2
+    assert streamed.read_text(encoding="utf-8") == merged.read_text(encoding="utf-8")
+
+
+def test_write_items_to_file_csv_streams_rows_and_tees_console(tmp_path, capsys):
+    out = tmp_path / "items.csv"
+
+    write_items_to_file(
+        ({"id": index, "name": f"n{index}"} for index in range(3)),
+        out,
+        data_format="csv",
+        csv_fieldnames=["name", "id"],
+        also_console=True,
+        flush_every=1,
+    )
+
+    expected = "name,id\nn0,0\nn1,1\nn2,2\n"
+    assert out.read_text(encoding="utf-8") == expected
+    assert capsys.readouterr().out == expected
+
+
+def test_log_to_file_stream_flushes_each_page_before_the_next(tmp_path):
+    out = tmp_path / "pages.ndjson"
+    seen = []
+
+    def pages():
+        yield [{"id": 1}, {"id": 2}]
+        seen.append(out.read_text(encoding="utf-8"))
+        yield [{"id": 3}]
+
+    result = log_to_file(pages(), filename=out, data_format="ndjson", stream=True)
+
+    assert result is None
+    assert seen == ['{"id": 1}\n{"id": 2}\n']
+    assert out.read_text(encoding="utf-8").splitlines()[-1] == '{"id": 3}'
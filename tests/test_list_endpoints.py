@@ -27,7 +27,7 @@ def _iter_list_endpoints(catalog: dict):
 def catalog():
     cat = load_cached_catalog()
     if not cat:
-        pytest.skip("No api_endpoints_cache.json found. Run: netloom cache update")
+        pytest.skip("No API catalog cache found. Run: netloom cache update")
     return cat
 
 
@@ -233,6 +233,22 @@ def test_parse_cli_copy_command():
     assert args["dry_run"] is True
 
 
+def test_parse_cli_module_copy_command():
+    argv = ["netloom", "policyelements", "copy", "--from=dev", "--to=prod"]
+    args = main.parse_cli(argv)
+    assert args["copy_module"] == "policyelements"
+    assert "copy_service" not in args
+    assert "action" not in args
+
+
+def test_parse_cli_module_diff_command():
+    argv = ["netloom", "policyelements", "diff", "--from=dev", "--to=prod"]
+    args = main.parse_cli(argv)
+    assert args["diff_module"] == "policyelements"
+    assert args["service"] == "diff"
+    assert "action" not in args
+
+
 def test_parse_cli_legacy_copy_alias():
     argv = [
         "netloom",
@@ -0,0 +1,130 @@
+import asyncio
+
+import netloom.core.pagination as pagination
+
+
+def _catalog():
+    return {
+        "modules": {
+            "identities": {
+                "endpoint": {
+                    "actions": {
+                        "list": {
+                            "method": "GET",
+                            "paths": ["/api/endpoint"],
+                            "params": [
+                                "filter",
+                                "sort",
+                                "offset",
+                                "limit",
+                                "calculate_count",
+                            ],
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+
+class _PagedCP:
+    def __init__(self, total, *, with_count=True):
+        self.total = total
+        self.with_count = with_count
+        self.calls = []
+
+    def get_action_definition(self, api_catalog, module, service, action):
+        return api_catalog["modules"][module][service]["actions"][action]
+
+    def list(self, api_catalog, token, args, *, params=None):
+        self.calls.append(dict(params or {}))
+        offset = int((params or {}).get("offset", 0))
+        limit = int((params or {}).get("limit", 25))
+        items = [
+            {"id": item_id}
+            for item_id in range(offset + 1, min(offset + limit, self.total) + 1)
+        ]
+        response = {"_embedded": {"items": items}, "_links": {"next": "..."}}
+        if self.with_count and offset == 0:
+            response["count"] = self.total
+        return response
+
+
+_ARGS = {"module": "identities", "service": "endpoint", "action": "list"}
+
+
+def test_iter_list_items_fetches_pages_lazily(monkeypatch):
+    monkeypatch.setattr(pagination, "DEFAULT_PAGE_SIZE", 2)
+    cp = _PagedCP(5)
+
+    items = pagination.iter_list_items(cp, "tok", _catalog(), dict(_ARGS))
+
+    assert cp.calls == []
+    assert [next(items)["id"], next(items)["id"]] == [1, 2]
+    assert len(cp.calls) == 1
+    assert [item["id"] for item in items] == [3, 4, 5]
+    assert [call["offset"] for call in cp.calls] == [0, 2, 4]
+
+
+def test_iter_list_items_keeps_offset_order_with_workers(monkeypatch):
+    monkeypatch.setattr(pagination, "DEFAULT_PAGE_SIZE", 2)
+    cp = _PagedCP(9)
+
+    items = list(
+        pagination.iter_list_items(cp, "tok", _catalog(), dict(_ARGS), max_workers=3)
+    )
+
+    assert [item["id"] for item in items] == list(range(1, 10))
+    assert sorted(call["offset"] for call in cp.calls) == [0, 2, 4, 6, 8]
+
+
+def test_iter_list_items_falls_back_to_sequential_without_count(monkeypatch):
+    monkeypatch.setattr(pagination, "DEFAULT_PAGE_SIZE", 2)
+    cp = _PagedCP(3, with_count=False)
+
+    items = list(
+        pagination.iter_list_items(cp, "tok", _catalog(), dict(_ARGS), max_workers=4)
+    )
+
+    assert [item["id"] for item in items] == [1, 2, 3]
+    assert [call["offset"] for call in cp.calls] == [0, 2]
+
+
+def test_fetch_all_list_results_merges_pages_without_next_link(monkeypatch):
+    monkeypatch.setattr(pagination, "DEFAULT_PAGE_SIZE", 2)
+    cp = _PagedCP(3)
+
+    result = pagination.fetch_all_list_results(cp, "tok", _catalog(), dict(_ARGS))
+
+    assert [item["id"] for item in result["_embedded"]["items"]] == [1, 2, 3]
+    assert result["count"] == 3
+    assert "next" not in result["_links"]
+
+
+class _AsyncPagedCP(_PagedCP):
+    async def list(self, api_catalog, token, args, *, params=None):
+        return _PagedCP.list(self, api_catalog, token, args, params=params)
+
+
+def test_fetch_list_items_async_schedules_counted_pages_at_once(monkeypatch):
+    monkeypatch.setattr(pagination, "DEFAULT_PAGE_SIZE", 2)
+    cp = _AsyncPagedCP(9)
+
+    items = asyncio.run(
+        pagination.fetch_list_items_async(cp, "tok", _catalog(), dict(_ARGS))
+    )
+
+    assert [item["id"] for item in items] == list(range(1, 10))
+    assert [call["offset"] for call in cp.calls] == [0, 2, 4, 6, 8]
+
+
+def test_fetch_list_items_async_walks_pages_without_count(monkeypatch):
+    monkeypatch.setattr(pagination, "DEFAULT_PAGE_SIZE", 2)
+    cp = _AsyncPagedCP(5, with_count=False)
+
+    items = asyncio.run(
+        pagination.fetch_list_items_async(cp, "tok", _catalog(), dict(_ARGS))
+    )
+
+    assert [item["id"] for item in items] == [1, 2, 3, 4, 5]
+    assert [call["offset"] for call in cp.calls] == [0, 2, 4]
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import netloom.cli.main as main
 from netloom.core import config
-from netloom.core.config import AppPaths, load_settings
+from netloom.core.config import AppPaths, load_settings, load_settings_for_profile
 
 
 class _FakeLogMgr:
@@ -172,6 +172,7 @@ def test_load_settings_uses_defaults_as_profile_fallback(monkeypatch, tmp_path):
     assert settings.https_prefix == "https://fallback/"
     assert settings.verify_ssl is True
     assert settings.timeout == 42
+    assert settings.token_cache is False
 
 
 def test_load_settings_without_active_plugin(monkeypatch, tmp_path):
@@ -198,6 +199,50 @@ def test_load_settings_prefers_process_environment(monkeypatch, tmp_path):
     assert settings.client_secret == "prod-secret"
 
 
+def test_load_settings_reads_page_workers_from_profile(monkeypatch, tmp_path):
+    config_dir = _configure_runtime(monkeypatch, tmp_path)
+    _write_profiles(config_dir)
+    with _profile_path(config_dir, "prod").open("a", encoding="utf-8") as handle:
+        handle.write("NETLOOM_PAGE_WORKERS=6\n")
+
+    assert load_settings().page_workers == 6
+    assert load_settings_for_profile("dev").page_workers == 1
+
+
+def test_load_settings_reads_transport_tuning_from_profile(monkeypatch, tmp_path):
+    config_dir = _configure_runtime(monkeypatch, tmp_path)
+    _write_profiles(config_dir)
+    with _profile_path(config_dir, "prod").open("a", encoding="utf-8") as handle:
+        handle.write("NETLOOM_POOL_SIZE=48\nNETLOOM_KEEP_ALIVE=false\n")
+        handle.write("NETLOOM_TCP_KEEPALIVE=30\n")
+        handle.write("NETLOOM_RETRIES=5\nNETLOOM_RETRY_BACKOFF=0.25\n")
+        handle.write("NETLOOM_RATE_LIMIT=2.5\nNETLOOM_RATE_BURST=5\n")
+        handle.write("NETLOOM_TOKEN_CACHE=true\nNETLOOM_TOKEN_REFRESH_MARGIN=300\n")
+
+    settings = load_settings()
+    assert (settings.retries, settings.retry_backoff) == (5, 0.25)
+    assert settings.retry_writes is False
+    assert (settings.rate_limit, settings.rate_burst) == (2.5, 5)
+    assert (settings.token_cache, settings.token_refresh_margin) == (True, 300)
+    assert settings.pool_size == 48
+    assert settings.keep_alive is False
+    assert settings.tcp_keepalive == 30
+    dev = load_settings_for_profile("dev")
+    assert (dev.pool_size, dev.keep_alive, dev.tcp_keepalive) == (16, True, 0)
+
+
+def test_load_settings_reads_catalog_revalidate_flag_from_profile(
+    monkeypatch, tmp_path
+):
+    config_dir = _configure_runtime(monkeypatch, tmp_path)
+    _write_profiles(config_dir)
+    with _profile_path(config_dir, "prod").open("a", encoding="utf-8") as handle:
+        handle.write("NETLOOM_CATALOG_STALE_WHILE_REVALIDATE=true\n")
+
+    assert load_settings().catalog_stale_while_revalidate is True
+    assert load_settings_for_profile("dev").catalog_stale_while_revalidate is False
+
+
 def test_load_settings_uses_out_dir_from_profile_files(monkeypatch, tmp_path):
     config_dir = _configure_runtime(monkeypatch, tmp_path)
     _write_global_config(config_dir)